@@ -0,0 +1,116 @@
+import argparse
+import os.path as op
+import time
+from datetime import datetime
+
+from flask import Flask
+from flask_admin import Admin
+from flask_admin.contrib.sqla import ModelView
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func
+from sqlalchemy import insert
+
+app = Flask(__name__)
+app.config["SECRET_KEY"] = "123456790"
+app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///" + op.join(
+    op.dirname(op.realpath(__file__)), "benchmark.sqlite"
+)
+
+db = SQLAlchemy(app)
+
+
+class Order(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    customer = db.Column(db.String(64), nullable=False)
+    email = db.Column(db.String(120), nullable=False)
+    quantity = db.Column(db.Integer, nullable=False)
+    price = db.Column(db.Float, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False)
+
+
+class OrderView(ModelView):
+    can_export = True
+    export_max_rows = 0
+
+
+class PerRowOrderView(OrderView):
+    # Send every row to the WSGI server separately
+    export_csv_chunk_size = 1
+
+
+class GzipOrderView(OrderView):
+    export_gzip = True
+
+
+class ParquetOrderView(OrderView):
+    export_types = ["parquet"]
+
+
+admin = Admin(app, name="Export benchmark")
+admin.add_view(PerRowOrderView(Order, db, endpoint="per_row"))
+admin.add_view(OrderView(Order, db, endpoint="chunked"))
+admin.add_view(GzipOrderView(Order, db, endpoint="gzip"))
+admin.add_view(ParquetOrderView(Order, db, endpoint="parquet"))
+
+
+def build_db(rows, batch_size=10000):
+    db.drop_all()
+    db.create_all()
+
+    created_at = datetime.now()
+    for start in range(0, rows, batch_size):
+        db.session.execute(
+            insert(Order),
+            [
+                dict(
+                    customer=f"Customer {i}",
+                    email=f"customer{i}@example.com",
+                    quantity=i % 10 + 1,
+                    price=i % 1000 / 10,
+                    created_at=created_at,
+                )
+                for i in range(start, min(start + batch_size, rows))
+            ],
+        )
+    db.session.commit()
+
+
+def measure(client, endpoint, export_type, headers=None):
+    start = time.perf_counter()
+    rv = client.get(f"/admin/{endpoint}/export/{export_type}/", headers=headers)
+
+    size = 0
+    chunks = 0
+    for chunk in rv.response:
+        size += len(chunk)
+        chunks += 1
+    rv.close()
+
+    return time.perf_counter() - start, size, chunks
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the CSV export.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+
+        if db.session.scalar(db.select(func.count()).select_from(Order)) != args.rows:
+            print(f"Building a table with {args.rows} rows...")
+            build_db(args.rows)
+
+    client = app.test_client()
+
+    for endpoint, export_type, headers in [
+        ("per_row", "csv", None),
+        ("chunked", "csv", None),
+        ("gzip", "csv", {"Accept-Encoding": "gzip"}),
+        ("parquet", "parquet", None),
+    ]:
+        elapsed, size, chunks = measure(client, endpoint, export_type, headers)
+        print(
+            f"{endpoint:>8}: {args.rows / elapsed:>10.0f} rows/sec, "
+            f"{elapsed:.2f}s, {size / 2**20:.1f} MiB in {chunks} chunks"
+        )
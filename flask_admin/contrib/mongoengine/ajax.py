@@ -12,6 +12,14 @@ from flask_admin._types import T_MONGO_ENGINE_DOCUMENT
 from flask_admin.model.ajax import AjaxModelLoader
 from flask_admin.model.ajax import DEFAULT_PAGE_SIZE
 
+# query operators of the search modes
+SEARCH_OPERATORS = {
+    "contains": "__icontains",
+    "exact": "",
+    "prefix": "__startswith",
+    "iprefix": "__istartswith",
+}
+
 
 class QueryAjaxModelLoader(AjaxModelLoader):
     def __init__(self, name: str, model: Document, **options: t.Any) -> None:
@@ -20,11 +28,22 @@ class QueryAjaxModelLoader(AjaxModelLoader):
 
         :param fields:
             Fields to run query against
+        :param search_mode:
+            How the term is matched against the fields: ``contains``
+            (default), ``exact``, ``prefix``, ``iprefix`` or ``fulltext``,
+            which uses the text index of the collection
         """
         super().__init__(name, options)
 
         self.model = model
         self.fields = options.get("fields")
+        self.search_mode = options.get("search_mode", "contains")
+
+        if self.search_mode not in SEARCH_OPERATORS and self.search_mode != "fulltext":
+            raise ValueError(
+                f"Unsupported search mode {self.search_mode!r} for"
+                f" {model}.{self.name}"
+            )
 
         self._cached_fields = self._process_fields()
 
@@ -69,21 +88,36 @@ class QueryAjaxModelLoader(AjaxModelLoader):
     def get_one(self, pk: t.Any) -> Document | None:
         return self.model.objects.filter(pk=pk).first()
 
+    def get_many(self, pks: t.Iterable[t.Any]) -> list[Document]:
+        pks = list(pks)
+
+        if not pks:
+            return []
+
+        # unlike `in_bulk`, `pk__in` converts string ids to ObjectId
+        return list(self.model.objects.filter(pk__in=pks))
+
     def get_list(
-        self, query: QuerySet, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE
+        self, term: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE
     ) -> QuerySet:
-        if len(query) > 0:
-            criteria = None
+        query = self.model.objects
 
-            for field in self._cached_fields:
-                flt = {f"{field.name}__icontains": query}
+        if len(term) > 0:
+            if self.search_mode == "fulltext":
+                query = query.search_text(term)
+            else:
+                operator = SEARCH_OPERATORS[self.search_mode]
+                criteria = None
 
-                if not criteria:
-                    criteria = mongoengine.Q(**flt)
-                else:
-                    criteria |= mongoengine.Q(**flt)
+                for field in self._cached_fields:
+                    flt = {f"{field.name}{operator}": term}
+
+                    if not criteria:
+                        criteria = mongoengine.Q(**flt)
+                    else:
+                        criteria |= mongoengine.Q(**flt)
 
-            query = query.filter(criteria)
+                query = query.filter(criteria)
 
         if offset:
             query = query.skip(offset)
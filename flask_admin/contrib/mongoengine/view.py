@@ -549,6 +549,7 @@ class ModelView(BaseModelView):
         filters: t.Sequence[tuple[int, str, str]] | None,
         execute: bool = True,
         page_size: int | None = None,
+        with_count: bool = True,
     ) -> tuple[int | None, Document]:
         """
         Get list of objects from MongoEngine
@@ -569,6 +570,9 @@ class ModelView(BaseModelView):
             Number of results. Defaults to ModelView's page_size. Can be
             overriden to change the page_size limit. Removing the page_size
             limit requires setting page_size to 0 or False.
+        :param with_count:
+            Count the matching documents. If `False`, the returned count is
+            `None` and no count query is run.
         """
         query = self.get_query()
 
@@ -583,7 +587,11 @@ class ModelView(BaseModelView):
             query = self._search(query, search)
 
         # Get count
-        count = query.count() if not self.simple_list_pager else None
+        count = (
+            self.get_cached_count(search, filters, query.count)
+            if with_count and not self.simple_list_pager
+            else None
+        )
 
         # Sorting
         if sort_column:
@@ -611,6 +619,47 @@ class ModelView(BaseModelView):
 
         return count, query
 
+    def get_list_iter(  # type: ignore[override]
+        self,
+        sort_column: str,
+        sort_desc: bool,
+        search: str | None,
+        filters: t.Sequence[tuple[int, str, str]] | None,
+        page_size: int | None = None,
+        batch_size: int = 1000,
+    ) -> t.Iterator[Document]:
+        """
+        Iterate over the documents without loading them all into memory.
+
+        The queryset is not cached, so documents are released once they
+        have been consumed.
+
+        :param sort_column:
+            Sort column
+        :param sort_desc:
+            Sort descending
+        :param search:
+            Search criteria
+        :param filters:
+            List of applied filters
+        :param page_size:
+            Maximum number of documents. Set to 0 or False to iterate over
+            all documents.
+        :param batch_size:
+            Number of documents returned by the server in each batch.
+        """
+        _, query = self.get_list(
+            0,
+            sort_column,
+            sort_desc,
+            search,
+            filters,
+            execute=False,
+            page_size=page_size,
+            with_count=False,
+        )
+        return query.no_cache().batch_size(batch_size)
+
     def get_one(self, id: t.Any) -> t.Any | None:
         """
         Return a single model instance by its ID
@@ -651,7 +700,7 @@ class ModelView(BaseModelView):
 
             return False
         else:
-            self.after_model_change(form, model, True)
+            self._after_model_change(form, model, True)
 
         return model
 
@@ -680,7 +729,7 @@ class ModelView(BaseModelView):
 
             return False
         else:
-            self.after_model_change(form, model, False)
+            self._after_model_change(form, model, False)
 
         return True
 
@@ -706,7 +755,7 @@ class ModelView(BaseModelView):
 
             return False
         else:
-            self.after_model_delete(model)
+            self._after_model_delete(model)
 
         return True
 
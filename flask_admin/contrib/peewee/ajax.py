@@ -57,6 +57,14 @@ class QueryAjaxModelLoader(AjaxModelLoader):
     def get_one(self, pk: t.Any) -> t.Any:
         return self.model.get(**{self.pk: pk})
 
+    def get_many(self, pks: t.Iterable[t.Any]) -> list[t.Any]:
+        pks = list(pks)
+
+        if not pks:
+            return []
+
+        return list(self.model.select().where(getattr(self.model, self.pk) << pks))
+
     def get_list(
         self, term: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE
     ) -> list[t.Any]:
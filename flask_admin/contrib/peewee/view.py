@@ -439,6 +439,7 @@ class ModelView(BaseModelView):
         filters: t.Sequence[T_FILTER] | None,
         execute: bool = True,
         page_size: int | None = None,
+        with_count: bool = True,
     ) -> tuple[int | None, list[ModelBase] | ModelSelect]:
         """
         Return records from the database.
@@ -459,6 +460,9 @@ class ModelView(BaseModelView):
             Number of results. Defaults to ModelView's page_size. Can be
             overriden to change the page_size limit. Removing the page_size
             limit requires setting page_size to 0 or False.
+        :param with_count:
+            Count the matching rows. If `False`, the returned count is
+            `None` and no count query is run.
         """
 
         query = self.get_query()
@@ -497,7 +501,11 @@ class ModelView(BaseModelView):
                 query = f.apply(query, f.clean(value))
 
         # Get count
-        count = query.count() if not self.simple_list_pager else None
+        count = (
+            self.get_cached_count(search, filters, query.count)
+            if with_count and not self.simple_list_pager
+            else None
+        )
 
         # Apply sorting
         order: list[tuple[str, bool]] | None
@@ -525,6 +533,46 @@ class ModelView(BaseModelView):
 
         return count, query
 
+    def get_list_iter(  # type: ignore[override]
+        self,
+        sort_column: str | None,
+        sort_desc: bool | None,
+        search: str | None,
+        filters: t.Sequence[T_FILTER] | None,
+        page_size: int | None = None,
+        batch_size: int = 1000,
+    ) -> t.Iterator[T_PEEWEE_MODEL]:
+        """
+        Iterate over the records without loading them all into memory.
+
+        Uses `Select.iterator`, so rows are not cached on the query.
+
+        :param sort_column:
+            Sort column name
+        :param sort_desc:
+            Descending or ascending sort
+        :param search:
+            Search query
+        :param filters:
+            List of filter tuples
+        :param page_size:
+            Maximum number of records. Set to 0 or False to iterate over
+            all records.
+        :param batch_size:
+            Unused, rows are fetched by the database cursor.
+        """
+        _, query = self.get_list(
+            0,
+            sort_column,
+            sort_desc,
+            search,
+            filters,
+            execute=False,
+            page_size=page_size,
+            with_count=False,
+        )
+        return query.iterator()  # type: ignore[union-attr]
+
     def get_one(self, id: t.Any) -> t.Any:
         if self.model._meta.composite_key:
             kwargs = dict(
@@ -537,6 +585,13 @@ class ModelView(BaseModelView):
         except DoesNotExist:
             return None
 
+    def get_many(self, ids: t.Sequence[t.Any]) -> list[t.Any]:
+        if not ids or self.model._meta.composite_key:
+            return super().get_many(ids)
+
+        model_pk = getattr(self.model, self._primary_key)
+        return list(self.model.select().where(model_pk << list(ids)))
+
     def create_model(self, form: Form) -> t.Union[bool, T_PEEWEE_MODEL]:
         try:
             model = self.model()
@@ -556,7 +611,7 @@ class ModelView(BaseModelView):
 
             return False
         else:
-            self.after_model_change(form, model, True)
+            self._after_model_change(form, model, True)
 
         return model
 
@@ -578,7 +633,34 @@ class ModelView(BaseModelView):
 
             return False
         else:
-            self.after_model_change(form, model, False)
+            self._after_model_change(form, model, False)
+
+        return True
+
+    def update_models(  # type: ignore[override]
+        self, updates: list[tuple[Form, T_PEEWEE_MODEL]]
+    ) -> bool:
+        try:
+            with self.model._meta.database.atomic():
+                for form, model in updates:
+                    form.populate_obj(model)
+                    self._on_model_change(form, model, False)
+                    model.save()
+
+                    # For peewee have to save inline forms after model was saved
+                    save_inline(form, model)
+        except Exception as ex:
+            if not self.handle_view_exception(ex):
+                flash(
+                    gettext("Failed to update record. %(error)s", error=str(ex)),
+                    "error",
+                )
+                log.exception("Failed to update record.")
+
+            return False
+        else:
+            for form, model in updates:
+                self._after_model_change(form, model, False)
 
         return True
 
@@ -596,7 +678,7 @@ class ModelView(BaseModelView):
 
             return False
         else:
-            self.after_model_delete(model)
+            self._after_model_delete(model)
 
         return True
 
@@ -629,6 +711,8 @@ class ModelView(BaseModelView):
                     m.delete_instance(recursive=True)
                     count += 1
 
+            self.invalidate_count_cache()
+
             flash(
                 ngettext(
                     "Record was successfully deleted.",
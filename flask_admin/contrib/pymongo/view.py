@@ -243,6 +243,7 @@ class ModelView(BaseModelView):
         filters: t.Sequence[T_FILTER] | None,
         execute: bool = True,
         page_size: int | None = None,
+        with_count: bool = True,
     ) -> tuple[int | None, list[t.Any] | T_PYMONGO_CURSOR]:
         """
         Get list of objects from MongoEngine
@@ -263,6 +264,9 @@ class ModelView(BaseModelView):
             Number of results. Defaults to ModelView's page_size. Can be
             overriden to change the page_size limit. Removing the page_size
             limit requires setting page_size to 0 or False.
+        :param with_count:
+            Count the matching documents. If `False`, the returned count is
+            `None` and no count query is run.
         """
         query = self.get_query()
 
@@ -285,7 +289,13 @@ class ModelView(BaseModelView):
             query = self._search(query, search)
 
         # Get count
-        count = self.coll.count_documents(query) if not self.simple_list_pager else None
+        count = (
+            self.get_cached_count(
+                search, filters, lambda: self.coll.count_documents(query)
+            )
+            if with_count and not self.simple_list_pager
+            else None
+        )
 
         # Sorting
         sort_by = None
@@ -319,6 +329,44 @@ class ModelView(BaseModelView):
 
         return count, results
 
+    def get_list_iter(  # type: ignore[override]
+        self,
+        sort_column: str | None,
+        sort_desc: bool,
+        search: str | None,
+        filters: t.Sequence[T_FILTER] | None,
+        page_size: int | None = None,
+        batch_size: int = 1000,
+    ) -> t.Iterator[t.Any]:
+        """
+        Iterate over the documents without loading them all into memory.
+
+        :param sort_column:
+            Sort column
+        :param sort_desc:
+            Sort descending
+        :param search:
+            Search criteria
+        :param filters:
+            List of applied fiters
+        :param page_size:
+            Maximum number of documents. Set to 0 or False to iterate over
+            all documents.
+        :param batch_size:
+            Number of documents returned by the server in each batch.
+        """
+        _, results = self.get_list(
+            0,
+            sort_column,
+            sort_desc,
+            search,
+            filters,
+            execute=False,
+            page_size=page_size,
+            with_count=False,
+        )
+        return results.batch_size(batch_size)  # type: ignore[union-attr]
+
     def _get_valid_id(
         self, id: str | ObjectId | bytes | None
     ) -> ObjectId | str | bytes | None:
@@ -336,6 +384,17 @@ class ModelView(BaseModelView):
         """
         return self.coll.find_one({"_id": self._get_valid_id(id)})
 
+    def get_many(self, ids: t.Sequence[t.Any]) -> list[t.Any]:
+        """
+        Return the documents matching a list of IDs with a single ``$in``
+        query.
+
+        :param ids:
+            List of model IDs
+        """
+        ids = [self._get_valid_id(id) for id in ids]
+        return list(self.coll.find({"_id": {"$in": ids}}))
+
     def edit_form(self, obj: t.Any) -> Form:  # type: ignore[override]
         """
         Create edit form from the MongoDB document
@@ -358,7 +417,7 @@ class ModelView(BaseModelView):
             log.exception("Failed to create record.")
             return False
         else:
-            self.after_model_change(form, model, True)
+            self._after_model_change(form, model, True)
 
         return model
 
@@ -382,7 +441,7 @@ class ModelView(BaseModelView):
             log.exception("Failed to update record.")
             return False
         else:
-            self.after_model_change(form, model, False)
+            self._after_model_change(form, model, False)
 
         return True
 
@@ -406,7 +465,7 @@ class ModelView(BaseModelView):
             log.exception("Failed to delete record.")
             return False
         else:
-            self.after_model_delete(model)
+            self._after_model_delete(model)
 
         return True
 
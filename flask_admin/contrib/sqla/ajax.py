@@ -2,6 +2,7 @@ import typing as t
 
 from sqlalchemy import and_
 from sqlalchemy import cast
+from sqlalchemy import false
 from sqlalchemy import or_
 from sqlalchemy import text
 from sqlalchemy.types import String
@@ -16,9 +17,11 @@ from ._compat import _get_deprecated_session
 from ._types import T_SESSION_OR_DB
 from ._types import T_SQLALCHEMY_QUERY
 from .tools import get_primary_key
+from .tools import get_search_criterion
 from .tools import has_multiple_pks
 from .tools import is_association_proxy
 from .tools import is_relationship
+from .tools import SEARCH_MODES
 
 
 class QueryAjaxModelLoader(AjaxModelLoader):
@@ -36,6 +39,10 @@ class QueryAjaxModelLoader(AjaxModelLoader):
             Fields to run query against
         :param filters:
             Additional filters to apply to the loader
+        :param search_mode:
+            How the term is matched against the fields, one of the modes of
+            :attr:`~flask_admin.contrib.sqla.ModelView.column_search_modes`.
+            Defaults to ``contains``, which can not use an index.
         """
         super().__init__(name, options)
 
@@ -44,6 +51,13 @@ class QueryAjaxModelLoader(AjaxModelLoader):
         self.fields = options.get("fields")
         self.order_by = options.get("order_by")
         self.filters = options.get("filters")
+        self.search_mode = options.get("search_mode", "contains")
+
+        if self.search_mode not in SEARCH_MODES:
+            raise ValueError(
+                f"Unsupported search mode {self.search_mode!r} for"
+                f" {model}.{self.name}"
+            )
 
         if not self.fields:
             raise ValueError(
@@ -93,19 +107,41 @@ class QueryAjaxModelLoader(AjaxModelLoader):
         with session.no_autoflush:
             return session.get(self.model, pk)
 
+    def get_many(self, pks: t.Iterable[t.Any]) -> list[t.Any]:
+        pks = list(pks)
+
+        if not pks:
+            return []
+
+        session = _get_deprecated_session(self.session)
+        # prevent autoflush from occuring during populate_obj
+        with session.no_autoflush:
+            query = session.query(self.model)
+            return query.filter(getattr(self.model, self.pk).in_(pks)).all()
+
+    def _get_criterion(self, field: t.Any, term: str) -> t.Any | None:
+        if self.search_mode != "contains":
+            return get_search_criterion(field, self.search_mode, term)
+
+        # no type casting to string if a ColumnAssociationProxyInstance is given
+        if is_association_proxy(field):
+            return field.ilike(f"%{term}%")
+
+        return cast(field, String).ilike(f"%{term}%")
+
     def get_list(
         self, term: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE
     ) -> t.Any:
         query = self.get_query()
 
-        # no type casting to string if a ColumnAssociationProxyInstance is given
-        filters: t.Any = (
-            field.ilike(f"%{term}%")
-            if is_association_proxy(field)
-            else cast(field, String).ilike(f"%{term}%")
-            for field in self._cached_fields
-        )
-        query = query.filter(or_(*filters))
+        filters: t.Any = [
+            criterion
+            for criterion in (
+                self._get_criterion(field, term) for field in self._cached_fields
+            )
+            if criterion is not None
+        ]
+        query = query.filter(or_(*filters) if filters else false())
 
         if self.filters:
             filters = [
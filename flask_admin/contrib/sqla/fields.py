@@ -2,13 +2,24 @@
 Useful form fields for use with SQLAlchemy ORM.
 """
 
+import logging
 import operator
+import time
 import typing as t
 
+from flask import g
+from flask import has_request_context
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.base import instance_state
 from sqlalchemy.orm.util import identity_key
 from wtforms import form
 from wtforms.fields import SelectFieldBase
 from wtforms.fields import StringField
+from wtforms.fields.core import UnboundField
 from wtforms.utils import unset_value
 from wtforms.utils import UnsetValue
 from wtforms.validators import ValidationError
@@ -33,6 +44,10 @@ from ...model.form import InlineBaseFormAdmin
 from ._compat import _get_deprecated_session
 from ._types import T_SESSION_OR_DB
 from .tools import get_primary_key
+from .tools import has_multiple_pks
+
+# Set up logger
+log = logging.getLogger("flask-admin.sqla")
 
 
 class QuerySelectField(SelectFieldBase):
@@ -101,39 +116,170 @@ class QuerySelectField(SelectFieldBase):
         self.allow_blank = allow_blank
         self.blank_text = blank_text
         self.query = None
+        self._factory_query: t.Any = None
         self._object_list: list[tuple[str, t.Any]] | None = None
+        self._object_dict: dict[str, t.Any] | None = None
+        self._data_valid = False
 
     def _get_data(self) -> t.Any:
         if self._formdata is not None:
-            for pk, obj in self._get_object_list():
-                if pk == self._formdata:
-                    self._set_data(obj)
-                    break
+            pk = t.cast(str, self._formdata)
+            obj = self._get_objects([pk]).get(pk)
+
+            if obj is not None:
+                self._set_data(obj)
+                self._data_valid = True
         return self._data
 
     def _set_data(self, data: t.Any) -> None:
         self._data = data
-        self._formdata: set[str] | str | None = None
+        self._formdata: list[str] | str | None = None
+        self._data_valid = False
 
     data = property(_get_data, _set_data)
 
+    def _get_query(self) -> t.Any:
+        if self.query:
+            return self.query
+
+        if self._factory_query is None:
+            self._factory_query = self.query_factory()
+
+        return self._factory_query
+
+    def _get_choice_key(self, query: t.Any) -> tuple[t.Any, ...] | None:
+        key = get_query_cache_key(query)
+
+        if key is None:
+            return None
+
+        return (self.get_pk, *key)
+
+    def _get_shared_object_list(self) -> list[tuple[str, t.Any]] | None:
+        """
+        Return the options loaded by another field with the same query
+        during the current request.
+        """
+        cache = get_choice_cache()
+
+        if cache is None:
+            return None
+
+        key = self._get_choice_key(self._get_query())
+        return None if key is None else cache.get(key)
+
     def _get_object_list(self) -> list[tuple[str, t.Any]]:
         if self._object_list is None:
-            query = self.query or self.query_factory()
-            get_pk = self.get_pk
-            self._object_list = [(text_type(get_pk(obj)), obj) for obj in query]
+            query = self._get_query()
+            cache = get_choice_cache()
+            key = self._get_choice_key(query) if cache is not None else None
+
+            if cache is not None and key in cache:
+                self._object_list = cache[key]
+            else:
+                get_pk = self.get_pk
+                self._object_list = [(text_type(get_pk(obj)), obj) for obj in query]
+
+                if cache is not None and key is not None:
+                    cache[key] = self._object_list
         return self._object_list
 
+    def _get_object_dict(self) -> dict[str, t.Any]:
+        if self._object_dict is None:
+            self._object_dict = dict(self._get_object_list())
+        return self._object_dict
+
+    def _get_pk_query(self, pks: t.Collection[str]) -> t.Any | None:
+        """
+        Return the query of the field filtered to `pks`, or `None` if the
+        primary key of the options can not be filtered on.
+        """
+        if self.get_pk is not get_pk_from_identity:
+            return None
+
+        query = self._get_query()
+
+        if not isinstance(query, Query):
+            return None
+
+        model: t.Any = query.column_descriptions[0]["entity"]
+
+        if model is None or has_multiple_pks(model):
+            return None
+
+        pk = getattr(model, t.cast(str, get_primary_key(model)))
+
+        try:
+            # submitted values are strings, bind them as the column type
+            python_type = pk.type.python_type
+            values = [python_type(value) for value in pks]
+        except (NotImplementedError, TypeError, ValueError):
+            # the options indexed by primary key are used instead
+            return None
+
+        try:
+            return query.filter(pk.in_(values))
+        except InvalidRequestError:
+            # LIMIT or OFFSET applied
+            return None
+
+    def _get_shared_objects(self) -> dict[str, t.Any] | None:
+        """
+        Return the options loaded by primary key by fields with the same
+        query during the current request.
+        """
+        cache = get_choice_cache()
+
+        if cache is None:
+            return None
+
+        key = self._get_choice_key(self._get_query())
+        return None if key is None else cache.setdefault(("objects", *key), {})
+
+    def _query_objects(self, query: t.Any) -> dict[str, t.Any]:
+        return {text_type(self.get_pk(obj)): obj for obj in query}
+
+    def _get_objects(self, pks: t.Collection[str]) -> dict[str, t.Any]:
+        """
+        Return the options matching `pks`, indexed by primary key. Unless
+        all options are already loaded, only `pks` are queried.
+        """
+        if self._object_list is None:
+            self._object_list = self._get_shared_object_list()
+
+        query = self._get_pk_query(pks) if self._object_list is None else None
+
+        if query is not None:
+            shared = self._get_shared_objects()
+
+            if shared is None:
+                return self._query_objects(query)
+
+            missing = [pk for pk in pks if pk not in shared]
+
+            if missing:
+                if len(missing) < len(pks):
+                    query = self._get_pk_query(missing)
+
+                shared.update(self._query_objects(query))
+
+            return {pk: shared[pk] for pk in pks if pk in shared}
+
+        objects = self._get_object_dict()
+        return {pk: objects[pk] for pk in pks if pk in objects}
+
+    def _is_valid_choice(self, obj: t.Any) -> bool:
+        pk = text_type(self.get_pk(obj))
+        return self._get_objects([pk]).get(pk) == obj
+
     def iter_choices(self) -> t.Iterator[T_ITER_CHOICES]:  # type: ignore[override]
+        data = self.data
+
         if self.allow_blank:
-            yield _iter_choices_wtforms_compat(
-                "__None", self.blank_text, self.data is None
-            )
+            yield _iter_choices_wtforms_compat("__None", self.blank_text, data is None)
 
         for pk, obj in self._get_object_list():
-            yield _iter_choices_wtforms_compat(
-                pk, self.get_label(obj), obj == self.data
-            )
+            yield _iter_choices_wtforms_compat(pk, self.get_label(obj), obj == data)
 
     def process_formdata(self, valuelist: list[str]) -> None:
         if valuelist:
@@ -144,12 +290,13 @@ class QuerySelectField(SelectFieldBase):
                 self._formdata = valuelist[0]
 
     def pre_validate(self, form: form.BaseForm) -> None:
-        if not self.allow_blank or self.data is not None:
-            for _pk, obj in self._get_object_list():
-                if self.data == obj:
-                    break
-            else:
+        data = self.data
+
+        if data is None:
+            if not self.allow_blank:
                 raise ValidationError(self.gettext("Not a valid choice"))
+        elif not self._data_valid and not self._is_valid_choice(data):
+            raise ValidationError(self.gettext("Not a valid choice"))
 
 
 class QuerySelectMultipleField(QuerySelectField):
@@ -179,40 +326,41 @@ class QuerySelectMultipleField(QuerySelectField):
     def _get_data(self) -> t.Any:
         formdata = self._formdata
         if formdata is not None:
-            data = []
-            for pk, obj in self._get_object_list():
-                if not formdata:
-                    break
-                elif pk in formdata:
-                    formdata.remove(pk)
-                    data.append(obj)
-            if formdata:
+            objects = self._get_objects(formdata)
+            data = [objects[pk] for pk in formdata if pk in objects]
+            if len(data) < len(formdata):
                 self._invalid_formdata = True
             self._set_data(data)
+            self._data_valid = True
         return self._data
 
     def _set_data(self, data: list[t.Any]) -> None:
         self._data = data
-        self._formdata: set[str] | None = None
+        self._formdata: list[str] | None = None
+        self._data_valid = False
 
     data = property(_get_data, _set_data)
 
     def iter_choices(self) -> t.Iterator[T_ITER_CHOICES]:  # type: ignore[override]
+        selected = {text_type(self.get_pk(obj)) for obj in self.data}
+
         for pk, obj in self._get_object_list():
-            yield _iter_choices_wtforms_compat(
-                pk, self.get_label(obj), obj in self.data
-            )
+            yield _iter_choices_wtforms_compat(pk, self.get_label(obj), pk in selected)
 
     def process_formdata(self, valuelist: t.Iterable[str]) -> None:
-        self._formdata = set(valuelist)
+        # keep the submitted order, without duplicates
+        self._formdata = list(dict.fromkeys(valuelist))
 
     def pre_validate(self, form: form.BaseForm) -> None:
+        data = self.data
+
         if self._invalid_formdata:
             raise ValidationError(self.gettext("Not a valid choice"))
-        elif self.data:
-            obj_list = list(x[1] for x in self._get_object_list())
-            for v in self.data:
-                if v not in obj_list:
+        elif data and not self._data_valid:
+            objects = self._get_objects({text_type(self.get_pk(v)) for v in data})
+
+            for v in data:
+                if objects.get(text_type(self.get_pk(v))) != v:
                     raise ValidationError(self.gettext("Not a valid choice"))
 
 
@@ -349,7 +497,73 @@ class InlineModelFormList(InlineFieldList):
     def display_row_controls(self, field: InlineModelFormField) -> bool:
         return field.get_pk() is not None
 
+    def _get_form_relations(self) -> list[str]:
+        """
+        Return the names of the relations of the related model edited by
+        the inline form.
+        """
+        relationships = sa_inspect(self.model).relationships
+        return [
+            name
+            for name in relationships.keys()
+            if isinstance(getattr(self.form, name, None), UnboundField)
+        ]
+
+    def _load_relations(self, models: t.Iterable[t.Any]) -> None:
+        """
+        Load the relations edited by the inline form for all `models` with
+        one query per relation, instead of a lazy load per model when the
+        forms are processed and populated.
+        """
+        if has_multiple_pks(self.model):
+            return
+
+        states = [instance_state(model) for model in models]
+        states = [state for state in states if state.key is not None]
+        relations = [
+            name
+            for name in self._get_form_relations()
+            if any(name not in state.dict for state in states)
+        ]
+
+        if not relations or states[0].session is None:
+            return
+
+        mapper = sa_inspect(self.model)
+        pks = [state.key[1][0] for state in states]  # type: ignore[index]
+        query = states[0].session.query(mapper).filter(mapper.primary_key[0].in_(pks))
+        query.options(
+            *(selectinload(getattr(self.model, name)) for name in relations)
+        ).all()
+
+    def process(
+        self,
+        formdata: dict[str, str] | None,  # type: ignore[override]
+        data: UnsetValue | list[t.Any] = unset_value,
+        extra_filters: t.Any = None,
+    ) -> None:
+        if isinstance(data, t.Iterable):
+            self._load_relations(data)
+
+        super().process(formdata, data, extra_filters)
+
+    def validate(
+        self,
+        form: form.BaseForm,
+        extra_validators: tuple[t.Any] = tuple(),  # type: ignore[override, assignment]
+    ) -> bool:
+        # Load the options selected in all entries at once
+        load_select_data(
+            field
+            for entry in self.entries
+            if not self.should_delete(entry)
+            for field in entry.form
+        )
+
+        return super().validate(form, extra_validators)
+
     def populate_obj(self, obj: t.Any, name: str) -> None:
+        start = time.perf_counter()
         values = getattr(obj, name, None)
 
         if values is None:
@@ -358,6 +572,9 @@ class InlineModelFormList(InlineFieldList):
         # Create primary key map
         pk_map = dict((get_obj_pk(v, self._pk), v) for v in values)
 
+        created = 0
+        deleted = 0
+
         # Handle request data
         for field in self.entries:
             field_id = get_field_id(field)
@@ -369,15 +586,28 @@ class InlineModelFormList(InlineFieldList):
                 if self.should_delete(field):
                     session = _get_deprecated_session(self.session)
                     session.delete(model)
+                    deleted += 1
                     continue
             else:
+                # added to the session through the relationship cascade
                 model = self.model()
                 values.append(model)
+                created += 1
 
             field.populate_obj(model, None)
 
             self.inline_view._on_model_change(field, model, is_created)
 
+        log.debug(
+            "Populated %s.%s in %.3fs: %d created, %d updated, %d deleted",
+            obj.__class__.__name__,
+            name,
+            time.perf_counter() - start,
+            created,
+            len(self.entries) - created - deleted,
+            deleted,
+        )
+
 
 class InlineModelOneToOneField(InlineModelFormField):
     def __init__(
@@ -445,6 +675,80 @@ class InlineModelOneToOneField(InlineModelFormField):
         self.inline_view.on_model_change(self.form, model, is_created)
 
 
+CHOICE_CACHE_ATTR = "_flask_admin_choice_cache"
+
+
+def get_choice_cache() -> dict[tuple[t.Any, ...], t.Any] | None:
+    """
+    Return the options of `QuerySelectField` fields loaded during the
+    current request, keyed by query, or `None` outside of a request.
+
+    Fields and inline forms with the same query share their options, so
+    a form with several relations to the same model runs one query. The
+    cache is cleared by `clear_choice_cache` when the request ends.
+    """
+    if not has_request_context():
+        return None
+
+    if CHOICE_CACHE_ATTR not in g:
+        setattr(g, CHOICE_CACHE_ATTR, {})
+
+    return getattr(g, CHOICE_CACHE_ATTR)
+
+
+def load_select_data(fields: t.Iterable[t.Any]) -> None:
+    """
+    Load the options submitted in the `QuerySelectField` fields found in
+    `fields` with one query per distinct field query, instead of one query
+    per field. The options are shared through `get_choice_cache`, so this
+    only has an effect during a request.
+
+    :param fields:
+        Fields to search for select fields
+    """
+    pending: dict[int, tuple[QuerySelectField, set[str]]] = {}
+
+    for field in fields:
+        formdata = getattr(field, "_formdata", None)
+
+        if not isinstance(field, QuerySelectField) or not formdata:
+            continue
+
+        shared = field._get_shared_objects()
+
+        if shared is not None:
+            _, pks = pending.setdefault(id(shared), (field, set()))
+            pks.update([formdata] if isinstance(formdata, str) else formdata)
+
+    for field, pks in pending.values():
+        field._get_objects(pks)
+
+
+def clear_choice_cache(exc: BaseException | None = None) -> None:
+    """
+    Clear the options cached by `get_choice_cache`. Registered as a
+    `teardown_request` handler of the SQLAlchemy model views.
+    """
+    g.pop(CHOICE_CACHE_ATTR, None)
+
+
+def get_query_cache_key(query: t.Any) -> tuple[t.Any, ...] | None:
+    """
+    Return a key identifying the SQL statement and parameters of `query`,
+    or `None` if it is not a SQLAlchemy query.
+    """
+    if not isinstance(query, Query):
+        return None
+
+    try:
+        compiled = query.statement.compile()
+    except SQLAlchemyError:
+        return None
+
+    params = tuple(sorted((k, repr(v)) for k, v in compiled.params.items()))
+    return id(query.session), str(compiled), params
+
+
 def get_pk_from_identity(obj: t.Any) -> str:
     # TODO: Remove me
     key = identity_key(instance=obj)[1]
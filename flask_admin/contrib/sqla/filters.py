@@ -4,6 +4,7 @@ import typing as t
 from sqlalchemy.sql import not_
 from sqlalchemy.sql import or_
 
+from flask_admin._compat import as_unicode
 from flask_admin._types import T_COLUMN
 from flask_admin._types import T_INSTRUMENTED_ATTRIBUTE
 from flask_admin._types import T_OPTIONS
@@ -154,6 +155,27 @@ class BaseSQLAFilter(filters.BaseFilter):
     ) -> t.Any:
         return super().apply(query, value)
 
+    def get_facet_value(self, value: t.Any) -> str | None:
+        """
+        Return the filter value selecting the rows whose column is equal
+        to `value`, or `None` if this filter can not be used as a facet.
+
+        :param value:
+            Column value loaded from the database
+        """
+        return None
+
+    def matches_null(self, value: t.Any) -> bool:
+        """
+        Return `True` if the filter selects the rows where the column is
+        NULL. Through a relationship, this includes the rows without any
+        related object.
+
+        :param value:
+            Cleaned filter value
+        """
+        return False
+
 
 # Common filters
 class FilterEqual(BaseSQLAFilter):
@@ -162,6 +184,12 @@ class FilterEqual(BaseSQLAFilter):
     ) -> t.Any:
         return query.filter(self.get_column(alias) == value)
 
+    def get_facet_value(self, value: t.Any) -> str | None:
+        if value is None:
+            return None
+
+        return as_unicode(value)
+
     def operation(self) -> T_TRANSLATABLE:
         return lazy_gettext("equals")
 
@@ -227,6 +255,9 @@ class FilterEmpty(BaseSQLAFilter, filters.BaseBooleanFilter):
         else:
             return query.filter(self.get_column(alias) != None)  # noqa: E711
 
+    def matches_null(self, value: t.Any) -> bool:
+        return value == "1"
+
     def operation(self) -> T_TRANSLATABLE:
         return lazy_gettext("empty")
 
@@ -261,6 +292,9 @@ class FilterNotInList(FilterInList):
         column = self.get_column(alias)
         return query.filter(or_(~column.in_(value), column == None))  # noqa: E711
 
+    def matches_null(self, value: t.Any) -> bool:
+        return True
+
     def operation(self) -> T_TRANSLATABLE:
         return lazy_gettext("not in list")
 
@@ -274,6 +308,12 @@ class BooleanEqualFilter(FilterEqual, filters.BaseBooleanFilter):
         """
         return value == "1"
 
+    def get_facet_value(self, value: t.Any) -> str | None:
+        if value is None:
+            return None
+
+        return "1" if value else "0"
+
 
 class BooleanNotEqualFilter(FilterNotEqual, filters.BaseBooleanFilter):
     def clean(self, value: str) -> bool:
@@ -489,6 +529,12 @@ class EnumEqualFilter(FilterEqual):
             return super().clean(value)
         return self.enum_class[value]
 
+    def get_facet_value(self, value: t.Any) -> str | None:
+        if isinstance(value, enum.Enum):
+            return value.name
+
+        return super().get_facet_value(value)
+
 
 class EnumFilterNotEqual(FilterNotEqual):
     def __init__(
@@ -628,6 +674,16 @@ class ChoiceTypeEqualFilter(FilterEqual):
         else:
             return query.filter(column.in_([]))
 
+    def get_facet_value(self, value: t.Any) -> str | None:
+        # the filter value is the name of enum choices and the label of
+        # the other choices
+        if isinstance(value, enum.Enum):
+            return value.name
+        elif hasattr(value, "code"):
+            return as_unicode(value.value)
+
+        return super().get_facet_value(value)
+
 
 class ChoiceTypeNotEqualFilter(FilterNotEqual):
     def __init__(
@@ -661,6 +717,9 @@ class ChoiceTypeNotEqualFilter(FilterNotEqual):
         else:
             return query
 
+    def matches_null(self, value: t.Any) -> bool:
+        return True
+
 
 class ChoiceTypeLikeFilter(FilterLike):
     def __init__(
@@ -724,6 +783,9 @@ class ChoiceTypeNotLikeFilter(FilterNotLike):
         else:
             return query
 
+    def matches_null(self, value: t.Any) -> bool:
+        return True
+
 
 class UuidFilterEqual(FilterEqual, filters.BaseUuidFilter):
     pass
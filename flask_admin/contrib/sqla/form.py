@@ -8,6 +8,8 @@ from enum import EnumMeta
 
 from sqlalchemy import Boolean
 from sqlalchemy import Column
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import String
 from sqlalchemy.orm import ColumnProperty
 from wtforms import fields
 from wtforms import Form
@@ -47,6 +49,8 @@ from ...form import Select2Field
 from ._compat import _get_deprecated_session
 from ._types import T_SESSION_OR_DB
 from .ajax import create_ajax_loader
+from .ajax import QueryAjaxModelLoader
+from .fields import get_choice_cache
 from .fields import HstoreForm
 from .fields import InlineHstoreList
 from .fields import InlineModelFormList
@@ -55,6 +59,7 @@ from .fields import QuerySelectField
 from .fields import QuerySelectMultipleField
 from .tools import filter_foreign_columns
 from .tools import get_field_with_path
+from .tools import get_primary_key
 from .tools import has_multiple_pks
 from .tools import is_association_proxy
 from .tools import is_relationship
@@ -64,6 +69,73 @@ from .validators import valid_color
 from .validators import valid_currency
 
 
+class ThresholdUnboundField(UnboundField):  # type: ignore[type-arg]
+    """
+    Unbound relation field which binds to an ajax select field when the
+    related table has more rows than `threshold`, and to a drop-down with
+    every row otherwise.
+
+    The rows are counted when the field is bound, at most once per request,
+    so the choice follows the size of the table. The drop-down is used when
+    the rows can not be counted, for example outside of an application
+    context.
+    """
+
+    def __init__(
+        self,
+        ajax_field: UnboundField[t.Any],
+        select_field: UnboundField[t.Any],
+        session: T_SESSION_OR_DB,
+        model: type[T_SQLALCHEMY_MODEL],
+        threshold: int,
+    ) -> None:
+        super().__init__(select_field.field_class, **select_field.kwargs)
+
+        self.ajax_field = ajax_field
+        self.select_field = select_field
+        self.session = session
+        self.model = model
+        self.threshold = threshold
+
+    def _count_exceeds_threshold(self) -> bool:
+        try:
+            session = _get_deprecated_session(self.session)
+        except RuntimeError:
+            # No application context
+            return False
+
+        # count at most `threshold + 1` rows
+        count = session.query(self.model).limit(self.threshold + 1).count()
+        return count > self.threshold
+
+    def use_ajax(self) -> bool:
+        """
+        Check if the related table has more rows than the threshold.
+        """
+        cache = get_choice_cache()
+
+        if cache is None:
+            return self._count_exceeds_threshold()
+
+        key = ("threshold", id(self))
+
+        if key not in cache:
+            cache[key] = self._count_exceeds_threshold()
+
+        return cache[key]
+
+    def bind(
+        self,
+        form: t.Any,
+        name: str,
+        prefix: str = "",
+        translations: t.Any = None,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        field = self.ajax_field if self.use_ajax() else self.select_field
+        return field.bind(form, name, prefix, translations, **kwargs)
+
+
 class AdminModelConverter(ModelConverterBase):
     """
     SQLAlchemy model to form converter
@@ -121,6 +193,39 @@ class AdminModelConverter(ModelConverterBase):
 
         return None
 
+    def _get_threshold_ajax_loader(
+        self,
+        prop: ColumnProperty[t.Any] | T_INSTRUMENTED_ATTRIBUTE,
+        remote_model: type[T_SQLALCHEMY_MODEL],
+    ) -> QueryAjaxModelLoader | None:
+        """
+        Return an ajax loader for the relation if the view has a
+        `form_ajax_threshold`. The loader is registered in
+        `_form_threshold_ajax_refs`, apart from `form_ajax_refs`, so
+        `/ajax/lookup/` serves it whatever the size of the related table.
+        """
+        threshold = getattr(self.view, "form_ajax_threshold", None)
+        ajax_refs = getattr(self.view, "_form_threshold_ajax_refs", None)
+
+        if threshold is None or ajax_refs is None or has_multiple_pks(remote_model):
+            return None
+
+        if prop.key in ajax_refs:
+            return ajax_refs[prop.key]
+
+        mapper = sa_inspect(remote_model)
+        fields = [
+            attr.key
+            for attr in mapper.column_attrs
+            if isinstance(attr.columns[0].type, String)
+        ] or [get_primary_key(remote_model)]
+
+        loader = create_ajax_loader(
+            self.view.model, self.session, prop.key, prop.key, {"fields": fields}
+        )
+        ajax_refs[prop.key] = loader
+        return loader
+
     def _model_select_field(
         self,
         prop: ColumnProperty[t.Any] | T_INSTRUMENTED_ATTRIBUTE,
@@ -132,8 +237,14 @@ class AdminModelConverter(ModelConverterBase):
         | AjaxSelectMultipleField
         | QuerySelectMultipleField
         | QuerySelectField
+        | ThresholdUnboundField
     ):
         loader = getattr(self.view, "_form_ajax_refs", {}).get(prop.key)
+        threshold = getattr(self.view, "form_ajax_threshold", None)
+        threshold_loader = None
+
+        if not loader and "query_factory" not in kwargs:
+            threshold_loader = self._get_threshold_ajax_loader(prop, remote_model)
 
         if loader:
             if multiple:
@@ -141,6 +252,10 @@ class AdminModelConverter(ModelConverterBase):
             else:
                 return AjaxSelectField(loader, **kwargs)
 
+        if threshold_loader:
+            ajax_field_class = AjaxSelectMultipleField if multiple else AjaxSelectField
+            ajax_field = UnboundField(ajax_field_class, threshold_loader, **kwargs)
+
         if "query_factory" not in kwargs:
             # _get_deprecated_session must be inside lambda call or session will stay
             # the same across requests. https://github.com/pallets-eco/flask-admin/issues/2831
@@ -148,10 +263,18 @@ class AdminModelConverter(ModelConverterBase):
                 self.session
             ).query(remote_model)
 
-        if multiple:
-            return QuerySelectMultipleField(**kwargs)
-        else:
-            return QuerySelectField(**kwargs)
+        select_field_class = QuerySelectMultipleField if multiple else QuerySelectField
+
+        if threshold_loader and threshold is not None:
+            return ThresholdUnboundField(
+                ajax_field,
+                UnboundField(select_field_class, **kwargs),
+                self.session,
+                remote_model,
+                threshold,
+            )
+
+        return select_field_class(**kwargs)
 
     def _convert_relation(
         self,
@@ -165,6 +288,7 @@ class AdminModelConverter(ModelConverterBase):
         | AjaxSelectMultipleField
         | QuerySelectMultipleField
         | QuerySelectField
+        | ThresholdUnboundField
     ):
         # Check if relation is specified
         form_columns = getattr(self.view, "form_columns", None)
@@ -226,6 +350,7 @@ class AdminModelConverter(ModelConverterBase):
         | QuerySelectField
         | HiddenField
         | Select2Field
+        | ThresholdUnboundField
     ):
         # Properly handle forced fields
         if isinstance(prop, FieldPlaceholder):
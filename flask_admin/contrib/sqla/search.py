@@ -0,0 +1,324 @@
+import typing as t
+
+from sqlalchemy import column as sql_column
+from sqlalchemy import event
+from sqlalchemy import func
+from sqlalchemy import Index
+from sqlalchemy import select
+from sqlalchemy import table as sql_table
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from flask_admin._compat import string_types
+
+from ..._types import T_SQLALCHEMY_MODEL
+from ._types import T_SQLALCHEMY_QUERY
+from .tools import get_primary_key
+from .tools import has_multiple_pks
+
+
+class BaseSearchBackend:
+    """
+    Base class for the full-text search backends of
+    :attr:`~flask_admin.contrib.sqla.ModelView.search_backend`.
+
+    The backend replaces the ``ILIKE`` search of `column_searchable_list`:
+    the whole search string is passed to `apply` and, when the list view is
+    not sorted by a column, rows are ordered by `get_order_by`.
+    """
+
+    def __init__(self, model: type[T_SQLALCHEMY_MODEL]) -> None:
+        """
+        Constructor.
+
+        :param model:
+            Model class
+        """
+        self.model = model
+
+    def _get_column(self, name: t.Any) -> t.Any:
+        if isinstance(name, string_types):
+            attr = getattr(self.model, name, None)
+
+            if attr is None:
+                raise ValueError(f"{self.model}.{name} does not exist.")
+
+            return attr
+
+        return name
+
+    def apply(self, query: T_SQLALCHEMY_QUERY, search: str) -> T_SQLALCHEMY_QUERY:
+        """
+        Return `query` filtered to the rows matching `search`.
+
+        :param query:
+            List or count query
+        :param search:
+            Search string entered in the list view
+        """
+        raise NotImplementedError()
+
+    def get_order_by(self, search: str) -> t.Any | None:
+        """
+        Return the clause ordering the rows matching `search` by relevance,
+        most relevant first, or `None` to keep the default sort order.
+
+        :param search:
+            Search string entered in the list view
+        """
+        return None
+
+    def create_index(self, bind: t.Any) -> None:
+        """
+        Create the index used by the backend.
+
+        :param bind:
+            Engine or connection
+        """
+        raise NotImplementedError()
+
+
+class PostgresFullTextSearch(BaseSearchBackend):
+    """
+    PostgreSQL full-text search with ``tsvector`` and
+    ``websearch_to_tsquery``, which accepts quoted phrases, ``or`` and
+    ``-word`` in the search string.
+
+    Search either a stored ``tsvector`` column::
+
+        class PostView(ModelView):
+            search_backend = PostgresFullTextSearch(Post, vector='search_vector')
+
+    or an expression built from text columns, which needs an expression
+    index to be fast::
+
+        search = PostgresFullTextSearch(Post, columns=('title', 'body'))
+        search.create_index(db.engine)
+    """
+
+    def __init__(
+        self,
+        model: type[T_SQLALCHEMY_MODEL],
+        columns: t.Sequence[t.Any] | None = None,
+        vector: t.Any | None = None,
+        config: str = "english",
+        index_name: str | None = None,
+    ) -> None:
+        """
+        Constructor.
+
+        :param model:
+            Model class
+        :param columns:
+            Text columns, or their names, joined with ``||`` into a
+            ``tsvector`` expression. Not used if `vector` is set.
+        :param vector:
+            ``tsvector`` column, column name or expression
+        :param config:
+            Text search configuration
+        :param index_name:
+            Name of the GIN index created by `create_index`
+        """
+        super().__init__(model)
+
+        self.config = config
+
+        # constants are rendered inline, so the expression of the queries
+        # matches the expression index whether the driver binds parameters
+        # on the client or on the server
+        self._config = text("'{}'".format(config.replace("'", "''")))
+
+        if vector is not None:
+            self.vector = self._get_column(vector)
+        elif columns:
+            # concat_ws is not IMMUTABLE and can not be used in an index
+            document: t.Any = None
+            for c in columns:
+                value = func.coalesce(self._get_column(c), text("''"))
+                document = (
+                    value
+                    if document is None
+                    else document.op("||")(text("' '")).op("||")(value)
+                )
+            self.vector = func.to_tsvector(self._config, document)
+        else:
+            raise ValueError(
+                f"Full-text search requires `columns` or `vector` for {model}"
+            )
+
+        self.index_name = index_name or f"ix_{model.__tablename__}_fulltext"
+
+    def _get_tsquery(self, search: str) -> t.Any:
+        return func.websearch_to_tsquery(self._config, search)
+
+    def apply(self, query: T_SQLALCHEMY_QUERY, search: str) -> T_SQLALCHEMY_QUERY:
+        return query.filter(self.vector.op("@@")(self._get_tsquery(search)))
+
+    def get_order_by(self, search: str) -> t.Any | None:
+        return func.ts_rank(self.vector, self._get_tsquery(search)).desc()
+
+    def get_index(self) -> Index:
+        """
+        Return the GIN index of the ``tsvector`` column or expression.
+        """
+        return Index(self.index_name, self.vector, postgresql_using="gin")
+
+    def create_index(self, bind: t.Any) -> None:
+        self.get_index().create(bind, checkfirst=True)
+
+
+class SQLiteFullTextSearch(BaseSearchBackend):
+    """
+    SQLite full-text search with an FTS5 shadow table.
+
+    The FTS5 table holds a copy of the searched columns, keyed by the
+    integer primary key of the model. It is kept in sync by ORM events when
+    models are inserted, updated or deleted through a session; bulk
+    ``UPDATE`` or ``DELETE`` statements bypass them and require calling
+    `create_index` again. Create one instance per model, as each one
+    registers its own event listeners::
+
+        search = SQLiteFullTextSearch(Post, columns=('title', 'body'))
+        search.create_index(db.engine)
+
+        class PostView(ModelView):
+            search_backend = search
+
+    Words of the search string are quoted, so FTS5 query syntax is not
+    interpreted and rows have to match every word.
+    """
+
+    def __init__(
+        self,
+        model: type[T_SQLALCHEMY_MODEL],
+        columns: t.Sequence[str],
+        table_name: str | None = None,
+        tokenize: str | None = None,
+    ) -> None:
+        """
+        Constructor.
+
+        :param model:
+            Model class with an integer primary key
+        :param columns:
+            Names of the searched columns
+        :param table_name:
+            Name of the FTS5 table, defaults to the model table name with a
+            ``_fts`` suffix
+        :param tokenize:
+            FTS5 tokenizer, for example ``'porter unicode61'``
+        """
+        super().__init__(model)
+
+        if has_multiple_pks(model):
+            raise NotImplementedError(
+                "Full-text search does not support models with multiple primary keys."
+            )
+
+        self.columns = list(columns)
+        self.table_name = table_name or f"{model.__tablename__}_fts"
+        self.tokenize = tokenize
+
+        self._pk = self._get_column(get_primary_key(model))
+        self._fields = [self._get_column(name) for name in self.columns]
+
+        self.table = sql_table(
+            self.table_name,
+            sql_column("rowid"),
+            sql_column("rank"),
+            sql_column(self.table_name),
+            *(sql_column(name) for name in self.columns),
+        )
+
+        event.listen(model, "after_insert", self._after_insert)
+        event.listen(model, "after_update", self._after_update)
+        event.listen(model, "after_delete", self._after_delete)
+
+    def _get_values(self, target: T_SQLALCHEMY_MODEL) -> dict[str, t.Any]:
+        values = {name: getattr(target, name) for name in self.columns}
+        values["rowid"] = getattr(target, self._pk.key)
+        return values
+
+    def _after_insert(
+        self, mapper: t.Any, connection: t.Any, target: T_SQLALCHEMY_MODEL
+    ) -> None:
+        connection.execute(self.table.insert().values(self._get_values(target)))
+
+    def _after_update(
+        self, mapper: t.Any, connection: t.Any, target: T_SQLALCHEMY_MODEL
+    ) -> None:
+        self._after_delete(mapper, connection, target)
+        self._after_insert(mapper, connection, target)
+
+    def _after_delete(
+        self, mapper: t.Any, connection: t.Any, target: T_SQLALCHEMY_MODEL
+    ) -> None:
+        rowid = getattr(target, self._pk.key)
+        connection.execute(self.table.delete().where(self.table.c.rowid == rowid))
+
+    def _get_match(self, search: str) -> t.Any | None:
+        words = [word.replace('"', '""') for word in search.split()]
+
+        # FTS5 raises a syntax error for an empty query
+        if not words:
+            return None
+
+        query = " ".join(f'"{word}"' for word in words)
+        return self.table.c[self.table_name].op("MATCH")(query)
+
+    def apply(self, query: T_SQLALCHEMY_QUERY, search: str) -> T_SQLALCHEMY_QUERY:
+        match = self._get_match(search)
+
+        if match is None:
+            return query
+
+        rowids = select(self.table.c.rowid).where(match)
+        return query.filter(self._pk.in_(rowids))
+
+    def get_order_by(self, search: str) -> t.Any | None:
+        match = self._get_match(search)
+
+        if match is None:
+            return None
+
+        # bm25 scores are negative, the best matches have the lowest rank
+        return (
+            select(self.table.c.rank)
+            .where(self.table.c.rowid == self._pk, match)
+            .scalar_subquery()
+            .asc()
+        )
+
+    def create_index(self, bind: t.Any) -> None:
+        """
+        Create the FTS5 table if it does not exist and fill it with the
+        rows of the model table.
+
+        :param bind:
+            Engine or connection
+        """
+        quote = bind.dialect.identifier_preparer.quote
+        options = [quote(name) for name in self.columns]
+
+        if self.tokenize:
+            tokenize = self.tokenize.replace("'", "''")
+            options.append(f"tokenize='{tokenize}'")
+
+        ddl = text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {quote(self.table_name)}"
+            f" USING fts5({', '.join(options)})"
+        )
+        fill = self.table.insert().from_select(
+            ["rowid", *self.columns], select(self._pk, *self._fields)
+        )
+
+        if isinstance(bind, Engine):
+            with bind.begin() as connection:
+                self._create_index(connection, ddl, fill)
+        else:
+            self._create_index(bind, ddl, fill)
+
+    def _create_index(self, connection: t.Any, ddl: t.Any, fill: t.Any) -> None:
+        connection.execute(ddl)
+        connection.execute(self.table.delete())
+        connection.execute(fill)
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+import base64
+import datetime
+import decimal
+import enum
+import json
 import types
 import typing as t
+import uuid
 
 from sqlalchemy import and_
+from sqlalchemy import Boolean
+from sqlalchemy import cast
+from sqlalchemy import func
 from sqlalchemy import inspect
+from sqlalchemy import Integer
+from sqlalchemy import Numeric
 from sqlalchemy import or_
+from sqlalchemy import String
 from sqlalchemy import tuple_
+from sqlalchemy import Unicode
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.orm.clsregistry import _class_resolver
@@ -41,6 +54,11 @@ from flask_admin.tools import escape  # noqa: F401
 from flask_admin.tools import iterdecode  # noqa: F401
 from flask_admin.tools import iterencode  # noqa: F401
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 
 def parse_like_term(term: str) -> str:
     if term.startswith("^"):
@@ -53,6 +71,284 @@ def parse_like_term(term: str) -> str:
     return stmt
 
 
+def strip_search_operator(term: str) -> str:
+    """
+    Remove the ``^`` and ``=`` prefixes of `parse_like_term` from a search
+    term.
+    """
+    if term[:1] in ("^", "="):
+        return term[1:]
+
+    return term
+
+
+def escape_like(term: str, escape_char: str = "\\") -> str:
+    """
+    Escape the ``LIKE`` wildcards in `term`.
+
+    :param term:
+        Search term
+    :param escape_char:
+        Escape character passed as the ``escape`` argument of ``like``
+    """
+    return (
+        term.replace(escape_char, escape_char + escape_char)
+        .replace("%", escape_char + "%")
+        .replace("_", escape_char + "_")
+    )
+
+
+SEARCH_MODES = ("contains", "exact", "prefix", "iprefix", "trigram", "fulltext")
+
+SEARCH_TYPES = (int, float, decimal.Decimal, uuid.UUID)
+
+
+def get_search_type(column: t.Any) -> type | None:
+    """
+    Return the Python type a search term has to be converted to before it
+    is compared with `column`, or `None` for columns searched as text.
+    """
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return None
+
+    if python_type is bool or not issubclass(python_type, SEARCH_TYPES):
+        return None
+
+    return python_type
+
+
+def parse_search_value(python_type: type, term: str) -> t.Any | None:
+    """
+    Convert `term` to `python_type`. Returns `None` if it is not a valid
+    value of that type.
+    """
+    try:
+        return python_type(term)
+    except (ValueError, ArithmeticError):
+        return None
+
+
+def get_search_criterion(column: t.Any, mode: str | None, term: str) -> t.Any | None:
+    """
+    Return the criterion matching `term` against `column` with a search
+    mode of `SEARCH_MODES`, or `None` if the column cannot match the term.
+
+    Without a mode, numeric and UUID columns are compared with the term
+    converted to their type and other columns are searched as text.
+
+    :param column:
+        Column to search
+    :param mode:
+        Search mode or `None`
+    :param term:
+        Search term
+    """
+    if mode == "contains":
+        return cast(column, Unicode).ilike(parse_like_term(term))
+
+    python_type = get_search_type(column)
+
+    if python_type is not None:
+        value = parse_search_value(python_type, strip_search_operator(term))
+        return None if value is None else column == value
+
+    if mode is None:
+        return cast(column, Unicode).ilike(parse_like_term(term))
+
+    term = strip_search_operator(term)
+
+    if mode == "exact":
+        return column == term
+
+    if mode == "prefix":
+        if not isinstance(getattr(column, "type", None), String):
+            column = cast(column, Unicode)
+        return column.like(f"{escape_like(term)}%", escape="\\")
+
+    if mode == "iprefix":
+        return func.lower(column).like(f"{escape_like(term.lower())}%", escape="\\")
+
+    if mode == "trigram":
+        return column.op("%")(term)
+
+    return column.match(term)
+
+
+def get_arrow_type(column: t.Any) -> t.Any | None:
+    """
+    Return the Arrow type holding every value of `column` in the Arrow
+    based exports, or `None` if it should be inferred from the values.
+
+    Decimal columns without a scale, such as an unconstrained PostgreSQL
+    ``numeric``, are exported as strings to keep all their digits.
+    """
+    if pyarrow is None:
+        return None
+
+    column_type = column.type
+
+    if isinstance(column_type, Boolean):
+        return pyarrow.bool_()
+    elif isinstance(column_type, Integer):
+        return pyarrow.int64()
+    elif isinstance(column_type, Numeric):
+        if not column_type.asdecimal:
+            return pyarrow.float64()
+        elif (
+            column_type.scale is None
+            or max(column_type.precision or 0, column_type.scale) > 38
+        ):
+            return pyarrow.string()
+
+        return pyarrow.decimal128(38, column_type.scale)
+    elif isinstance(column_type, String):
+        return pyarrow.string()
+
+    return None
+
+
+def encode_cursor(values: t.Sequence[t.Any], backwards: bool = False) -> str:
+    """
+    Encode keyset pagination values as an opaque, URL-safe string.
+
+    :param values:
+        Values of the seek columns of a row
+    :param backwards:
+        If set to True, cursor seeks to the rows preceding the values
+    """
+    items: list[t.Any] = []
+
+    for value in values:
+        if isinstance(value, enum.Enum):
+            value = value.name
+        elif isinstance(value, datetime.date | datetime.time):
+            value = value.isoformat()
+        elif isinstance(value, decimal.Decimal | uuid.UUID):
+            value = str(value)
+
+        items.append(value)
+
+    payload = json.dumps([int(backwards), items], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor_value(column: t.Any, value: t.Any) -> t.Any:
+    if value is None:
+        return None
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if isinstance(value, python_type):
+        return value
+    elif issubclass(python_type, enum.Enum):
+        return python_type[value]
+    elif issubclass(python_type, datetime.datetime | datetime.date | datetime.time):
+        return python_type.fromisoformat(value)
+
+    return python_type(value)
+
+
+def decode_cursor(
+    cursor: str, columns: t.Sequence[t.Any]
+) -> tuple[list[t.Any], bool] | None:
+    """
+    Decode cursor created by :func:`encode_cursor`.
+
+    Returns a tuple of values converted to the python types of the passed
+    columns and the `backwards` flag, or `None` if the cursor is invalid.
+
+    :param cursor:
+        Encoded cursor
+    :param columns:
+        Seek columns, in the same order as the values of the cursor
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor.encode("ascii"))
+        backwards, items = json.loads(payload)
+
+        if len(items) != len(columns):
+            return None
+
+        values = [
+            _decode_cursor_value(column, value)
+            for column, value in zip(columns, items, strict=True)
+        ]
+    except (ValueError, TypeError, KeyError):
+        return None
+
+    return values, bool(backwards)
+
+
+def get_keyset_filter(
+    columns: t.Sequence[tuple[t.Any, bool]],
+    values: t.Sequence[t.Any],
+    backwards: bool = False,
+) -> t.Any:
+    """
+    Build the seek condition for keyset pagination.
+
+    Matches rows which are ordered after the passed values, or before them
+    if `backwards` is set. For columns `a, b` and values `x, y` sorted in
+    ascending order it generates ``a >= x AND (a > x OR (a = x AND b > y))``.
+    The redundant leading bound lets the database use an index range scan
+    on the first column.
+
+    :param columns:
+        List of `(column, descending)` tuples the query is ordered by
+    :param values:
+        Values of the seek columns
+    :param backwards:
+        Seek in the opposite direction of the sort order
+    """
+    clauses = []
+
+    for idx, (column, is_desc) in enumerate(columns):
+        if is_desc != backwards:
+            seek = column < values[idx]
+        else:
+            seek = column > values[idx]
+
+        equals = [columns[i][0] == values[i] for i in range(idx)]
+        clauses.append(and_(*equals, seek))
+
+    if len(clauses) == 1:
+        return clauses[0]
+
+    first, is_desc = columns[0]
+    if is_desc != backwards:
+        bound = first <= values[0]
+    else:
+        bound = first >= values[0]
+
+    return and_(bound, or_(*clauses))
+
+
+class CollectionSummary:
+    """
+    Number of rows of a collection relation and its first few items, used
+    by `ModelView.column_collection_summaries`.
+    """
+
+    def __init__(self, count: int, items: list[t.Any]) -> None:
+        self.count = count
+        self.items = items
+
+    def __str__(self) -> str:
+        if not self.items:
+            return str(self.count)
+
+        labels = ", ".join(str(item) for item in self.items)
+        if self.count > len(self.items):
+            labels += ", …"
+
+        return f"{self.count}: {labels}"
+
+
 def filter_foreign_columns(
     base_table: T_SQLALCHEMY_TABLE, columns: list[T_COL_NO_STR]
 ) -> list[T_COLUMN]:
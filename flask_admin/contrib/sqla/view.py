@@ -1,39 +1,56 @@
 import inspect
+import json
 import logging
 import typing as t
 import warnings
+from itertools import islice
 from typing import cast as t_cast
 
 from flask import current_app
 from flask import flash
+from sqlalchemy import and_
 from sqlalchemy import Boolean
+from sqlalchemy import Column
+from sqlalchemy import false
 from sqlalchemy import func
+from sqlalchemy import literal_column
 from sqlalchemy import or_
+from sqlalchemy import select
 from sqlalchemy import Table
-from sqlalchemy import Unicode
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm import ColumnProperty
 from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.orm.base import instance_state
 from sqlalchemy.orm.base import manager_of_class
-from sqlalchemy.sql.elements import BinaryExpression
-from sqlalchemy.sql.expression import cast as sql_cast
+from sqlalchemy.orm.exc import UnmappedColumnError
+from sqlalchemy.orm.interfaces import LoaderOption
 from sqlalchemy.sql.expression import desc
 from wtforms import Form
 
 from flask_admin._backwards import ObsoleteAttr
+from flask_admin._compat import as_unicode
 from flask_admin._compat import string_types
 from flask_admin._compat import text_type
 from flask_admin.actions import action
 from flask_admin.babel import gettext
 from flask_admin.babel import lazy_gettext
 from flask_admin.babel import ngettext
+from flask_admin.base import Admin
+from flask_admin.blueprints import _BlueprintWithHostSupport as Blueprint
 from flask_admin.contrib.sqla import filters as sqla_filters
 from flask_admin.contrib.sqla import form
 from flask_admin.contrib.sqla import tools
+from flask_admin.contrib.sqla.tools import CollectionSummary
 from flask_admin.contrib.sqla.tools import is_relationship
 from flask_admin.model import BaseModelView
+from flask_admin.model.ajax import AjaxModelLoader
+from flask_admin.model.base import EstimatedCount
 from flask_admin.model.form import create_editable_list_form
 
 from ..._types import T_COLUMN
@@ -42,6 +59,7 @@ from ..._types import T_COLUMN_TYPE_FORMATTERS
 from ..._types import T_FIELD_ARGS_VALIDATORS_FILES
 from ..._types import T_FILTER
 from ..._types import T_INSTRUMENTED_ATTRIBUTE
+from ..._types import T_QUERY_AJAX_MODEL_LOADER
 from ..._types import T_SQLALCHEMY_COLUMN
 from ..._types import T_SQLALCHEMY_INLINE_MODELS
 from ..._types import T_SQLALCHEMY_MODEL
@@ -52,12 +70,33 @@ from ._types import T_SESSION_OR_DB
 from ._types import T_SQLALCHEMY_QUERY
 from .ajax import create_ajax_loader
 from .ajax import QueryAjaxModelLoader
+from .fields import clear_choice_cache
 from .filters import BaseSQLAFilter
+from .search import BaseSearchBackend
 from .typefmt import DEFAULT_FORMATTERS
 
 # Set up logger
 log = logging.getLogger("flask-admin.sqla")
 
+# Key of the loaded collection summaries in the SQLAlchemy instance state info
+COLLECTION_SUMMARIES_KEY = "flask_admin_collection_summaries"
+
+# Loader options used by ModelView.get_eager_load_plan
+EAGER_LOADERS: dict[str, t.Callable[..., LoaderOption]] = {
+    "joinedload": joinedload,
+    "selectinload": selectinload,
+}
+
+# Minimum database versions with window function support, used by
+# ModelView.window_count
+WINDOW_FUNCTION_VERSIONS: dict[str, tuple[int, ...]] = {
+    "postgresql": (8, 4),
+    "sqlite": (3, 25),
+    "mysql": (8,),
+    "mssql": (9,),
+    "oracle": (8,),
+}
+
 
 class ModelView(BaseModelView):
     """
@@ -103,6 +142,54 @@ class ModelView(BaseModelView):
         Please refer to the `subqueryload` on list of possible values.
     """
 
+    column_load_only: bool = False
+    """
+        Load only the displayed columns in the list view and export.
+
+        The list and export queries use SQLAlchemy `load_only` with the
+        columns of `column_list` and `column_export_list`, the primary key
+        and the foreign keys of displayed relations. Other columns, like
+        large ``Text``, ``LargeBinary`` or ``JSON`` columns, are deferred
+        and only loaded if accessed.
+
+        Columns used by `column_formatters`, hybrid properties or templates
+        but not displayed should be added to `column_load_extra_list`,
+        otherwise they are loaded with a separate query for every row.
+    """
+
+    column_load_extra_list: T_COLUMN_LIST | None = None
+    """
+        Additional columns loaded by the list view and export when
+        `column_load_only` is enabled. For example::
+
+            class PostAdmin(ModelView):
+                column_load_only = True
+                column_list = ('title', 'summary')
+                column_load_extra_list = ('body',)
+                column_formatters = {
+                    'summary': lambda v, c, m, p: m.body[:100],
+                }
+    """
+
+    column_collection_summaries: dict[str, int] | None = None
+    """
+        Display one-to-many and many-to-many relations of the list view as
+        the number of related rows followed by the first few of them,
+        instead of loading the whole collection for every row.
+
+        Maps relation names to the number of related rows shown::
+
+            class CustomerAdmin(ModelView):
+                column_list = ('name', 'orders')
+                column_collection_summaries = {'orders': 3}
+
+        Counts and related rows of a page are loaded with a single query per
+        relation, using window functions when the database supports them.
+        The columns are sortable by count. Values are
+        :class:`~flask_admin.contrib.sqla.tools.CollectionSummary` instances,
+        which can be formatted with `column_type_formatters`.
+    """
+
     column_display_all_relations: bool | None = t_cast(
         bool,
         ObsoleteAttr(
@@ -147,6 +234,64 @@ class ModelView(BaseModelView):
         - If you prefix your search term with ``=``, it will perform an exact match.
           For example, if you entered ``=ZZZ``, the statement ``ILIKE 'ZZZ'`` will be
           used.
+
+        - Numeric and UUID columns only match rows equal to the search term,
+          and only if the term is a valid number or UUID.
+
+        Use `column_search_modes` to search columns with an index.
+    """
+
+    column_search_modes: dict[str, str] | None = None
+    """
+        Dictionary of the search modes of searchable columns, keyed by the
+        name used in `column_searchable_list`. The rules of
+        `column_searchable_list` apply to columns without a search mode.
+
+        The ``CAST`` and the leading wildcard of the default search prevent
+        the database from using an index. Available modes:
+
+        - ``contains``: ``CAST(column AS VARCHAR) ILIKE '%ZZZ%'``, the
+          default for text columns. Set it on numeric and UUID columns to
+          search them as text.
+        - ``exact``: ``column = 'ZZZ'``
+        - ``prefix``: ``column LIKE 'ZZZ%'``, uses a b-tree index on
+          PostgreSQL with the ``C`` collation or ``text_pattern_ops``
+        - ``iprefix``: ``lower(column) LIKE 'zzz%'``, for an expression index
+          on ``lower(column)``
+        - ``trigram``: ``column % 'ZZZ'``, similarity search with the
+          PostgreSQL ``pg_trgm`` extension and a GIN or GiST index
+        - ``fulltext``: ``column.match('ZZZ')``, full-text search of the
+          database backend
+
+        Numeric and UUID columns with a mode other than ``contains`` are
+        compared with the search term converted to their type.
+
+        For example::
+
+            class UserView(ModelView):
+                column_searchable_list = ('email', 'last_name', 'bio')
+                column_search_modes = {
+                    'email': 'iprefix',
+                    'last_name': 'prefix',
+                    'bio': 'trigram',
+                }
+    """
+
+    search_backend: BaseSearchBackend | None = None
+    """
+        Full-text search backend used instead of the ``ILIKE`` search of
+        `column_searchable_list`. The whole search string is passed to the
+        backend and, when no sort column is selected, rows are ordered by
+        relevance before `column_default_sort`.
+
+        See :mod:`flask_admin.contrib.sqla.search`. For example::
+
+            from flask_admin.contrib.sqla.search import PostgresFullTextSearch
+
+            class PostView(ModelView):
+                search_backend = PostgresFullTextSearch(
+                    Post, columns=('title', 'body'), config='english'
+                )
     """
 
     column_filters: t.Collection[str | BaseSQLAFilter] | None = None
@@ -242,6 +387,36 @@ class ModelView(BaseModelView):
         CASCADE`` for your model.
     """
 
+    window_count: bool = False
+    """
+        Fetch the row count of the list view in the same statement as the
+        page rows, using ``count(*) OVER ()``, instead of running a separate
+        count query.
+
+        This saves a database round trip and building the joins of the count
+        query. It is used for exact counts on databases with window
+        functions (PostgreSQL, SQLite 3.25+, MySQL 8+, MariaDB 10.2+, SQL
+        Server, Oracle); otherwise, or with keyset pagination, the count
+        query from `get_count_query` is used. Rows are counted from the list
+        query built by `get_query`. For example::
+
+            class AuditLogView(ModelView):
+                window_count = True
+    """
+
+    collection_exists: bool = True
+    """
+        Search and filter through one-to-many and many-to-many
+        relationships with correlated ``EXISTS`` subqueries instead of
+        outer joins.
+
+        Joining a collection repeats each row once per related object,
+        which inflates the list count and makes the database deduplicate
+        large intermediate results. Paths that only follow many-to-one
+        relationships, and sorting, still use joins. Set to `False` to
+        join every path.
+    """
+
     inline_models: T_SQLALCHEMY_INLINE_MODELS | None = None
     """
         Inline related-model editing for models with parent-child relations.
@@ -328,6 +503,23 @@ class ModelView(BaseModelView):
                 form_optional_types = (Boolean, Unicode)
     """
 
+    form_ajax_threshold: int | None = None
+    """
+        Use an ajax select2 input instead of a drop-down with every row for
+        relations to tables with more than this number of rows. The rows are
+        counted when the form is created, at most once per request.
+
+        Options are looked up in the string columns of the related model
+        (or its primary key if it has none). Relations listed in
+        `form_ajax_refs` or with a `query_factory` in `form_args` are not
+        changed. Disabled by default.
+
+        Example::
+
+            class PostView(ModelView):
+                form_ajax_threshold = 1000
+    """
+
     ignore_hidden: bool = True
     """
        Ignore field that starts with "_"
@@ -385,6 +577,7 @@ class ModelView(BaseModelView):
         self.session = _warn_session_deprecation(session)
 
         self._search_fields: list[tuple[T_SQLALCHEMY_COLUMN, t.Any]] | None = None
+        self._search_modes: list[str | None] = []
 
         self._filter_joins: dict[
             tuple[bool, t.Any] | T_INSTRUMENTED_ATTRIBUTE | str, t.Any
@@ -395,6 +588,14 @@ class ModelView(BaseModelView):
         if self.form_choices is None:
             self.form_choices = {}
 
+        for column in self.column_collection_summaries or ():
+            attr = getattr(model, column, None)
+            if attr is None or not (is_relationship(attr) and attr.property.uselist):
+                raise Exception(
+                    f"column_collection_summaries: {column} is not a collection "
+                    f"relation of {model.__name__}."
+                )
+
         super().__init__(
             model,
             name,
@@ -422,6 +623,23 @@ class ModelView(BaseModelView):
         else:
             self._auto_joins = self.column_select_related_list
 
+        self._details_loads: list[LoaderOption] = []
+        if self.column_auto_select_related and self.can_view_details:
+            plan = self.get_eager_load_plan(c for c, _ in self._details_columns)
+            self._details_loads = self.get_eager_load_options(plan)
+
+        self._load_only_columns: list[t.Any] | None = None
+        if self.column_load_only:
+            self._load_only_columns = self.scaffold_load_only_columns()
+
+    def create_blueprint(self, admin: Admin) -> Blueprint:
+        blueprint = super().create_blueprint(admin)
+
+        # Options of select fields are shared for the duration of a request
+        blueprint.teardown_request(clear_choice_cache)
+
+        return blueprint
+
     # Internal API
     def _get_model_iterator(
         self, model: type[T_SQLALCHEMY_MODEL] | None = None
@@ -479,6 +697,54 @@ class ModelView(BaseModelView):
 
         return query, joins, last
 
+    def _is_collection_path(self, path: t.Sequence[t.Any] | None) -> bool:
+        """
+        Return `True` if `path` can be applied with ``EXISTS`` subqueries:
+        it only contains relationships and one of them is a collection.
+        """
+        if not self.collection_exists or not path:
+            return False
+
+        for item in path:
+            if isinstance(item, Table) or not tools.is_relationship(item):
+                return False
+
+        return any(item.property.uselist for item in path)
+
+    def _get_path_exists(self, path: t.Sequence[t.Any], criterion: t.Any) -> t.Any:
+        """
+        Wrap `criterion`, written against the last model of `path`, in
+        correlated ``EXISTS`` subqueries following the relationships.
+        """
+        for item in reversed(path):
+            if item.property.uselist:
+                criterion = item.any(criterion)
+            else:
+                criterion = item.has(criterion)
+
+        return criterion
+
+    def _get_filter_exists(
+        self, flt: sqla_filters.BaseSQLAFilter, path: t.Sequence[t.Any], value: t.Any
+    ) -> t.Any | None:
+        """
+        Return the ``EXISTS`` clause applying `flt` through `path`, or
+        `None` if the filter does not add any criteria.
+        """
+        session = _get_deprecated_session(self.session)
+        criterion = flt.apply(session.query(literal_column("1")), value).whereclause
+
+        if criterion is None:
+            return None
+
+        clause = self._get_path_exists(path, criterion)
+
+        # an outer join matches the rows without related objects as well
+        if flt.matches_null(value):
+            clause = or_(clause, ~self._get_path_exists(path, None))
+
+        return clause
+
     # Scaffolding
     def scaffold_pk(self) -> t.Any | tuple[t.Any, ...]:
         """
@@ -580,10 +846,15 @@ class ModelView(BaseModelView):
         """
         self._sortable_joins = dict()
 
+        result: dict[T_COLUMN, T_COLUMN] = dict()
+
+        for name in self.column_collection_summaries or ():
+            result[name] = self._get_collection_count_expression(name)
+
         if self.column_sortable_list is None:
-            return self.scaffold_sortable_columns()
+            result.update(self.scaffold_sortable_columns())
+            return result
         else:
-            result: dict[T_COLUMN, T_COLUMN] = dict()
             for c in self.column_sortable_list:
                 if isinstance(c, tuple):
                     if isinstance(c[1], tuple):
@@ -684,6 +955,9 @@ class ModelView(BaseModelView):
         """
         if self.column_searchable_list:
             self._search_fields = []
+            self._search_modes = []
+
+            search_modes = self.column_search_modes or {}
 
             for name in self.column_searchable_list:
                 attr, joins = tools.get_field_with_path(
@@ -694,16 +968,23 @@ class ModelView(BaseModelView):
                 if not attr:
                     raise Exception(f"Failed to find field for search field: {name}")
 
+                mode = search_modes.get(name if isinstance(name, str) else attr.key)
+
+                if mode is not None and mode not in tools.SEARCH_MODES:
+                    raise Exception(f"Unsupported search mode {mode!r} for {name}")
+
                 if tools.is_hybrid_property(self.model, name):
                     column = attr
                     if isinstance(name, string_types):
                         column.key = name.split(".")[-1]
                     self._search_fields.append((column, joins))
+                    self._search_modes.append(mode)
                 else:
                     for column in tools.get_columns_for_field(attr):
                         self._search_fields.append((column, joins))
+                        self._search_modes.append(mode)
 
-        return bool(self.column_searchable_list)
+        return bool(self.column_searchable_list) or self.search_backend is not None
 
     def search_placeholder(self) -> str | None:
         """
@@ -950,43 +1231,342 @@ class ModelView(BaseModelView):
 
     def scaffold_auto_joins(self) -> list[t.Any]:
         """
-        Return a list of joined tables by going through the
-        displayed columns.
+        Return a list of loader options for the relations used by the
+        displayed and exported columns.
+
+        See `get_eager_load_plan` for the loading strategy of each relation.
         """
         if not self.column_auto_select_related:
             return []
 
-        relations = set()
+        columns = [c for c, _ in self._list_columns]
+        columns.extend(c for c, _ in self._export_columns)
 
-        for p in self._get_model_iterator():
-            if hasattr(p, "direction"):
-                # Check if it is pointing to same model
-                if p.mapper.class_ == self.model:
-                    continue
+        # Summarized collections are loaded by `get_collection_summaries`
+        summaries = self.column_collection_summaries or {}
+        columns = [c for c in columns if c not in summaries]
 
-                # Check if it is pointing to a differnet bind
-                source_bind = getattr(self.model, "__bind_key__", None)
-                target_bind = getattr(p.mapper.class_, "__bind_key__", None)
-                if source_bind != target_bind:
-                    continue
+        return self.get_eager_load_options(self.get_eager_load_plan(columns))
+
+    def _get_relation_path(self, column: T_COLUMN) -> list[RelationshipProperty[t.Any]]:
+        """
+        Return the relationships traversed by a (dotted) column name.
+        """
+        if not isinstance(column, str):
+            column = getattr(column, "key", None) or ""
+
+        mapper = self._manager.mapper
+        path = []
+
+        for name in column.split("."):
+            prop = mapper.attrs.get(name)
+
+            if not isinstance(prop, RelationshipProperty):
+                break
+
+            path.append(prop)
+            mapper = prop.mapper
+
+        return path
+
+    def get_eager_load_plan(self, columns: t.Iterable[T_COLUMN]) -> dict[str, str]:
+        """
+        Return the eager loading strategy of every relation used by
+        `columns`, keyed by relation path.
+
+        Relations are walked through dotted column names, so
+        ``author.company.name`` eager loads ``author`` and
+        ``author.company``. Scalar relations are loaded with
+        ``joinedload``, collections, self-referential relations and
+        relations to a different bind with ``selectinload``, so the number
+        of queries for a page does not depend on the number of rows.
+
+        For example, ``column_list = ('title', 'author.company.name',
+        'tags')`` gives::
+
+            {
+                'author': 'joinedload',
+                'author.company': 'joinedload',
+                'tags': 'selectinload',
+            }
+
+        The plans of the list and details views are logged at debug level
+        by the ``flask-admin.sqla`` logger.
+
+        :param columns:
+            Column names
+        """
+        plan: dict[str, str] = {}
+
+        for column in columns:
+            parent = self._manager.mapper
+            names = []
+
+            for prop in self._get_relation_path(column):
+                names.append(prop.key)
+
+                if prop.uselist or prop.mapper.class_ == parent.class_:
+                    strategy = "selectinload"
+                elif getattr(prop.mapper.class_, "__bind_key__", None) != getattr(
+                    parent.class_, "__bind_key__", None
+                ):
+                    strategy = "selectinload"
+                else:
+                    strategy = "joinedload"
+
+                plan.setdefault(".".join(names), strategy)
+                parent = prop.mapper
+
+        if plan:
+            log.debug("Eager loading plan of %s: %s", self.__class__.__name__, plan)
+
+        return plan
+
+    def get_eager_load_options(self, plan: dict[str, str]) -> list[LoaderOption]:
+        """
+        Return SQLAlchemy loader options for a plan returned by
+        `get_eager_load_plan`.
+
+        :param plan:
+            Loading strategy by relation path
+        """
+        options = []
+
+        for path in plan:
+            # Paths are loaded as part of their longest child path
+            if any(p.startswith(path + ".") for p in plan):
+                continue
+
+            option: t.Any = None
+            mapper = self._manager.mapper
+            names: list[str] = []
+
+            for name in path.split("."):
+                names.append(name)
+                attr = getattr(mapper.class_, name)
+                strategy = plan[".".join(names)]
+
+                if option is None:
+                    option = EAGER_LOADERS[strategy](attr)
+                else:
+                    option = getattr(option, strategy)(attr)
+
+                mapper = attr.property.mapper
+
+            options.append(option)
 
-                if p.direction.name in ["MANYTOONE", "MANYTOMANY"]:
-                    relations.add(p.key)
+        return options
 
-        joined = []
+    def scaffold_load_only_columns(self) -> list[t.Any]:
+        """
+        Return the column attributes loaded by the list view and export
+        when `column_load_only` is enabled.
+        """
+        mapper = self._manager.mapper
+
+        names: list[t.Any] = [c for c, _ in self._list_columns]
+        names.extend(c for c, _ in self._export_columns)
+        names.extend(self.column_load_extra_list or ())
+
+        props = [mapper.get_property_by_column(c) for c in mapper.primary_key]
 
-        for prop, _name in self._list_columns:
-            if prop in relations:
-                joined.append(getattr(self.model, prop))  # type: ignore[arg-type]
+        for name in names:
+            if not isinstance(name, str):
+                name = name.key
 
-        return joined
+            prop = mapper.attrs.get(name.split(".", 1)[0])
+
+            if isinstance(prop, ColumnProperty):
+                props.append(prop)
+            elif isinstance(prop, RelationshipProperty):
+                # Foreign keys are needed to lazy load the relation
+                for column in prop.local_columns:
+                    try:
+                        props.append(mapper.get_property_by_column(column))
+                    except UnmappedColumnError:
+                        pass
+
+        return [p.class_attribute for p in dict.fromkeys(props)]
 
     # AJAX foreignkey support
+    def _refresh_forms_cache(self) -> None:
+        # loaders of the relations that may switch to ajax, see
+        # `form_ajax_threshold`
+        self._form_threshold_ajax_refs: dict[str, QueryAjaxModelLoader] = {}
+        super()._refresh_forms_cache()
+
+    def _get_ajax_loader(
+        self, name: str
+    ) -> AjaxModelLoader | T_QUERY_AJAX_MODEL_LOADER | None:
+        return super()._get_ajax_loader(name) or self._form_threshold_ajax_refs.get(
+            name
+        )
+
     def _create_ajax_loader(
         self, name: str, options: dict[str, t.Any]
     ) -> QueryAjaxModelLoader:
         return create_ajax_loader(self.model, self.session, name, name, options)
 
+    # Collection summaries
+    def _get_collection_join(self, name: str) -> tuple[t.Any, t.Any, t.Any]:
+        """
+        Return aliases of the model and of the target of collection `name`,
+        and the relation between them.
+        """
+        attr = getattr(self.model, name)
+        parent = aliased(self.model)
+        target = aliased(attr.property.mapper.class_)
+
+        return parent, target, getattr(parent, name).of_type(target)
+
+    def _get_collection_count_expression(self, name: str) -> t.Any:
+        """
+        Return a correlated subquery counting the rows of collection `name`.
+        """
+        parent, target, relation = self._get_collection_join(name)
+        mapper = manager_of_class(self.model).mapper
+
+        pk_names = [mapper.get_property_by_column(c).key for c in mapper.primary_key]
+
+        return (
+            select(func.count())
+            .select_from(parent)
+            .join(relation)
+            .where(
+                and_(*(getattr(parent, k) == getattr(self.model, k) for k in pk_names))
+            )
+            .scalar_subquery()
+        )
+
+    def get_collection_summaries(
+        self, name: str, models: list[T_SQLALCHEMY_MODEL], limit: int
+    ) -> dict[t.Any, CollectionSummary]:
+        """
+        Return the number of rows and the first `limit` rows of collection
+        `name` for every model, keyed by model identity.
+
+        Related rows are ordered by primary key.
+
+        :param name:
+            Relation name
+        :param models:
+            Models of the current page
+        :param limit:
+            Number of related rows to load per model
+        """
+        summaries: dict[t.Any, CollectionSummary] = {
+            instance_state(m).identity: CollectionSummary(0, []) for m in models
+        }
+
+        if not summaries:
+            return summaries
+
+        session = _get_deprecated_session(self.session)
+
+        parent, target, relation = self._get_collection_join(name)
+        target_class = getattr(self.model, name).property.mapper.class_
+        target_mapper = manager_of_class(target_class).mapper
+
+        parent_pk = [
+            getattr(parent, self._manager.mapper.get_property_by_column(c).key)
+            for c in self._manager.mapper.primary_key
+        ]
+        target_pk = [
+            getattr(target, target_mapper.get_property_by_column(c).key)
+            for c in target_mapper.primary_key
+        ]
+
+        if len(parent_pk) == 1:
+            parent_filter = parent_pk[0].in_([i[0] for i in summaries])
+        else:
+            parent_filter = tools.tuple_operator_in(parent_pk, tuple(summaries))
+
+        if limit and self._supports_window_functions():
+            ranked = (
+                session.query(
+                    *(c.label(f"_parent_pk{i}") for i, c in enumerate(parent_pk)),
+                    target,
+                    func.row_number()
+                    .over(partition_by=parent_pk, order_by=target_pk)
+                    .label("_row_number"),
+                    func.count().over(partition_by=parent_pk).label("_count"),
+                )
+                .select_from(parent)
+                .join(relation)
+                .filter(parent_filter)
+                .subquery()
+            )
+            item = aliased(target_class, ranked, adapt_on_names=True)
+            ranked_pk = [ranked.c[f"_parent_pk{i}"] for i in range(len(parent_pk))]
+
+            rows = (
+                session.query(ranked.c._count, item, *ranked_pk)
+                .filter(ranked.c._row_number <= limit)
+                .order_by(*ranked_pk, ranked.c._row_number)
+            )
+
+            for count, obj, *pk in rows:
+                summary = summaries[tuple(pk)]
+                summary.count = count
+                summary.items.append(obj)
+
+            return summaries
+
+        counts = (
+            session.query(*parent_pk, func.count())
+            .select_from(parent)
+            .join(relation)
+            .filter(parent_filter)
+            .group_by(*parent_pk)
+        )
+
+        for *pk, count in counts:
+            summaries[tuple(pk)].count = count
+
+        if limit:
+            # No window functions, load the first rows model by model
+            for identity, summary in summaries.items():
+                if summary.count:
+                    parent_match = zip(parent_pk, identity, strict=True)
+                    summary.items = (
+                        session.query(target)
+                        .select_from(parent)
+                        .join(relation)
+                        .filter(*(c == v for c, v in parent_match))
+                        .order_by(*target_pk)
+                        .limit(limit)
+                        .all()
+                    )
+
+        return summaries
+
+    def _apply_collection_summaries(self, models: list[T_SQLALCHEMY_MODEL]) -> None:
+        """
+        Load `column_collection_summaries` for the models of a page.
+        """
+        for name, limit in (self.column_collection_summaries or {}).items():
+            summaries = self.get_collection_summaries(name, models, limit)
+
+            for model in models:
+                state = instance_state(model)
+                state.info.setdefault(COLLECTION_SUMMARIES_KEY, {})[name] = summaries[
+                    state.identity
+                ]
+
+    def _get_field_value(self, model: T_SQLALCHEMY_MODEL, name: T_COLUMN) -> t.Any:
+        if (
+            self.column_collection_summaries
+            and name in self.column_collection_summaries
+        ):
+            info = instance_state(model).info
+
+            if name not in info.get(COLLECTION_SUMMARIES_KEY, {}):
+                self._apply_collection_summaries([model])
+
+            return info[COLLECTION_SUMMARIES_KEY][name]
+
+        return super()._get_field_value(model, name)
+
     # Database-related API
     def get_query(self) -> T_SQLALCHEMY_QUERY:
         """
@@ -1022,6 +1602,139 @@ class ModelView(BaseModelView):
         session = _get_deprecated_session(self.session)
         return session.query(func.count("*")).select_from(self.model)
 
+    def _get_bind(self) -> t.Any:
+        """
+        Return the engine or connection the model is bound to.
+        """
+        session = _get_deprecated_session(self.session)
+        return session.get_bind(mapper=self._manager.mapper)
+
+    def get_capped_count(self, count_query: T_SQLALCHEMY_QUERY, cap: int) -> int:
+        """
+        Count the rows matched by `count_query`, but stop counting after
+        `cap` rows. Returns at most ``cap + 1``.
+
+        The columns of `count_query` are replaced with a constant and the
+        rows are counted from a ``LIMIT`` subquery, so the database can stop
+        scanning as soon as the limit is reached.
+
+        :param count_query:
+            Count query with search and filters applied
+        :param cap:
+            Maximum number of rows to count
+        """
+        session = _get_deprecated_session(self.session)
+        subquery = (
+            count_query.with_entities(literal_column("1")).limit(cap + 1).subquery()
+        )
+        return session.query(func.count()).select_from(subquery).scalar() or 0
+
+    def _get_explain_statement(
+        self, count_query: T_SQLALCHEMY_QUERY, dialect: t.Any
+    ) -> tuple[str, t.Any]:
+        """
+        Return the ``EXPLAIN`` statement of `count_query` and its parameters
+        in the paramstyle of the driver of `dialect`.
+        """
+        statement = count_query.with_entities(literal_column("1")).statement
+        # expanding parameters of IN clauses are rendered as one parameter
+        # per value, as EXPLAIN runs the statement text as is
+        compiled = statement.compile(
+            dialect=dialect, compile_kwargs={"render_postcompile": True}
+        )
+        params = compiled.params
+
+        if compiled.positional:
+            params = tuple(params[name] for name in compiled.positiontup or ())
+
+        return f"EXPLAIN (FORMAT JSON) {compiled}", params
+
+    def get_estimated_count(self, count_query: T_SQLALCHEMY_QUERY) -> int | None:
+        """
+        Return the row estimate of the database query planner for
+        `count_query`, or `None` if it is not available.
+
+        Only PostgreSQL is supported: the estimate is read from the
+        ``EXPLAIN`` output, which for an unfiltered table is based on
+        ``pg_class.reltuples``.
+
+        :param count_query:
+            Count query with search and filters applied
+        """
+        bind = self._get_bind()
+        if bind.dialect.name != "postgresql":
+            return None
+
+        sql, params = self._get_explain_statement(count_query, bind.dialect)
+
+        session = _get_deprecated_session(self.session)
+        connection = session.connection(bind_arguments={"mapper": self._manager.mapper})
+        plan = connection.exec_driver_sql(sql, params).scalar()
+
+        if plan is None:
+            return None
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _get_list_count(self, count_query: T_SQLALCHEMY_QUERY) -> int:
+        """
+        Run the count query according to `count_mode`.
+        """
+        if self.count_mode == "capped":
+            return self.get_capped_count(count_query, self.count_cap)
+        elif self.count_mode == "estimated":
+            estimate = self.get_estimated_count(count_query)
+            if estimate is not None:
+                return EstimatedCount(estimate)
+
+        return count_query.scalar() or 0
+
+    def _supports_window_functions(self) -> bool:
+        """
+        Return `True` if the database supports window functions, which
+        are required by `window_count`.
+        """
+        dialect = self._get_bind().dialect
+
+        if dialect.name == "mysql" and getattr(dialect, "is_mariadb", False):
+            min_version: tuple[int, ...] | None = (10, 2)
+        else:
+            min_version = WINDOW_FUNCTION_VERSIONS.get(dialect.name)
+
+        if min_version is None:
+            return False
+
+        version = dialect.server_version_info
+        if version is None and dialect.name == "sqlite":
+            version = dialect.dbapi.sqlite_version_info
+
+        return version is not None and tuple(version) >= min_version
+
+    def _get_window_count_list(
+        self, query: T_SQLALCHEMY_QUERY, filtered_query: T_SQLALCHEMY_QUERY
+    ) -> tuple[int, list[T_SQLALCHEMY_MODEL]]:
+        """
+        Fetch the page of `query` together with the total number of rows
+        using ``count(*) OVER ()``.
+
+        Pages past the last row do not return the total, so the rows of
+        `filtered_query` are counted separately in that case.
+
+        :param query:
+            List query with sorting and pagination applied
+        :param filtered_query:
+            List query with search and filters applied, used to count rows
+            of empty pages
+        """
+        rows = query.add_columns(func.count().over()).all()
+
+        if rows:
+            return rows[0][-1], [row[0] for row in rows]
+
+        return filtered_query.order_by(None).count(), []
+
     def _order_by(
         self,
         query: T_SQLALCHEMY_QUERY,
@@ -1107,6 +1820,22 @@ class ModelView(BaseModelView):
 
         return query, joins
 
+    def _get_search_criterion(
+        self, column: t.Any, mode: str | None, term: str
+    ) -> t.Any | None:
+        """
+        Return the criterion matching `term` against `column` with the
+        search `mode`, or `None` if the column cannot match the term.
+
+        :param column:
+            Column to search
+        :param mode:
+            Search mode from `column_search_modes`
+        :param term:
+            Search term
+        """
+        return tools.get_search_criterion(column, mode, term)
+
     def _apply_search(
         self,
         query: T_SQLALCHEMY_QUERY,
@@ -1123,18 +1852,39 @@ class ModelView(BaseModelView):
         """
         Apply search to a query.
         """
+        if self.search_backend is not None:
+            query = self.search_backend.apply(query, search)
+
+            if count_query is not None:
+                count_query = self.search_backend.apply(count_query, search)
+
+            return query, count_query, joins, count_joins
+
         terms = search.split(" ")
 
         for term in terms:
             if not term:
                 continue
 
-            stmt = tools.parse_like_term(term)
+            filter_stmt: list[t.Any] = []
+            count_filter_stmt: list[t.Any] = []
+
+            for idx, (field, path) in enumerate(self._search_fields):  # type: ignore[arg-type]
+                # `_search_fields` may be filled by a custom `init_search`
+                mode = (
+                    self._search_modes[idx] if idx < len(self._search_modes) else None
+                )
+                clause = self._get_search_criterion(field, mode, term)
+
+                if clause is None:
+                    continue
 
-            filter_stmt: list[BinaryExpression[bool]] = []
-            count_filter_stmt: list[BinaryExpression[t.Any]] = []
+                if self._is_collection_path(path):
+                    clause = self._get_path_exists(path, clause)
+                    filter_stmt.append(clause)
+                    count_filter_stmt.append(clause)
+                    continue
 
-            for field, path in self._search_fields:  # type: ignore[union-attr]
                 query, joins, alias = self._apply_path_joins(
                     query, joins, path, inner_join=False
                 )
@@ -1146,21 +1896,26 @@ class ModelView(BaseModelView):
                         count_query, count_joins, path, inner_join=False
                     )
 
-                column = field if alias is None else getattr(alias, field.key)
-                filter_stmt.append(sql_cast(column, Unicode).ilike(stmt))
+                if alias is not None:
+                    clause = self._get_search_criterion(
+                        getattr(alias, field.key), mode, term
+                    )
+                filter_stmt.append(clause)
 
-                if count_filter_stmt is not None:
-                    column = (
-                        field
-                        if count_alias is None
-                        else getattr(count_alias, field.key)
+                if count_alias is not None:
+                    clause = self._get_search_criterion(
+                        getattr(count_alias, field.key), mode, term
                     )
-                    count_filter_stmt.append(sql_cast(column, Unicode).ilike(stmt))
+                count_filter_stmt.append(clause)
 
-            query = query.filter(or_(*filter_stmt))
+            # no searchable column can match the term, e.g. a word in a
+            # search of numeric columns
+            query = query.filter(or_(*filter_stmt) if filter_stmt else false())
 
             if count_query is not None:
-                count_query = count_query.filter(or_(*count_filter_stmt))
+                count_query = count_query.filter(
+                    or_(*count_filter_stmt) if count_filter_stmt else false()
+                )
 
         return query, count_query, joins, count_joins
 
@@ -1189,6 +1944,17 @@ class ModelView(BaseModelView):
                 filter_key = flt.key_name or flt.column
                 path = self._filter_joins.get(filter_key, [])  # type: ignore[arg-type]
 
+                if self._is_collection_path(path):
+                    clause = self._get_filter_exists(flt, path, flt.clean(value))
+
+                    if clause is not None:
+                        query = query.filter(clause)
+
+                        if count_query is not None:
+                            count_query = count_query.filter(clause)
+
+                    continue
+
                 query, joins, alias = self._apply_path_joins(
                     query, joins, path, inner_join=False
                 )
@@ -1227,6 +1993,98 @@ class ModelView(BaseModelView):
 
         return query, count_query, joins, count_joins
 
+    def _get_filter_key(self, flt: t.Any) -> t.Any:
+        if isinstance(flt, sqla_filters.BaseSQLAFilter):
+            return flt.key_name or flt.column
+
+        return None
+
+    def get_facet_counts(
+        self, search: str | None, filters: t.Sequence[T_FILTER] | None
+    ) -> dict[str, dict[str, int]]:
+        """
+        Count the rows per option of the equality filters with options,
+        like boolean and enum filters, with one ``GROUP BY`` query each.
+
+        The current search and filters are applied, except the filters of
+        the faceted column itself so that all its options keep a count.
+
+        Filters without options are not counted, including the filters
+        scaffolded for the text and numeric columns of a relation in
+        `column_filters`. To facet a relation, use an equality filter with
+        `options` on its foreign key column.
+
+        :param search:
+            Search query
+        :param filters:
+            List of filter tuples
+        """
+        result: dict[str, dict[str, int]] = {}
+
+        for idx, flt in enumerate(self._filters or ()):
+            if not isinstance(flt, sqla_filters.FilterEqual):
+                continue
+
+            options = flt.get_cached_options(self)
+
+            if not options:
+                continue
+
+            key = self._get_filter_key(flt)
+            other_filters = [
+                f
+                for f in filters or ()
+                if not self._is_same_filter_key(
+                    key,
+                    self._get_filter_key(self._filters[f[0]]),  # type: ignore[index]
+                )
+            ]
+
+            counts = dict.fromkeys((as_unicode(k) for k, _ in options), 0)
+
+            for count, value in self._get_facet_query(flt, search, other_filters).all():
+                value = flt.get_facet_value(value)
+
+                if value in counts:
+                    counts[value] += count
+
+            result[self.get_filter_arg(idx, flt)] = counts
+
+        return result
+
+    def _is_same_filter_key(self, key: t.Any, other: t.Any) -> bool:
+        # columns overload ==, compare them by identity
+        if isinstance(key, str) or isinstance(other, str):
+            return key == other
+
+        return key is other
+
+    def _get_facet_query(
+        self,
+        flt: sqla_filters.BaseSQLAFilter,
+        search: str | None,
+        filters: t.Sequence[T_FILTER],
+    ) -> T_SQLALCHEMY_QUERY:
+        """
+        Return a query counting the rows per value of the filter column.
+        """
+        joins: dict[tuple[bool, t.Any], t.Any] = {}
+        query = self.get_count_query()
+
+        if self._search_supported and search:
+            query, _, joins, _ = self._apply_search(query, None, joins, {}, search)
+
+        if filters:
+            query, _, joins, _ = self._apply_filters(query, None, joins, {}, filters)
+
+        path = self._filter_joins.get(self._get_filter_key(flt), [])
+        query, joins, alias = self._apply_path_joins(
+            query, joins, path, inner_join=False
+        )
+
+        column = flt.get_column(alias)
+        return query.add_columns(column).group_by(column)
+
     def _apply_pagination(
         self,
         query: T_SQLALCHEMY_QUERY,
@@ -1244,6 +2102,156 @@ class ModelView(BaseModelView):
 
         return query
 
+    def _get_keyset_columns(
+        self, sort_column: T_COLUMN | None, sort_desc: bool
+    ) -> list[tuple[Column[t.Any], str, bool]] | None:
+        """
+        Return the seek key for keyset pagination as a list of
+        `(column, attribute name, descending)` tuples.
+
+        The primary key is always appended to make the key unique. Returns
+        `None` if the sort order can not be used for keyset pagination:
+        sorting on related, nullable or computed columns falls back to
+        offset pagination.
+
+        :param sort_column:
+            Sort column name
+        :param sort_desc:
+            Descending or ascending sort
+        """
+        fields: list[tuple[t.Any, bool]] = []
+
+        if sort_column is not None:
+            if sort_column in self._sortable_columns:
+                if self._sortable_joins.get(sort_column):
+                    return None
+
+                sort_field = self._sortable_columns[sort_column]
+                if isinstance(sort_field, list):
+                    fields.extend((f, sort_desc) for f in sort_field)
+                else:
+                    fields.append((sort_field, sort_desc))
+        else:
+            for attr, joins, direction in self._get_default_order():
+                if joins:
+                    return None
+
+                fields.append((attr, direction))
+
+        mapper = self._manager.mapper
+        result: list[tuple[Column[t.Any], str, bool]] = []
+
+        for field, is_desc in fields:
+            column: t.Any
+            if isinstance(field, Column):
+                column = field
+            elif hasattr(field, "property") and hasattr(field.property, "columns"):
+                columns = field.property.columns
+                if len(columns) != 1:
+                    return None
+
+                column = columns[0]
+            else:
+                return None
+
+            if not isinstance(column, Column) or column.nullable:
+                return None
+
+            if tools.need_join(self.model, column.table):
+                return None
+
+            try:
+                key = mapper.get_property_by_column(column).key
+            except UnmappedColumnError:
+                return None
+
+            result.append((column, key, is_desc))
+
+        pk_desc = result[0][2] if result else False
+        for column in mapper.primary_key:
+            if not any(column is c for c, _, _ in result):
+                key = mapper.get_property_by_column(column).key
+                result.append((column, key, pk_desc))
+
+        return result
+
+    def _apply_keyset_pagination(
+        self,
+        query: T_SQLALCHEMY_QUERY,
+        keyset_columns: list[tuple[Column[t.Any], str, bool]],
+        cursor: str | None,
+        page: int | None,
+        page_size: int | None,
+    ) -> tuple[T_SQLALCHEMY_QUERY, bool]:
+        """
+        Apply keyset ordering, seek condition and limit to the query.
+
+        Returns the query and a flag telling if the rows are fetched in
+        reverse order (previous page) and need to be reversed.
+
+        :param query:
+            Query
+        :param keyset_columns:
+            Seek key from `_get_keyset_columns`
+        :param cursor:
+            Cursor from `get_list_cursor`. If missing or invalid, `page` is
+            used as a regular offset.
+        :param page:
+            Page number
+        :param page_size:
+            Number of results
+        """
+        backwards = False
+
+        seek = None
+        if cursor:
+            seek = tools.decode_cursor(cursor, [c for c, _, _ in keyset_columns])
+
+        if seek is not None:
+            values, backwards = seek
+            query = query.filter(
+                tools.get_keyset_filter(
+                    [(c, is_desc) for c, _, is_desc in keyset_columns],
+                    values,
+                    backwards,
+                )
+            )
+            page = None
+
+        for column, _, is_desc in keyset_columns:
+            if is_desc != backwards:
+                query = query.order_by(desc(column))
+            else:
+                query = query.order_by(column)
+
+        return self._apply_pagination(query, page, page_size), backwards
+
+    def get_list_cursor(
+        self,
+        model: T_SQLALCHEMY_MODEL,
+        sort_field: T_COLUMN | None,
+        sort_desc: bool,
+        backwards: bool = False,
+    ) -> str | None:
+        """
+        Return an opaque keyset pagination cursor pointing at `model`.
+
+        :param model:
+            Model instance to seek from
+        :param sort_field:
+            Sort column name
+        :param sort_desc:
+            Descending or ascending sort
+        :param backwards:
+            If set to True, the cursor fetches the rows preceding `model`
+        """
+        keyset_columns = self._get_keyset_columns(sort_field, sort_desc)
+        if keyset_columns is None:
+            return None
+
+        values = [getattr(model, key) for _, key, _ in keyset_columns]
+        return tools.encode_cursor(values, backwards)
+
     def get_list(  # type: ignore[override]
         self,
         page: int | None,
@@ -1253,6 +2261,8 @@ class ModelView(BaseModelView):
         filters: t.Sequence[T_FILTER] | None,
         execute: bool = True,
         page_size: int | None = None,
+        cursor: str | None = None,
+        with_count: bool = True,
     ) -> tuple[int | None, list[T_SQLALCHEMY_MODEL]]:
         """
         Return records from the database.
@@ -1273,6 +2283,14 @@ class ModelView(BaseModelView):
             Number of results. Defaults to ModelView's page_size. Can be
             overriden to change the page_size limit. Removing the page_size
             limit requires setting page_size to 0 or False.
+        :param cursor:
+            Keyset pagination cursor returned by `get_list_cursor`. Only
+            used when `keyset_pagination` is enabled. When `execute` is
+            `False`, a query for the previous page returns rows in
+            reverse order.
+        :param with_count:
+            Count the matching rows. If `False`, the returned count is
+            `None` and no count query is run.
         """
 
         # Will contain join paths with optional aliased object
@@ -1280,7 +2298,33 @@ class ModelView(BaseModelView):
         count_joins: dict[tuple[bool, t.Any], t.Any] = {}
 
         query = self.get_query()
-        count_query = self.get_count_query() if not self.simple_list_pager else None
+        count_query = (
+            self.get_count_query()
+            if with_count and not self.simple_list_pager
+            else None
+        )
+
+        keyset_columns = None
+        if self.keyset_pagination:
+            keyset_columns = self._get_keyset_columns(sort_column, sort_desc)
+
+        count = None
+
+        # Count rows with the page query instead of a separate count query
+        window_count = (
+            execute
+            and count_query is not None
+            and keyset_columns is None
+            and self.count_mode == "exact"
+            and self.window_count
+            and self._supports_window_functions()
+        )
+        if window_count and self.count_cache is not None:
+            count = self.count_cache.get(self.get_count_cache_key(search, filters))
+            window_count = count is None
+
+        if window_count or count is not None:
+            count_query = None
 
         # Ignore eager-loaded relations (prevent unnecessary joins)
         # TODO: Separate join detection for query and count query?
@@ -1302,24 +2346,159 @@ class ModelView(BaseModelView):
             )
 
         # Calculate number of rows if necessary
-        count = count_query.scalar() if count_query else None
+        if count_query is not None:
+            count = self.get_cached_count(
+                search, filters, lambda: self._get_list_count(count_query)
+            )
+
+        filtered_query = query
 
         # Auto join
         for j in self._auto_joins:
-            query = query.options(joinedload(j))
+            if not isinstance(j, LoaderOption):
+                j = joinedload(j)
+
+            query = query.options(j)
+
+        if self._load_only_columns:
+            query = query.options(load_only(*self._load_only_columns))
 
-        # Sorting
-        query, joins = self._apply_sorting(query, joins, sort_column, sort_desc)
+        backwards = False
+        if keyset_columns is None:
+            # Order by relevance when no column is selected
+            if sort_column is None and search and self.search_backend is not None:
+                order_by = self.search_backend.get_order_by(search)
 
-        # Pagination
-        query = self._apply_pagination(query, page, page_size)
+                if order_by is not None:
+                    query = query.order_by(order_by)
+
+            # Sorting
+            query, joins = self._apply_sorting(query, joins, sort_column, sort_desc)
+
+            # Pagination
+            query = self._apply_pagination(query, page, page_size)
+        else:
+            query, backwards = self._apply_keyset_pagination(
+                query, keyset_columns, cursor, page, page_size
+            )
 
         # Execute if needed
-        if execute:
+        if window_count:
+            count, query = self._get_window_count_list(  # type: ignore[assignment]
+                query, filtered_query
+            )
+
+            if self.count_cache is not None:
+                self.count_cache.set(self.get_count_cache_key(search, filters), count)
+        elif execute:
             query = query.all()  # type: ignore[assignment]
 
+            if backwards:
+                query.reverse()  # type: ignore[attr-defined]
+
+        if execute and self.column_collection_summaries:
+            self._apply_collection_summaries(query)  # type: ignore[arg-type]
+
         return count, query  # type: ignore[return-value]
 
+    def get_list_iter(
+        self,
+        sort_column: T_COLUMN | None,
+        sort_desc: bool,
+        search: str | None,
+        filters: t.Sequence[T_FILTER] | None,
+        page_size: int | None = None,
+        batch_size: int = 1000,
+    ) -> t.Iterator[T_SQLALCHEMY_MODEL]:
+        """
+        Iterate over the records without loading them all into memory.
+
+        Rows are fetched with `Query.yield_per`, which uses a server-side
+        cursor where the driver supports one. Models are expunged from the
+        session once their batch has been consumed, so the identity map
+        does not grow with the size of the result.
+
+        :param sort_column:
+            Sort column name
+        :param sort_desc:
+            Descending or ascending sort
+        :param search:
+            Search query
+        :param filters:
+            List of filter tuples
+        :param page_size:
+            Maximum number of records. Set to 0 or False to iterate over
+            all records.
+        :param batch_size:
+            Number of records fetched from the database at a time.
+        """
+        _, query = self.get_list(
+            0,
+            sort_column,
+            sort_desc,
+            search,
+            filters,
+            execute=False,
+            page_size=page_size,
+            with_count=False,
+        )
+        session = _get_deprecated_session(self.session)
+
+        try:
+            result = iter(query.yield_per(batch_size))  # type: ignore[attr-defined]
+            batch = list(islice(result, batch_size))
+        except InvalidRequestError:
+            # Joined eager loading of collections can't be combined with
+            # yield_per, fall back to loading all rows at once
+            result = iter(query)
+            batch = list(islice(result, batch_size))
+
+        while batch:
+            if self.column_collection_summaries:
+                self._apply_collection_summaries(batch)
+
+            yield from batch
+
+            for model in batch:
+                if model in session:
+                    session.expunge(model)
+
+            batch = list(islice(result, batch_size))
+
+    def get_export_arrow_type(self, name: T_COLUMN) -> t.Any | None:
+        """
+        Return the Arrow type of a column in the Arrow based exports,
+        derived from the SQL type of the model column so it fits the values
+        of all rows. Columns with choices or an export formatter, and other
+        attributes than columns of the model, are inferred from their values.
+
+        :param name:
+            Field name
+        """
+        if self.column_formatters_export and name in self.column_formatters_export:
+            return None
+
+        if name in self._column_choices_map:
+            return None
+
+        attr = getattr(self.model, name, None) if isinstance(name, str) else name
+        prop = getattr(attr, "property", None)
+
+        if not isinstance(prop, ColumnProperty) or len(prop.columns) != 1:
+            return None
+
+        column = prop.columns[0]
+
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return None
+
+        if self._get_type_formatter(self._column_type_formatters_native, python_type):
+            return None
+
+        return tools.get_arrow_type(column)
+
     def get_one(self, id: t.Any) -> t.Any:
         """
         Return a single model by its id.
@@ -1336,7 +2515,22 @@ class ModelView(BaseModelView):
             Model id
         """
         session = _get_deprecated_session(self.session)
-        return session.get(self.model, tools.iterdecode(id))
+        return session.get(
+            self.model, tools.iterdecode(id), options=self._details_loads
+        )
+
+    def get_many(self, ids: t.Sequence[t.Any]) -> list[T_SQLALCHEMY_MODEL]:
+        """
+        Return the models matching a list of ids with a single `IN` query.
+
+        :param ids:
+            List of model ids
+        """
+        if not ids:
+            return []
+
+        query = tools.get_query_for_ids(self.get_query(), self.model, tuple(ids))
+        return query.all()
 
     # Error handler
     def handle_view_exception(self, exc: Exception) -> bool:
@@ -1397,7 +2591,7 @@ class ModelView(BaseModelView):
 
             return False
         else:
-            self.after_model_change(form, model, True)
+            self._after_model_change(form, model, True)
 
         return model
 
@@ -1427,7 +2621,38 @@ class ModelView(BaseModelView):
 
             return False
         else:
-            self.after_model_change(form, model, False)
+            self._after_model_change(form, model, False)
+
+        return True
+
+    def update_models(self, updates: list[tuple[Form, T_SQLALCHEMY_MODEL]]) -> bool:
+        """
+        Update several models and commit them in one transaction.
+
+        :param updates:
+            List of (form, model) pairs
+        """
+        session = _get_deprecated_session(self.session)
+        try:
+            for form, model in updates:
+                form.populate_obj(model)
+                self._on_model_change(form, model, False)
+
+            session.commit()
+        except Exception as ex:
+            if not self.handle_view_exception(ex):
+                flash(
+                    gettext("Failed to update record. %(error)s", error=str(ex)),
+                    "error",
+                )
+                log.exception("Failed to update record.")
+
+            session.rollback()
+
+            return False
+        else:
+            for form, model in updates:
+                self._after_model_change(form, model, False)
 
         return True
 
@@ -1456,7 +2681,7 @@ class ModelView(BaseModelView):
 
             return False
         else:
-            self.after_model_delete(model)
+            self._after_model_delete(model)
 
         return True
 
@@ -1492,6 +2717,7 @@ class ModelView(BaseModelView):
 
             session = _get_deprecated_session(self.session)
             session.commit()
+            self.invalidate_count_cache()
 
             flash(
                 ngettext(
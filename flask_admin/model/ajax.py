@@ -1,6 +1,8 @@
 import typing as t
 
 from flask_admin._types import T_ORM_MODEL
+from flask_admin.model.cache import BaseCache
+from flask_admin.model.cache import MemoryCache
 
 DEFAULT_PAGE_SIZE = 10
 
@@ -16,10 +18,30 @@ class AjaxModelLoader:
 
         :param name:
             Field name
+        :param minimum_input_length:
+            Shortest search term sent to `get_list`, defaults to 1. Shorter
+            terms return no results.
+        :param cache_timeout:
+            Number of seconds lookup results are cached, both by the loader
+            and by the browser. Disabled by default.
+        :param cache_size:
+            Maximum number of cached lookups, defaults to 1000
+        :param cache:
+            :class:`~flask_admin.model.cache.BaseCache` instance used
+            instead of a per-loader in-memory cache
         """
         self.name = name
         self.options = options
 
+        self.minimum_input_length = int(options.get("minimum_input_length", 1))
+        self.cache_timeout: float | None = options.get("cache_timeout")
+
+        self.cache: BaseCache | None = options.get("cache")
+        if self.cache is None and self.cache_timeout:
+            self.cache = MemoryCache(
+                self.cache_timeout, options.get("cache_size", 1000)
+            )
+
     def format(self, model: T_ORM_MODEL | None) -> tuple[t.Any, str] | None:
         """
         Return (id, name) tuple from the model.
@@ -35,6 +57,27 @@ class AjaxModelLoader:
         """
         raise NotImplementedError()
 
+    def get_many(self, pks: t.Iterable[t.Any]) -> list[t.Any]:
+        """
+        Find models by their primary keys. Primary keys that do not match
+        a model are skipped and the order of the result is not guaranteed.
+
+        By default, calls `get_one` for every primary key. Loaders override
+        this to load all models with a single query.
+
+        :param pks:
+            Primary key values
+        """
+        models = []
+
+        for pk in pks:
+            model = self.get_one(pk)
+
+            if model is not None:
+                models.append(model)
+
+        return models
+
     def get_list(
         self, query: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE
     ) -> list[T_ORM_MODEL]:
@@ -51,3 +94,64 @@ class AjaxModelLoader:
             Limit
         """
         raise NotImplementedError()
+
+    def get_cache_key(self, term: str, offset: int, limit: int) -> tuple[t.Any, ...]:
+        """
+        Return the cache key of the lookup results.
+
+        The key identifies the loader by its class, model and name, so
+        loaders sharing a `cache` do not return each other's results.
+        Override it if loaders with the same model and name search
+        differently.
+
+        :param term:
+            Search term
+        :param offset:
+            Offset
+        :param limit:
+            Limit
+        """
+        model = getattr(self, "model", None)
+        model_name = getattr(model, "__name__", None)
+
+        return (
+            type(self).__module__,
+            type(self).__qualname__,
+            model_name,
+            self.name,
+            term,
+            offset,
+            limit,
+        )
+
+    def get_lookup(
+        self, term: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE
+    ) -> list[tuple[t.Any, str] | None]:
+        """
+        Return the formatted ``(id, name)`` tuples of the models matching
+        `term`, as sent by the ajax lookup endpoint.
+
+        Terms shorter than `minimum_input_length` return no results, other
+        results are cached under `get_cache_key` when a cache is set.
+
+        :param term:
+            Search term
+        :param offset:
+            Offset
+        :param limit:
+            Limit
+        """
+        if len(term) < self.minimum_input_length:
+            return []
+
+        if self.cache is None:
+            return [self.format(m) for m in self.get_list(term, offset, limit)]
+
+        key = self.get_cache_key(term, offset, limit)
+        data = self.cache.get(key)
+
+        if data is None:
+            data = [self.format(m) for m in self.get_list(term, offset, limit)]
+            self.cache.set(key, data)
+
+        return data
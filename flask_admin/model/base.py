@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import csv
+import datetime
 import inspect
+import io
 import mimetypes
 import re
+import tempfile
 import time
 import typing as t
 import warnings
+import zlib
 from collections import OrderedDict
+from decimal import Decimal
+from itertools import islice
 from math import ceil
 
 from flask import abort
@@ -20,9 +26,12 @@ from flask import request
 from flask import stream_with_context
 from jinja2 import pass_context
 from jinja2.runtime import Context
+from markupsafe import escape
 from markupsafe import Markup
 from werkzeug import Response
+from werkzeug.datastructures import MultiDict
 from werkzeug.utils import secure_filename
+from werkzeug.wsgi import wrap_file
 
 from .._types import T_COLUMN
 from .._types import T_COLUMN_LIST
@@ -30,10 +39,12 @@ from .._types import T_COLUMN_TYPE_FORMATTERS
 from .._types import T_FIELD_ARGS_VALIDATORS_FILES
 from .._types import T_FILTER
 from .._types import T_INSTRUMENTED_ATTRIBUTE
+from .._types import T_OPTION_LIST
 from .._types import T_ORM_MODEL
 from .._types import T_QUERY_AJAX_MODEL_LOADER
 from .._types import T_RESPONSE
 from .._types import T_RULES_SEQUENCE
+from .._types import T_TYPE_FORMATTER
 from .._types import T_WIDGET
 from ..form.rules import RuleSet
 from .filters import BaseFilter
@@ -43,6 +54,18 @@ try:
     import tablib
 except ImportError:
     tablib = None
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
 from typing import TypeGuard
 
 from wtforms.fields import HiddenField
@@ -74,12 +97,38 @@ from flask_admin.helpers import validate_form_on_submit
 from flask_admin.model import filters
 from flask_admin.model import template
 from flask_admin.model import typefmt
+from flask_admin.tools import make_rec_getattr
 from flask_admin.tools import rec_getattr
 
 from .ajax import AjaxModelLoader
+from .cache import BaseCache
+from .form import ListForms
+from .form import trim_list_form
 from .helpers import get_mdict_item_or_list
 from .helpers import prettify_name
 
+# Values kept as they are by the Arrow based exports, others are exported as strings
+ARROW_EXPORT_NATIVE_TYPES = frozenset(
+    (
+        bool,
+        int,
+        float,
+        Decimal,
+        str,
+        bytes,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+    )
+)
+
+# Export types written with pyarrow and their mime types
+ARROW_EXPORT_TYPES = {
+    "arrow": "application/vnd.apache.arrow.file",
+    "parquet": "application/vnd.apache.parquet",
+}
+
 # Used to generate filter query string name
 filter_char_re = re.compile("[^a-z0-9 ]")
 filter_compact_re = re.compile(" +")
@@ -99,6 +148,7 @@ class ViewArgs:
         search: str | None = None,
         filters: t.Sequence[T_FILTER] | None = None,
         extra_args: dict[str, t.Any] | None = None,
+        cursor: str | None = None,
     ) -> None:
         self.page = page
         self.page_size = page_size
@@ -106,10 +156,14 @@ class ViewArgs:
         self.sort_desc = bool(sort_desc)
         self.search = search
         self.filters = filters
+        self.cursor = cursor
 
         if not self.search:
             self.search = None
 
+        if not self.cursor:
+            self.cursor = None
+
         self.extra_args = extra_args or dict()
 
     def clone(self, **kwargs: t.Any) -> ViewArgs:
@@ -125,10 +179,20 @@ class ViewArgs:
         kwargs.setdefault("search", self.search)
         kwargs.setdefault("filters", flt)
         kwargs.setdefault("extra_args", dict(self.extra_args))
+        kwargs.setdefault("cursor", self.cursor)
 
         return ViewArgs(**kwargs)
 
 
+class EstimatedCount(int):
+    """
+    Row count estimated by the data source rather than counted.
+
+    Returned by `get_list` when `count_mode` is set to ``'estimated'`` and the
+    backend was able to get an estimate. Behaves like a regular `int`.
+    """
+
+
 class FilterGroup:
     def __init__(self, label: str) -> None:
         self.label = label
@@ -137,13 +201,22 @@ class FilterGroup:
     def append(self, filter: dict[t.Any, t.Any]) -> None:
         self.filters.append(filter)
 
-    def non_lazy(self) -> tuple[str, list[dict[str, t.Any]]]:
+    def non_lazy(
+        self, view: BaseModelView | None = None
+    ) -> tuple[str, list[dict[str, t.Any]]]:
         filters = []
         for item in self.filters:
             copy = dict(item)
             copy["operation"] = as_unicode(copy["operation"])
-            options = copy["options"]
-            if options:
+            flt = copy.pop("filter")
+            options = flt.get_cached_options(view) or None
+            copy["options"] = None
+
+            if view is not None and view._is_filter_options_ajax(flt, options):
+                copy["options_url"] = view.get_url(
+                    ".ajax_filter_options", name=copy["arg"]
+                )
+            elif options:
                 copy["options"] = [(k, text_type(v)) for k, v in options]
 
             filters.append(copy)
@@ -225,6 +298,9 @@ class BaseModelView(BaseView, ActionsMixin):
     details_template: str = "admin/model/details.html"
     """Default details view template"""
 
+    list_row_actions_template: str = "admin/model/list_row_actions.html"
+    """Template rendering the row actions of `api_list_view` as JSON"""
+
     # Modal Templates
     edit_modal_template: str = "admin/model/modals/edit.html"
     """Default edit modal template"""
@@ -576,6 +652,17 @@ class BaseModelView(BaseView, ActionsMixin):
                 )
     """
 
+    filter_options_ajax_threshold: int | None = 100
+    """
+        Filters with more options than this are not embedded into the list
+        page. Their input loads the options from the ``/ajax/filter/``
+        endpoint instead, with search and paging.
+
+        Set to `None` to always embed the options. Use
+        :attr:`~flask_admin.model.filters.BaseFilter.options_cache_timeout`
+        to control how long the options of a filter are cached.
+    """
+
     named_filter_urls: bool = False
     """
         Set to True to use human-readable names for filters in URL parameters.
@@ -636,6 +723,100 @@ class BaseModelView(BaseView, ActionsMixin):
         prev/next pager buttons.
     """
 
+    count_mode: t.Literal["exact", "capped", "estimated"] = "exact"
+    """
+        Controls how the number of rows is calculated for the list view.
+
+        - ``'exact'`` - count all matching rows (default).
+        - ``'capped'`` - count up to `count_cap` rows and stop. Larger results
+          are displayed as ``10,000+``.
+        - ``'estimated'`` - use the row estimate of the database, if the
+          backend can get one, and fall back to an exact count otherwise.
+          Estimated counts are displayed as ``~1,234,567``.
+
+        Approximate counts use the simple prev/next pager. Only the
+        SQLAlchemy backend supports this setting, the other backends ignore
+        it and always count all rows. For example::
+
+            class AuditLogView(ModelView):
+                count_mode = 'capped'
+                count_cap = 5000
+    """
+
+    count_cap: int = 10000
+    """
+        Maximum number of rows counted when `count_mode` is ``'capped'``.
+    """
+
+    count_cache: BaseCache | None = None
+    """
+        Cache for the row counts of the list view.
+
+        Counts are cached per view, search string and filters, so paging
+        through the same list runs the count query only once. Entries of a
+        view are dropped when a model is created, updated or deleted through
+        it. For example::
+
+            from flask_admin.model.cache import MemoryCache
+
+            class AuditLogView(ModelView):
+                count_cache = MemoryCache(timeout=60, max_size=1000)
+
+        If `get_query` depends on the current user, override
+        `get_count_cache_key` to include it in the key.
+    """
+
+    filter_facets: bool = False
+    """
+        Show how many rows match each option of the filters.
+
+        Backends supporting facets count the rows per option of boolean,
+        enum and equality filters with options, under the current search
+        and the other active filters. The counts are served as JSON by the
+        ``/api/facets/`` endpoint and displayed next to the options of the
+        filter dropdowns.
+
+        Filters without options are not counted, including the filters
+        scaffolded for the text and numeric columns of a related model.
+        Pass `options` to an equality filter on the foreign key column to
+        facet a relation::
+
+            class PostView(ModelView):
+                filter_facets = True
+                column_filters = [
+                    FilterEqual(
+                        Post.user_id,
+                        'User',
+                        options=lambda: [(u.id, u.name) for u in User.query],
+                    ),
+                ]
+    """
+
+    facet_cache: BaseCache | None = None
+    """
+        Cache for the facet counts, keyed like `count_cache`. For example::
+
+            from flask_admin.model.cache import MemoryCache
+
+            class OrderView(ModelView):
+                filter_facets = True
+                facet_cache = MemoryCache(timeout=300)
+    """
+
+    keyset_pagination: bool = False
+    """
+        Enable keyset (seek) pagination for the list view.
+
+        Instead of skipping ``page * page_size`` rows, the next and previous
+        pages are fetched by seeking from the sort key of the last (or first)
+        row of the current page. The position is carried in an opaque
+        ``cursor`` URL argument, so deep pages are as fast as the first one.
+
+        Only prev/next pager buttons are displayed in this mode. Backends that
+        do not support keyset pagination, or sort columns that can not be
+        used as a seek key, fall back to regular offset pagination.
+    """
+
     form: type[Form] | None = None
     """
         Form class. Override if you want to use custom form for your model.
@@ -888,12 +1069,31 @@ class BaseModelView(BaseView, ActionsMixin):
     export_types: t.Collection[str] = ["csv"]
     """
         A list of available export filetypes. `csv` only is default, but any
-        filetypes supported by tablib can be used.
+        filetypes supported by tablib can be used, as well as `parquet` and
+        `arrow` (Arrow IPC file) when pyarrow is installed.
 
         Check tablib for https://tablib.readthedocs.io/en/stable/formats.html
         for supported types.
     """
 
+    export_batch_size: int = 1000
+    """
+        Number of rows fetched from the data source at a time when
+        streaming an export. See `get_list_iter`.
+    """
+
+    export_csv_chunk_size: int = 1000
+    """
+        Number of CSV rows formatted into a buffer before it is sent to
+        the client.
+    """
+
+    export_gzip: bool = False
+    """
+        Compress CSV exports with gzip on the fly if the client accepts
+        it.
+    """
+
     # Pagination settings
     page_size: int = 20
     """
@@ -910,6 +1110,16 @@ class BaseModelView(BaseView, ActionsMixin):
         Sets the page size options available, if `can_set_page_size` is True
     """
 
+    list_infinite_scroll: bool = False
+    """
+        Replace the pager of the list view with infinite scrolling. The
+        next pages are loaded from `api_list_view` when the end of the
+        table is scrolled into view.
+
+        Editable columns are displayed as plain values in the appended
+        rows.
+    """
+
     def __init__(
         self,
         model: type[T_ORM_MODEL],
@@ -1001,7 +1211,9 @@ class BaseModelView(BaseView, ActionsMixin):
 
         # List View In-Line Editing
         if self.column_editable_list:
-            self._list_form_class = self.get_list_form()
+            self._list_form_class = trim_list_form(
+                self.get_list_form(), self.column_editable_list
+            )
         else:
             self.column_editable_list = {}
 
@@ -1021,7 +1233,7 @@ class BaseModelView(BaseView, ActionsMixin):
                         "index": i,
                         "arg": self.get_filter_arg(i, flt),
                         "operation": flt.operation(),
-                        "options": flt.get_options(self) or None,
+                        "filter": flt,
                         "type": flt.data_type,
                     }
                 )
@@ -1106,9 +1318,37 @@ class BaseModelView(BaseView, ActionsMixin):
         if self.column_type_formatters_detail is None:
             self.column_type_formatters_detail = dict(typefmt.DETAIL_FORMATTERS)
 
+        # Arrow based exports keep None as null values
+        self._column_type_formatters_native = {
+            k: v
+            for k, v in self.column_type_formatters_export.items()
+            if k is not type(None)
+        }
+
         if self.column_descriptions is None:
             self.column_descriptions = dict()
 
+        # Macros can't be rendered without the list template
+        self._api_column_formatters = {
+            k: v
+            for k, v in self.column_formatters.items()
+            if getattr(v, "__name__", None) != "inner"
+        }
+
+        # Value getters and type formatters, resolved once per column and type
+        self._field_getters: dict[str, t.Callable[[t.Any], t.Any]] = {}
+        self._type_formatters_cache: dict[
+            int, tuple[T_COLUMN_TYPE_FORMATTERS, dict[type, T_TYPE_FORMATTER | None]]
+        ] = {}
+
+        columns = [c for c, _ in self._list_columns + self._export_columns]
+        if self.can_view_details:
+            columns.extend(c for c, _ in self._details_columns)
+
+        for column in columns:
+            if isinstance(column, str) and column not in self._field_getters:
+                self._field_getters[column] = make_rec_getattr(column)
+
         # Filters
         self._refresh_filters_cache()
 
@@ -1386,12 +1626,48 @@ class BaseModelView(BaseView, ActionsMixin):
             results = OrderedDict()
 
             for group in itervalues(self._filter_groups):
-                key, items = group.non_lazy()
+                key, items = group.non_lazy(self)
                 results[key] = items
             return results
 
         return None
 
+    def _is_filter_options_ajax(
+        self, flt: BaseFilter, options: T_OPTION_LIST | None
+    ) -> bool:
+        threshold = self.filter_options_ajax_threshold
+
+        # widgets like select2-tags need all the options on the page
+        if threshold is None or flt.data_type or not options:
+            return False
+
+        return len(options) > threshold
+
+    def _get_active_filters(
+        self, filters: t.Sequence[T_FILTER] | None
+    ) -> list[tuple[t.Any, ...]]:
+        """
+        Return the active filters of the list view, with the option label of
+        the value for filters whose options are loaded through ajax.
+
+        :param filters:
+            List of filters from ViewArgs object
+        """
+        result: list[tuple[t.Any, ...]] = []
+
+        for idx, name, value in filters or ():
+            flt = self._filters[idx]  # type: ignore[index]
+            options = flt.get_cached_options(self)
+
+            if self._is_filter_options_ajax(flt, options):
+                labels = dict((as_unicode(k), v) for k, v in options)  # type: ignore[union-attr]
+                label = labels.get(as_unicode(value), value)
+                result.append((idx, name, value, as_unicode(label)))
+            else:
+                result.append((idx, name, value))
+
+        return result
+
     # Form helpers
     def scaffold_form(self) -> type[Form]:
         """
@@ -1548,10 +1824,26 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         Instantiate model editing form for list view and return it.
 
-        Override to implement custom behavior.
+        The list view creates a single form without `obj` and loads the
+        value of each row into its fields when the cell is rendered. If
+        this method is overridden, it is called with `obj` for every row
+        instead.
+
+        Override to implement custom behavior. `ajax_update_batch` calls it
+        without `obj` for every edited record and loads the submitted values
+        into the returned form.
         """
         return self._list_form_class(get_form_data(), obj=obj)
 
+    def _get_batch_list_form(self, formdata: t.Any) -> Form:
+        """
+        Instantiate the list form of a batch edit through `list_form` and
+        load `formdata` into it.
+        """
+        form = self.list_form()
+        form.process(formdata)
+        return form
+
     def action_form(self, obj: type | None = None) -> Form:
         """
         Instantiate model action form and return it.
@@ -1739,6 +2031,70 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         raise NotImplementedError("Please implement get_list method")
 
+    def get_list_iter(
+        self,
+        sort_field: T_COLUMN | None,
+        sort_desc: bool,
+        search: str | None,
+        filters: t.Sequence[T_FILTER] | None,
+        page_size: int | None = None,
+        batch_size: int = 1000,
+    ) -> t.Iterator[T_ORM_MODEL]:
+        """
+        Iterate over the sorted and filtered models without loading them
+        all into memory. Used by the CSV export.
+
+        The default implementation calls `get_list` and iterates over the
+        returned list. Backends override it to fetch rows from the data
+        source in batches.
+
+        :param sort_field:
+            Sort column name or None.
+        :param sort_desc:
+            If set to True, sorting is in descending order.
+        :param search:
+            Search query
+        :param filters:
+            List of filter tuples
+        :param page_size:
+            Maximum number of models. Set to 0 or False to iterate over all
+            models.
+        :param batch_size:
+            Number of models fetched from the data source at a time.
+        """
+        count, data = self.get_list(
+            0, sort_field, sort_desc, search, filters, page_size=page_size
+        )
+        return iter(data)
+
+    def get_list_cursor(
+        self,
+        model: T_ORM_MODEL,
+        sort_field: T_COLUMN | None,
+        sort_desc: bool,
+        backwards: bool = False,
+    ) -> str | None:
+        """
+        Return an opaque keyset pagination cursor pointing at `model`.
+
+        Used by the list view when `keyset_pagination` is enabled. Backends
+        that support keyset pagination override this method and accept the
+        returned value as the `cursor` argument of `get_list`.
+
+        Returns `None` if keyset pagination is not supported.
+
+        :param model:
+            Model instance to seek from: the last row of the current page
+            for the next page, or the first row for the previous page.
+        :param sort_field:
+            Sort column name or None.
+        :param sort_desc:
+            If set to True, sorting is in descending order.
+        :param backwards:
+            If set to True, the cursor fetches the rows preceding `model`.
+        """
+        return None
+
     def get_one(self, id: t.Any) -> T_ORM_MODEL | None:
         """
         Return one model by its id.
@@ -1750,6 +2106,27 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         raise NotImplementedError("Please implement get_one method")
 
+    def get_many(self, ids: t.Sequence[t.Any]) -> list[T_ORM_MODEL]:
+        """
+        Return the models matching a list of ids. Ids that do not match a
+        model are skipped and the order of the result is not guaranteed.
+
+        By default, calls `get_one` for every id. Backends override this
+        to load all models with a single query.
+
+        :param ids:
+            List of model ids
+        """
+        models = []
+
+        for id in ids:
+            model = self.get_one(id)
+
+            if model is not None:
+                models.append(model)
+
+        return models
+
     # Exception handler
     def handle_view_exception(self, exc: Exception) -> bool:
         if isinstance(exc, ValidationError):
@@ -1825,6 +2202,15 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         pass
 
+    def _after_model_change(
+        self, form: Form, model: T_ORM_MODEL, is_created: bool
+    ) -> None:
+        """
+        Invalidate cached counts and call `after_model_change`.
+        """
+        self.invalidate_count_cache()
+        self.after_model_change(form, model, is_created)
+
     def on_model_delete(self, model: T_ORM_MODEL) -> None:
         """
         Perform some actions before a model is deleted.
@@ -1851,6 +2237,13 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         pass
 
+    def _after_model_delete(self, model: T_ORM_MODEL) -> None:
+        """
+        Invalidate cached counts and call `after_model_delete`.
+        """
+        self.invalidate_count_cache()
+        self.after_model_delete(model)
+
     def on_form_prefill(self, form: Form, id: t.Any) -> None:
         """
         Perform additional actions to pre-fill the edit form.
@@ -1902,6 +2295,26 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         raise NotImplementedError()
 
+    def update_models(self, updates: list[tuple[Form, T_ORM_MODEL]]) -> bool:
+        """
+        Update several models, each one from its own form.
+
+        Returns `True` if all models were updated.
+
+        By default, calls `update_model` for every pair. Backends override
+        this to save all models in a single transaction.
+
+        :param updates:
+            List of (form, model) pairs
+        """
+        result = True
+
+        for form, model in updates:
+            if not self.update_model(form, model):
+                result = False
+
+        return result
+
     def delete_model(self, model: T_ORM_MODEL) -> bool:
         """
         Delete model.
@@ -1927,6 +2340,145 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         return prettify_name(name)
 
+    def is_count_approximate(self, count: int | None) -> bool:
+        """
+        Return `True` if `count` returned by `get_list` is not an exact
+        number of rows, depending on `count_mode`.
+
+        :param count:
+            Row count
+        """
+        if count is None:
+            return False
+
+        if self.count_mode == "capped":
+            return count > self.count_cap
+
+        return isinstance(count, EstimatedCount)
+
+    def get_count_label(self, count: int | None) -> str | None:
+        """
+        Return the row count as displayed in the list view.
+
+        :param count:
+            Row count returned by `get_list`
+        """
+        if count is None:
+            return None
+
+        if self.count_mode == "capped" and count > self.count_cap:
+            return f"{self.count_cap:,}+"
+        elif isinstance(count, EstimatedCount):
+            return f"~{count:,}"
+
+        return str(count)
+
+    def get_count_cache_key(
+        self, search: str | None, filters: t.Sequence[T_FILTER] | None
+    ) -> tuple[t.Any, ...]:
+        """
+        Return the `count_cache` key of the list count for `search` and
+        `filters`.
+
+        The key must start with the view endpoint, which is used to
+        invalidate the counts of the view.
+
+        :param search:
+            Search query
+        :param filters:
+            List of filter tuples
+        """
+        normalized = tuple(
+            sorted(
+                (idx, as_unicode(name), as_unicode(value))
+                for idx, name, value in filters or ()
+            )
+        )
+        return self.endpoint, search or "", normalized
+
+    def get_cached_count(
+        self,
+        search: str | None,
+        filters: t.Sequence[T_FILTER] | None,
+        get_count: t.Callable[[], int],
+    ) -> int:
+        """
+        Return the list count from `count_cache`, calling `get_count` to
+        compute and store it on a miss.
+
+        Used by `get_list` of the model backends.
+
+        :param search:
+            Search query
+        :param filters:
+            List of filter tuples
+        :param get_count:
+            Function running the count query
+        """
+        if self.count_cache is None:
+            return get_count()
+
+        key = self.get_count_cache_key(search, filters)
+
+        count = self.count_cache.get(key)
+        if count is None:
+            count = get_count()
+            self.count_cache.set(key, count)
+
+        return count
+
+    def get_facet_counts(
+        self, search: str | None, filters: t.Sequence[T_FILTER] | None
+    ) -> dict[str, dict[str, int]]:
+        """
+        Return the number of rows per option of the faceted filters.
+
+        The result maps filter arguments to a dictionary of option values
+        and row counts. Returns an empty dictionary by default, backends
+        supporting `filter_facets` override it.
+
+        :param search:
+            Search query
+        :param filters:
+            List of filter tuples
+        """
+        return {}
+
+    def get_cached_facet_counts(
+        self, search: str | None, filters: t.Sequence[T_FILTER] | None
+    ) -> dict[str, dict[str, int]]:
+        """
+        Return `get_facet_counts`, cached in `facet_cache`.
+
+        :param search:
+            Search query
+        :param filters:
+            List of filter tuples
+        """
+        if self.facet_cache is None:
+            return self.get_facet_counts(search, filters)
+
+        key = self.get_count_cache_key(search, filters)
+        counts = self.facet_cache.get(key)
+
+        if counts is None:
+            counts = self.get_facet_counts(search, filters)
+            self.facet_cache.set(key, counts)
+
+        return counts
+
+    def invalidate_count_cache(self) -> None:
+        """
+        Drop the cached list and facet counts of this view.
+
+        Called after a model was created, updated or deleted.
+        """
+        if self.count_cache is not None:
+            self.count_cache.delete_prefix((self.endpoint,))
+
+        if self.facet_cache is not None:
+            self.facet_cache.delete_prefix((self.endpoint,))
+
     def get_empty_list_message(self) -> str:
         return gettext("There are no items in the table.")
 
@@ -1991,10 +2543,12 @@ class BaseModelView(BaseView, ActionsMixin):
                         "sort",
                         "desc",
                         "search",
+                        "cursor",
                     )
                     and not k.startswith("flt")
                 ]
             ),
+            cursor=request.args.get("cursor", None),
         )
 
     def _get_filters(self, filters: t.Sequence[T_FILTER] | None) -> dict[str, t.Any]:
@@ -2022,12 +2576,14 @@ class BaseModelView(BaseView, ActionsMixin):
         return kwargs
 
     # URL generation helpers
-    def _get_list_url(self, view_args: ViewArgs) -> str:
+    def _get_list_url(self, view_args: ViewArgs, endpoint: str = ".index_view") -> str:
         """
         Generate page URL with current page, sort column and other parameters.
 
         :param view_args:
             ViewArgs object with page number, filters, etc.
+        :param endpoint:
+            Endpoint of the URL, the list view by default.
         """
         page = view_args.page or None
         desc = 1 if view_args.sort_desc else None
@@ -2037,11 +2593,14 @@ class BaseModelView(BaseView, ActionsMixin):
         )
         kwargs.update(view_args.extra_args)
 
+        if view_args.cursor:
+            kwargs["cursor"] = view_args.cursor
+
         kwargs["page_size"] = self.get_safe_page_size(view_args.page_size)
 
         kwargs.update(self._get_filters(view_args.filters))
 
-        return self.get_url(".index_view", **kwargs)
+        return self.get_url(endpoint, **kwargs)
 
     # Actions
     def is_action_allowed(self, name: str) -> bool:
@@ -2058,7 +2617,44 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         Get unformatted field value from the model
         """
-        return rec_getattr(model, name)  # type: ignore[arg-type]
+        getter = self._field_getters.get(name)  # type: ignore[arg-type]
+
+        if getter is None:
+            if not isinstance(name, str):
+                return rec_getattr(model, name)  # type: ignore[arg-type]
+
+            getter = self._field_getters[name] = make_rec_getattr(name)
+
+        return getter(model)
+
+    def _get_type_formatter(
+        self, column_type_formatters: T_COLUMN_TYPE_FORMATTERS, value_type: type
+    ) -> T_TYPE_FORMATTER | None:
+        """
+        Return the first formatter of `column_type_formatters` matching
+        `value_type`, or `None`. Lookups are cached per value type.
+        """
+        cached = self._type_formatters_cache.get(id(column_type_formatters))
+
+        if cached is None or cached[0] is not column_type_formatters:
+            cached = (column_type_formatters, {})
+            self._type_formatters_cache[id(column_type_formatters)] = cached
+
+        dispatch = cached[1]
+
+        try:
+            return dispatch[value_type]
+        except KeyError:
+            pass
+
+        type_fmt = None
+        for typeobj, formatter in column_type_formatters.items():
+            if issubclass(value_type, typeobj):
+                type_fmt = formatter
+                break
+
+        dispatch[value_type] = type_fmt
+        return type_fmt
 
     def _get_list_value(
         self,
@@ -2088,15 +2684,11 @@ class BaseModelView(BaseView, ActionsMixin):
         else:
             value = self._get_field_value(model, name)
 
-        choices_map = self._column_choices_map.get(name, {})
+        choices_map = self._column_choices_map.get(name)
         if choices_map:
             return choices_map.get(value) or value
 
-        type_fmt = None
-        for typeobj, formatter in column_type_formatters.items():
-            if isinstance(value, typeobj):
-                type_fmt = formatter
-                break
+        type_fmt = self._get_type_formatter(column_type_formatters, type(value))
         if type_fmt is not None:
             try:
                 value = type_fmt(self, value, name)
@@ -2208,6 +2800,14 @@ class BaseModelView(BaseView, ActionsMixin):
 
         return result
 
+    def _get_ajax_loader(
+        self, name: str
+    ) -> AjaxModelLoader | T_QUERY_AJAX_MODEL_LOADER | None:
+        """
+        Return the ajax loader served by `/ajax/lookup/` for `name`.
+        """
+        return self._form_ajax_refs.get(name)
+
     def _create_ajax_loader(
         self, name: str, options: dict[str, t.Any]
     ) -> AjaxModelLoader:
@@ -2216,20 +2816,26 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         raise NotImplementedError()
 
-    # Views
-    @expose("/")
-    def index_view(self) -> str:
+    def _use_keyset_pagination(self) -> bool:
         """
-        List view
+        Return True if `keyset_pagination` is enabled and the backend
+        supports it by implementing `get_list_cursor`.
         """
-        if self.can_delete:
-            delete_form = self.delete_form()
-        else:
-            delete_form = None
+        return (
+            self.keyset_pagination
+            and type(self).get_list_cursor is not BaseModelView.get_list_cursor
+        )
 
-        # Grab parameters from URL
-        view_args = self._get_list_extra_args()
+    # Views
+    def _get_list_page(
+        self, view_args: ViewArgs
+    ) -> tuple[T_COLUMN | None, int, int | None, list[T_ORM_MODEL]]:
+        """
+        Return the sort column, page size, count and models of a list page.
 
+        :param view_args:
+            ViewArgs object with page number, filters, etc.
+        """
         # Map column index to column name
         sort_column_tuple = self._get_column_by_idx(view_args.sort)
         if sort_column_tuple is not None:
@@ -2240,8 +2846,12 @@ class BaseModelView(BaseView, ActionsMixin):
         # Get page size
         page_size = self.get_safe_page_size(view_args.page_size)
 
+        # Keyset pagination cursor is only passed to backends that support it
+        list_kwargs: dict[str, t.Any] = {}
+        if self._use_keyset_pagination():
+            list_kwargs["cursor"] = view_args.cursor
+
         # Get count and data
-        data: list[T_ORM_MODEL]
         count, data = self.get_list(
             view_args.page,
             sort_column,
@@ -2249,15 +2859,72 @@ class BaseModelView(BaseView, ActionsMixin):
             view_args.search,
             view_args.filters,
             page_size=page_size,
+            **list_kwargs,
         )
 
-        list_forms = {}
+        return sort_column, page_size, count, data
+
+    def _get_next_page_args(
+        self,
+        view_args: ViewArgs,
+        sort_column: T_COLUMN | None,
+        page_size: int,
+        count: int | None,
+        data: list[T_ORM_MODEL],
+    ) -> ViewArgs | None:
+        """
+        Return the arguments of the page following a list page, or `None` if
+        it is the last page.
+        """
+        if not page_size or len(data) < page_size:
+            return None
+
+        page = (view_args.page or 0) + 1
+
+        if count is not None and not self.is_count_approximate(count):
+            if page * page_size >= count:
+                return None
+
+        cursor = None
+        if self._use_keyset_pagination():
+            cursor = self.get_list_cursor(data[-1], sort_column, view_args.sort_desc)
+
+        return view_args.clone(page=page, cursor=cursor)
+
+    @expose("/")
+    def index_view(self) -> str:
+        """
+        List view
+        """
+        if self.can_delete:
+            delete_form = self.delete_form()
+        else:
+            delete_form = None
+
+        # Grab parameters from URL
+        view_args = self._get_list_extra_args()
+
+        # Get count and data
+        data: list[T_ORM_MODEL]
+        sort_column, page_size, count, data = self._get_list_page(view_args)
+
+        list_forms: ListForms | dict[t.Any, t.Any] = {}
         if self.column_editable_list:
-            for row in data:
-                list_forms[self.get_pk_value(row)] = self.list_form(obj=row)
+            # overrides of list_form may customize the form of each row
+            list_forms = ListForms(
+                ((self.get_pk_value(row), row) for row in data),
+                self.list_form,
+                per_row=type(self).list_form is not BaseModelView.list_form,
+            )
+
+        count_label = self.get_count_label(count)
 
         # Calculate number of pages
-        if count is not None and page_size:
+        if self._use_keyset_pagination() and page_size:
+            num_pages = None  # keyset pages can only be reached from a neighbour
+        elif self.is_count_approximate(count) and page_size:
+            num_pages = None  # the last page is unknown
+        elif count is not None and page_size:
             num_pages = int(ceil(count / float(page_size)))
         elif not page_size:
             num_pages = 0  # hide pager for unlimited page_size
@@ -2270,19 +2937,58 @@ class BaseModelView(BaseView, ActionsMixin):
             if p == 0:
                 p = None
 
-            return self._get_list_url(view_args.clone(page=p))
+            return self._get_list_url(view_args.clone(page=p, cursor=page_cursor(p)))
+
+        def page_cursor(p: int | None) -> str | None:
+            if not self._use_keyset_pagination() or not p or not data:
+                return None
+
+            current = view_args.page or 0
+
+            if p == current:
+                return view_args.cursor
+            elif p == current + 1:
+                return self.get_list_cursor(data[-1], sort_column, view_args.sort_desc)
+            elif p == current - 1:
+                return self.get_list_cursor(
+                    data[0], sort_column, view_args.sort_desc, backwards=True
+                )
+
+            return None
 
         def sort_url(column: str, invert: bool = False, desc: t.Any = None) -> str:
             if not desc and invert and not view_args.sort_desc:
                 desc = 1
 
-            return self._get_list_url(view_args.clone(sort=column, sort_desc=desc))
+            return self._get_list_url(
+                view_args.clone(sort=column, sort_desc=desc, cursor=None)
+            )
 
         def page_size_url(s: int) -> str:
             if not s:
                 s = self.page_size
 
-            return self._get_list_url(view_args.clone(page_size=s))
+            return self._get_list_url(view_args.clone(page_size=s, cursor=None))
+
+        # Infinite scrolling loads the next pages from the JSON list API
+        scroll_url = None
+        if self.list_infinite_scroll:
+            next_args = self._get_next_page_args(
+                view_args, sort_column, page_size, count, data
+            )
+
+            if next_args is not None:
+                if self.column_display_actions:
+                    next_args.extra_args["row_actions"] = "1"
+
+                scroll_url = self._get_list_url(next_args, endpoint=".api_list_view")
+
+        # Facet counts are loaded by the filter dropdowns
+        facets_url = None
+        if self.filter_facets and self._filters:
+            facets_url = self._get_list_url(
+                view_args.clone(page=None, cursor=None), endpoint=".api_facets_view"
+            )
 
         # Actions
         actions, actions_confirmation = self.get_actions_list()
@@ -2298,6 +3004,7 @@ class BaseModelView(BaseView, ActionsMixin):
                 sort_desc=view_args.sort_desc,
                 search=None,
                 filters=None,
+                cursor=None,
             )
         )
 
@@ -2312,6 +3019,7 @@ class BaseModelView(BaseView, ActionsMixin):
             editable_columns=self.column_editable_list,
             list_row_actions=self.get_list_row_actions(),  # Pagination
             count=count,
+            count_label=count_label,
             pager_url=pager_url,
             num_pages=num_pages,
             can_set_page_size=self.can_set_page_size,
@@ -2329,7 +3037,7 @@ class BaseModelView(BaseView, ActionsMixin):
             search_placeholder=self.search_placeholder(),  # Filters
             filters=self._filters,
             filter_groups=self._get_filter_groups(),
-            active_filters=view_args.filters,
+            active_filters=self._get_active_filters(view_args.filters),
             filter_args=self._get_filters(view_args.filters),  # Actions
             actions=actions,
             actions_confirmation=actions_confirmation,
@@ -2339,8 +3047,141 @@ class BaseModelView(BaseView, ActionsMixin):
             get_value=self.get_list_value,
             return_url=self._get_list_url(view_args),  # Extras
             extra_args=view_args.extra_args,
+            scroll_url=scroll_url,
+            facets_url=facets_url,
+        )
+
+    @expose("/api/list/")
+    def api_list_view(self) -> T_RESPONSE:
+        """
+        List view as JSON.
+
+        Accepts the arguments of the list view. Rows contain the values
+        displayed by the list view as HTML, or the unformatted values if
+        the `values` argument is `raw`. Set `row_actions` to include the
+        HTML of the row actions.
+        """
+        view_args = self._get_list_extra_args()
+        raw = view_args.extra_args.pop("values", None) == "raw"
+        with_row_actions = bool(view_args.extra_args.pop("row_actions", None))
+
+        sort_column, page_size, count, data = self._get_list_page(view_args)
+        data = list(data)
+
+        columns = [c for c, _ in self._list_columns]
+        rows = [
+            dict(
+                pk=as_unicode(self.get_pk_value(row)),
+                values={c: self._get_api_list_value(row, c, raw) for c in columns},
+            )
+            for row in data
+        ]
+
+        if with_row_actions and data:
+            row_actions = json.loads(
+                self.render(
+                    self.list_row_actions_template,
+                    data=data,
+                    list_row_actions=self.get_list_row_actions(),
+                    delete_form=self.delete_form() if self.can_delete else None,
+                    get_pk_value=self.get_pk_value,
+                    return_url=self._get_list_url(view_args),
+                )
+            )
+
+            for row_dict, html in zip(rows, row_actions, strict=True):
+                row_dict["actions"] = html
+
+        next_url = None
+        next_args = self._get_next_page_args(
+            view_args, sort_column, page_size, count, data
+        )
+        if next_args is not None:
+            if raw:
+                next_args.extra_args["values"] = "raw"
+            if with_row_actions:
+                next_args.extra_args["row_actions"] = "1"
+
+            next_url = self._get_list_url(next_args, endpoint=".api_list_view")
+
+        result = dict(
+            columns=[
+                dict(name=c, label=as_unicode(label)) for c, label in self._list_columns
+            ],
+            rows=rows,
+            count=count,
+            count_label=self.get_count_label(count),
+            page=view_args.page or 0,
+            page_size=page_size,
+            cursor=next_args.cursor if next_args is not None else None,
+            next_url=next_url,
+        )
+
+        return Response(json.dumps(result), mimetype="application/json")
+
+    @expose("/api/facets/")
+    def api_facets_view(self) -> T_RESPONSE:
+        """
+        Facet counts as JSON.
+
+        Accepts the search and filter arguments of the list view and
+        returns, for each faceted filter, the number of rows per option.
+        """
+        if not self.filter_facets or not self._filter_args:
+            abort(404)
+
+        view_args = self._get_list_extra_args()
+        counts = self.get_cached_facet_counts(view_args.search, view_args.filters)
+
+        facets = []
+
+        for arg, values in counts.items():
+            _, flt = self._filter_args[arg]
+            facets.append(
+                dict(
+                    arg=arg,
+                    name=as_unicode(flt.name),
+                    operation=as_unicode(flt.operation()),
+                    counts=values,
+                )
+            )
+
+        return Response(json.dumps(dict(facets=facets)), mimetype="application/json")
+
+    def _get_api_list_value(
+        self, model: T_ORM_MODEL, name: T_COLUMN, raw: bool
+    ) -> t.Any:
+        """
+        Returns the value of a column in `api_list_view`.
+
+        :param model:
+            Model instance
+        :param name:
+            Field name
+        :param raw:
+            If set to True, return the unformatted value converted to a JSON
+            type. Otherwise return the HTML displayed by the list view.
+        """
+        if raw:
+            value = self._get_field_value(model, name)
+
+            if value is None or isinstance(value, bool | int | float | str):
+                return value
+            elif isinstance(value, datetime.date | datetime.time):
+                return value.isoformat()
+
+            return as_unicode(value)
+
+        value = self._get_list_value(
+            None,
+            model,
+            name,  # type: ignore[arg-type]
+            self._api_column_formatters,
+            self.column_type_formatters,  # type: ignore[arg-type]
         )
 
+        return str(escape(value))
+
     @expose("/new/", methods=("GET", "POST"))
     def create_view(self) -> T_RESPONSE | str:
         """
@@ -2528,7 +3369,9 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         return self.handle_action()
 
-    def _export_data(self) -> tuple[int, list[T_ORM_MODEL]]:
+    def _get_export_args(
+        self,
+    ) -> tuple[T_COLUMN | None, bool, str | None, t.Sequence[T_FILTER] | None]:
         # Macros in column_formatters are not supported.
         # Macros will have a function name 'inner'
         # This causes non-macro functions named 'inner' not work.
@@ -2555,19 +3398,37 @@ class BaseModelView(BaseView, ActionsMixin):
             sort_column = sort_column_tuple[0]
         else:
             sort_column = None
+
+        return sort_column, view_args.sort_desc, view_args.search, view_args.filters
+
+    def _export_data(self) -> tuple[int, list[T_ORM_MODEL]]:
+        sort_column, sort_desc, search, filters = self._get_export_args()
+
         # Get count and data
         data: list[T_ORM_MODEL]
         count, data = self.get_list(
             0,
             sort_column,
-            view_args.sort_desc,
-            view_args.search,
-            view_args.filters,
+            sort_desc,
+            search,
+            filters,
             page_size=self.export_max_rows,
         )
 
         return count, data
 
+    def _export_data_iter(self) -> t.Iterator[T_ORM_MODEL]:
+        sort_column, sort_desc, search, filters = self._get_export_args()
+
+        return self.get_list_iter(
+            sort_column,
+            sort_desc,
+            search,
+            filters,
+            page_size=self.export_max_rows,
+            batch_size=self.export_batch_size,
+        )
+
     @expose("/export/<export_type>/")
     def export(self, export_type: str) -> T_RESPONSE:
         return_url = get_redirect_target() or self.get_url(".index_view")
@@ -2578,6 +3439,10 @@ class BaseModelView(BaseView, ActionsMixin):
 
         if export_type == "csv":
             return self._export_csv(return_url)
+        elif export_type == "xlsx" and openpyxl is not None:
+            return self._export_xlsx(return_url)
+        elif export_type in ARROW_EXPORT_TYPES:
+            return self._export_arrow(export_type, return_url)
         else:
             return self._export_tablib(export_type, return_url)
 
@@ -2585,45 +3450,299 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         Export a CSV of records as a stream.
         """
-        data: list[T_ORM_MODEL]
-        count, data = self._export_data()
+        data = self._export_data_iter()
 
-        # https://docs.djangoproject.com/en/1.8/howto/outputting-csv/
-        class Echo:
-            """
-            An object that implements just the write method of the file-like
-            interface.
-            """
-
-            def write(self, value: t.Any) -> t.Any:
-                """
-                Write the value by returning it, instead of storing
-                in a buffer.
-                """
-                return value
+        columns = [c[0] for c in self._export_columns]
+        titles = [csv_encode(c[1]) for c in self._export_columns]
+        chunk_size = max(self.export_csv_chunk_size, 1)
+        get_export_value = self.get_export_value
 
-        writer = csv.writer(Echo())
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
 
-        def generate() -> t.Generator[t.Any, t.Any, None]:
+        def flush() -> str:
+            value = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return value
+
+        def generate() -> t.Generator[str, None, None]:
             # Append the column titles at the beginning
-            titles = [csv_encode(c[1]) for c in self._export_columns]
-            yield writer.writerow(titles)
+            writer.writerow(titles)
 
+            rows = 0
             for row in data:
-                vals = [
-                    csv_encode(self.get_export_value(row, c[0]))
-                    for c in self._export_columns
-                ]
-                yield writer.writerow(vals)
+                writer.writerow([csv_encode(get_export_value(row, c)) for c in columns])
+                rows += 1
+
+                if rows % chunk_size == 0:
+                    yield flush()
+
+            chunk = flush()
+            if chunk:
+                yield chunk
+
+        headers = {
+            "Content-Disposition": "attachment;filename={}".format(
+                secure_filename(self.get_export_name(export_type="csv"))
+            )
+        }
+
+        stream: t.Iterator[t.Any] = generate()
+
+        if self.export_gzip:
+            headers["Vary"] = "Accept-Encoding"
 
-        filename = self.get_export_name(export_type="csv")
+            if request.accept_encodings.quality("gzip"):
+                headers["Content-Encoding"] = "gzip"
+                stream = self._gzip_stream(stream)
+
+        return Response(
+            stream_with_context(stream),
+            headers=headers,
+            mimetype="text/csv",
+        )
+
+    def _gzip_stream(self, stream: t.Iterable[str]) -> t.Iterator[bytes]:
+        """
+        Compress a stream of text chunks with gzip.
+        """
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+
+        for chunk in stream:
+            data = compressor.compress(chunk.encode("utf-8"))
+            if data:
+                yield data
+
+        yield compressor.flush()
+
+    def _get_export_mimetype(self, filename: str) -> str:
+        mimetype, encoding = mimetypes.guess_type(filename)
+        if not mimetype:
+            mimetype = "application/octet-stream"
+        if encoding:
+            mimetype = f"{mimetype}; charset={encoding}"
+
+        return mimetype
+
+    def _export_xlsx(self, return_url: str) -> T_RESPONSE:
+        """
+        Export an XLSX workbook of records with bounded memory.
+
+        Rows are appended to an openpyxl write-only workbook, which keeps
+        them in temporary files, and the saved workbook is streamed to the
+        client from a temporary file.
+        """
+        filename = self.get_export_name("xlsx")
 
         disposition = f"attachment;filename={secure_filename(filename)}"
+        mimetype = self._get_export_mimetype(filename)
+
+        columns = [c[0] for c in self._export_columns]
+
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append([csv_encode(c[1]) for c in self._export_columns])
+
+        for row in self._export_data_iter():
+            ws.append([csv_encode(self.get_export_value(row, c)) for c in columns])
+
+        output = tempfile.TemporaryFile()
+        try:
+            wb.save(output)
+            output.seek(0)
+        except BaseException:
+            output.close()
+            raise
 
         return Response(
-            stream_with_context(generate()),
+            wrap_file(request.environ, output),
             headers={"Content-Disposition": disposition},
-            mimetype="text/csv",
+            mimetype=mimetype,
+            direct_passthrough=True,
+        )
+
+    def get_export_native_value(self, model: T_ORM_MODEL, name: T_COLUMN) -> t.Any:
+        """
+        Returns the value of a column in the Arrow based exports.
+
+        Same as `get_export_value`, except that `None` is kept as a null
+        value and values of other types than ints, floats, decimals,
+        strings, bytes, booleans, dates and times are converted to strings.
+
+        :param model:
+            Model instance
+        :param name:
+            Field name
+        """
+        value = self._get_list_value(
+            None,
+            model,
+            name,  # type: ignore[arg-type]
+            self.column_formatters_export,  # type: ignore[arg-type]
+            self._column_type_formatters_native,
+        )
+
+        if value is None or type(value) in ARROW_EXPORT_NATIVE_TYPES:
+            return value
+
+        return as_unicode(value)
+
+    def get_export_arrow_type(self, name: T_COLUMN) -> t.Any | None:
+        """
+        Return the Arrow type of a column in the Arrow based exports, or
+        `None` to infer it from the values of the first batch of rows.
+
+        Override to give columns a type that fits the values of all rows,
+        for example a decimal type with the scale of the column.
+
+        :param name:
+            Field name
+        """
+        return None
+
+    def _get_arrow_array(self, values: list[t.Any], arrow_type: t.Any) -> t.Any:
+        if pyarrow.types.is_string(arrow_type):
+            values = [v if v is None else as_unicode(v) for v in values]
+
+        # Values are converted from their own type, so casts that would
+        # truncate or rescale them raise instead of silently losing data
+        array = pyarrow.array(values)
+
+        if array.type != arrow_type:
+            array = array.cast(arrow_type, safe=True)
+
+        return array
+
+    def _get_arrow_schema(
+        self, columns: list[T_COLUMN], titles: list[str], batch: list[list[t.Any]]
+    ) -> t.Any:
+        """
+        Build the Arrow schema of an export. Column types come from
+        `get_export_arrow_type` or are inferred from the first batch of rows.
+        """
+        fields = []
+
+        for name, label, values in zip(columns, titles, batch, strict=True):
+            arrow_type = self.get_export_arrow_type(name)
+
+            if arrow_type is None:
+                arrow_type = self._infer_arrow_type(values)
+
+            fields.append(pyarrow.field(label, arrow_type))
+
+        return pyarrow.schema(fields)
+
+    def _infer_arrow_type(self, values: list[t.Any]) -> t.Any:
+        try:
+            arrow_type = pyarrow.array(values).type
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            # Mixed types
+            return pyarrow.string()
+
+        if pyarrow.types.is_null(arrow_type):
+            return pyarrow.string()
+        elif pyarrow.types.is_decimal(arrow_type):
+            # Later batches may hold values with more digits
+            return pyarrow.decimal128(38, arrow_type.scale)
+
+        return arrow_type
+
+    def _export_arrow(self, export_type: str, return_url: str) -> T_RESPONSE:
+        """
+        Export records as Parquet or Arrow IPC file with native column types.
+
+        Rows are converted to Arrow record batches of `export_batch_size`
+        rows, which are written incrementally to a temporary file streamed
+        to the client.
+        """
+        if pyarrow is None:
+            flash(
+                gettext(
+                    "Could not import pyarrow, which is required by the "
+                    '"%(type)s" export type.',
+                    type=export_type,
+                ),
+                "error",
+            )
+            return redirect(return_url)
+
+        filename = self.get_export_name(export_type)
+
+        disposition = f"attachment;filename={secure_filename(filename)}"
+
+        columns = [c[0] for c in self._export_columns]
+        titles = [csv_encode(c[1]) for c in self._export_columns]
+        batch_size = max(self.export_batch_size, 1)
+
+        output = tempfile.TemporaryFile()
+        writer: t.Any = None
+        schema: t.Any = None
+        error = None
+
+        try:
+            data = self._export_data_iter()
+
+            while error is None:
+                rows = list(islice(data, batch_size))
+                batch = [
+                    [self.get_export_native_value(row, c) for row in rows]
+                    for c in columns
+                ]
+
+                if writer is None:
+                    schema = self._get_arrow_schema(columns, titles, batch)
+
+                    if export_type == "parquet":
+                        writer = pyarrow.parquet.ParquetWriter(output, schema)
+                    else:
+                        writer = pyarrow.ipc.new_file(output, schema)
+
+                if not rows:
+                    break
+
+                arrays = []
+
+                for field, values in zip(schema, batch, strict=True):
+                    try:
+                        arrays.append(self._get_arrow_array(values, field.type))
+                    except (
+                        pyarrow.ArrowInvalid,
+                        pyarrow.ArrowTypeError,
+                        pyarrow.ArrowNotImplementedError,
+                    ) as ex:
+                        # Values of later batches that do not fit the type
+                        # inferred from the first batch
+                        error = gettext(
+                            "Could not export column %(column)s as %(type)s: "
+                            "%(error)s",
+                            column=field.name,
+                            type=str(field.type),
+                            error=str(ex),
+                        )
+                        break
+                else:
+                    writer.write_batch(pyarrow.record_batch(arrays, schema=schema))
+
+            writer.close()
+            output.seek(0)
+        except BaseException:
+            if writer is not None:
+                writer.close()
+
+            output.close()
+            raise
+
+        if error is not None:
+            output.close()
+            flash(error, "error")
+            return redirect(return_url)
+
+        return Response(
+            wrap_file(request.environ, output),
+            headers={"Content-Disposition": disposition},
+            mimetype=ARROW_EXPORT_TYPES[export_type],
+            direct_passthrough=True,
         )
 
     def _export_tablib(self, export_type: str, return_url: str) -> T_RESPONSE:
@@ -2639,12 +3758,7 @@ class BaseModelView(BaseView, ActionsMixin):
         filename = self.get_export_name(export_type)
 
         disposition = f"attachment;filename={secure_filename(filename)}"
-
-        mimetype, encoding = mimetypes.guess_type(filename)
-        if not mimetype:
-            mimetype = "application/octet-stream"
-        if encoding:
-            mimetype = f"{mimetype}; charset={encoding}"
+        mimetype = self._get_export_mimetype(filename)
 
         ds = tablib.Dataset(headers=[csv_encode(c[1]) for c in self._export_columns])
 
@@ -2682,19 +3796,51 @@ class BaseModelView(BaseView, ActionsMixin):
         offset = request.args.get("offset", type=int)
         limit = request.args.get("limit", 10, type=int)
 
-        loader = self._form_ajax_refs.get(name)  # type: ignore[arg-type]
+        loader = self._get_ajax_loader(name)  # type: ignore[arg-type]
 
         if not loader:
             abort(404)
 
-        data = [
-            loader.format(m)
-            for m in loader.get_list(
-                query,  # type: ignore[arg-type]
-                offset,  # type: ignore[arg-type]
-                limit,
-            )
-        ]
+        data = loader.get_lookup(
+            query or "",
+            offset,  # type: ignore[arg-type]
+            limit,
+        )
+        response = Response(json.dumps(data), mimetype="application/json")
+
+        # let the browser reuse identical lookups
+        response.cache_control.private = True
+        if loader.cache_timeout:
+            response.cache_control.max_age = int(loader.cache_timeout)
+        else:
+            response.cache_control.no_cache = True
+        response.add_etag()
+
+        return response.make_conditional(request)
+
+    @expose("/ajax/filter/")
+    def ajax_filter_options(self) -> T_RESPONSE:
+        """
+        Return the options of a filter as a JSON list of ``[value, label]``
+        pairs. Options are matched against the ``query`` argument and paged
+        with ``offset`` and ``limit`` by
+        :meth:`~flask_admin.model.filters.BaseFilter.search_options`, like
+        ``/ajax/lookup/``.
+        """
+        name = request.args.get("name")
+        query = request.args.get("query", "")
+        offset = request.args.get("offset", 0, type=int)
+        limit = request.args.get("limit", 10, type=int)
+
+        if not self._filter_args or name not in self._filter_args:
+            abort(404)
+
+        _, flt = self._filter_args[name]
+        data = flt.search_options(self, query, max(offset, 0), max(min(limit, 100), 0))
+
+        if data is None:
+            abort(404)
+
         return Response(json.dumps(data), mimetype="application/json")
 
     @expose("/ajax/update/", methods=("POST",))
@@ -2764,3 +3910,175 @@ class BaseModelView(BaseView, ActionsMixin):
                             "Failed to update record. %(error)s", error=error
                         ), 500
         return None
+
+    def _get_field_error_message(self, errors: t.Iterable[t.Any]) -> str:
+        messages: list[str] = []
+
+        for error in errors:
+            if isinstance(error, list | tuple):
+                messages.extend(as_unicode(e) for e in error)
+            else:
+                messages.append(as_unicode(error))
+
+        return gettext("Failed to update record. %(error)s", error=", ".join(messages))
+
+    @expose("/ajax/update/batch/", methods=("POST",))
+    def ajax_update_batch(self) -> Response:
+        """
+        Edits several cells of the list view in one request. Records are
+        loaded with `get_many`, every cell is validated on its own and all
+        valid edits are saved with a single `update_models` call.
+
+        The request body is JSON with a list of edits, the response holds
+        one result per edit, in the same order:
+
+        .. code-block:: javascript
+
+            $.ajax({
+                url: '/admin/<your_model_view_endpoint>/ajax/update/batch/',
+                type: 'POST',
+                contentType: 'application/json',
+                data: JSON.stringify({
+                    "csrf_token": "<csrf_token>",
+                    "edits": [
+                        {"pk": "<primary_key_value>",
+                         "column": "<column_name>",
+                         "value": "<new_value>"}
+                    ]
+                }),
+                success: function(response) {
+                    // response.results: [{"pk": ..., "column": ...,
+                    //                     "success": true, "message": ...}]
+                }
+            });
+
+        """
+        if not self.column_editable_list:
+            abort(404)
+
+        payload = request.get_json(silent=True)
+
+        if not isinstance(payload, dict) or not isinstance(payload.get("edits"), list):
+            abort(400)
+
+        edits = payload["edits"]
+
+        for edit in edits:
+            if not isinstance(edit, dict) or "pk" not in edit:
+                abort(400)
+
+            if not isinstance(edit.get("column"), str):
+                abort(400)
+
+        # group the edits by record, the last edit of a cell wins
+        records: dict[str, dict[str, t.Any]] = OrderedDict()
+
+        for edit in edits:
+            pk = as_unicode(edit["pk"])
+            records.setdefault(pk, OrderedDict())[edit["column"]] = edit.get("value")
+
+        messages: dict[tuple[str, str], tuple[bool, str]] = {}
+        models = {
+            as_unicode(self.get_pk_value(model)): model
+            for model in self.get_many(list(records))
+        }
+        updates = []
+        pending: list[tuple[str, str]] = []
+
+        for pk, values in records.items():
+            model = models.get(pk)
+
+            if model is None:
+                for column in values:
+                    messages[pk, column] = (False, gettext("Record does not exist."))
+                continue
+
+            formdata = MultiDict([("list_form_pk", pk)])
+
+            if "csrf_token" in payload:
+                formdata.add("csrf_token", payload["csrf_token"])
+
+            for column, value in values.items():
+                for item in value if isinstance(value, list) else [value]:
+                    formdata.add(column, item)
+
+            form = self._get_batch_list_form(formdata)
+
+            # only validate the submitted columns, the primary key and the
+            # csrf token
+            for field in list(form):
+                if field.name not in values and field.name not in (
+                    "list_form_pk",
+                    "csrf_token",
+                ):
+                    del form[field.name]
+
+            for column in values:
+                if column not in form or column in ("list_form_pk", "csrf_token"):
+                    messages[pk, column] = (
+                        False,
+                        gettext(
+                            "Failed to update record. %(error)s",
+                            error=gettext("Column is not editable."),
+                        ),
+                    )
+
+            if self.validate_form(form):
+                columns = [c for c in values if (pk, c) not in messages]
+            else:
+                row_errors = [
+                    error
+                    for name in ("list_form_pk", "csrf_token")
+                    if name in form
+                    for error in form[name].errors
+                ]
+                columns = []
+
+                for column in values:
+                    if (pk, column) in messages:
+                        continue
+
+                    errors = row_errors or form[column].errors
+
+                    if errors:
+                        messages[pk, column] = (
+                            False,
+                            self._get_field_error_message(errors),
+                        )
+                        del form[column]
+                    else:
+                        columns.append(column)
+
+            if columns:
+                updates.append((form, model))
+                pending.extend((pk, column) for column in columns)
+
+        if updates:
+            if self.update_models(updates):
+                result = (True, gettext("Record was successfully saved."))
+            else:
+                # Error: No records changed, or problem saving to database.
+                msgs = ", ".join([msg for msg in get_flashed_messages()])  # type: ignore[misc]
+                result = (
+                    False,
+                    gettext("Failed to update record. %(error)s", error=msgs),
+                )
+
+            for key in pending:
+                messages[key] = result
+
+        results = []
+
+        for edit in edits:
+            pk = as_unicode(edit["pk"])
+            success, message = messages[pk, edit["column"]]
+            results.append(
+                {
+                    "pk": pk,
+                    "column": edit["column"],
+                    "success": success,
+                    "message": message,
+                }
+            )
+
+        return Response(json.dumps({"results": results}), mimetype="application/json")
@@ -0,0 +1,110 @@
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+
+class BaseCache:
+    """
+    Base class for the caches used by model views.
+
+    Keys are tuples. Implement this interface to keep cached values in
+    an external store shared by all processes, like Redis or memcached.
+    """
+
+    def get(self, key: tuple[t.Any, ...]) -> t.Any | None:
+        """
+        Return the cached value for `key` or `None` if it is missing or
+        expired.
+
+        :param key:
+            Cache key
+        """
+        raise NotImplementedError()
+
+    def set(self, key: tuple[t.Any, ...], value: t.Any) -> None:
+        """
+        Store `value` under `key`.
+
+        :param key:
+            Cache key
+        :param value:
+            Value to store
+        """
+        raise NotImplementedError()
+
+    def delete_prefix(self, prefix: tuple[t.Any, ...]) -> None:
+        """
+        Remove all keys starting with `prefix`.
+
+        :param prefix:
+            Key prefix, for example ``(view.endpoint,)``
+        """
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        """
+        Remove all keys.
+        """
+        raise NotImplementedError()
+
+
+class MemoryCache(BaseCache):
+    """
+    In-process cache with a time-to-live and least-recently-used eviction.
+
+    Values are not shared between processes, so with several workers a
+    change made through one worker is only seen by the others once their
+    entries expire.
+    """
+
+    def __init__(self, timeout: float = 60, max_size: int = 1000) -> None:
+        """
+        Constructor.
+
+        :param timeout:
+            Number of seconds a value is kept
+        :param max_size:
+            Maximum number of keys. The least recently used keys are
+            evicted first.
+        """
+        self.timeout = timeout
+        self.max_size = max_size
+
+        self._data: OrderedDict[tuple[t.Any, ...], tuple[float, t.Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[t.Any, ...]) -> t.Any | None:
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is None:
+                return None
+
+            expires, value = item
+
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: tuple[t.Any, ...], value: t.Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.timeout, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete_prefix(self, prefix: tuple[t.Any, ...]) -> None:
+        size = len(prefix)
+
+        with self._lock:
+            for key in [k for k in self._data if k[:size] == prefix]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
@@ -10,6 +10,7 @@ from wtforms.utils import unset_value
 from wtforms.utils import UnsetValue
 from wtforms.validators import ValidationError
 
+from flask_admin._compat import as_unicode
 from flask_admin._compat import iteritems
 from flask_admin._types import T_AJAX_MODEL_LOADER
 from flask_admin._types import T_VALIDATOR
@@ -86,6 +87,11 @@ class InlineFieldList(FieldList):  # type: ignore[type-arg]
         """
         self.errors: list[t.Any] = []
 
+        # Load the models selected in ajax fields of all entries at once
+        load_ajax_data(
+            subfield for subfield in self.entries if not self.should_delete(subfield)
+        )
+
         # Run validators on all entries within
         for subfield in self.entries:
             if not self.should_delete(subfield) and not subfield.validate(form):
@@ -201,7 +207,7 @@ class AjaxSelectField(SelectFieldBase):
 
     def _set_data(self, data: t.Any) -> None:
         self._data = data
-        self._formdata: str | set[str] | None = None
+        self._formdata: str | list[str] | None = None
 
     data = property(_get_data, _set_data)
 
@@ -246,16 +252,13 @@ class AjaxSelectMultipleField(AjaxSelectField):
     def _get_data(self) -> t.Any:
         formdata = self._formdata
         if formdata:
-            data = []
+            pks = [item for item in formdata if item]
+            models = _get_models_by_pk(self.loader, pks) if pks else {}
+            data = [models[pk] for pk in pks if pk in models]
 
-            # TODO: Optimize?
-            for item in formdata:
-                model = self.loader.get_one(item) if item else None
-
-                if model:
-                    data.append(model)
-                else:
-                    self._invalid_formdata = True
+            # an empty or unknown primary key
+            if len(data) < len(formdata):
+                self._invalid_formdata = True
 
             self._set_data(data)
 
@@ -271,12 +274,81 @@ class AjaxSelectMultipleField(AjaxSelectField):
         self,
         valuelist: t.Sequence[str],  # type: ignore[override]
     ) -> None:
-        self._formdata = set()
-
-        for field in valuelist:
-            for n in field.split(self.separator):
-                self._formdata.add(n)
+        # keep the submitted order, without duplicates
+        self._formdata = list(
+            dict.fromkeys(n for field in valuelist for n in field.split(self.separator))
+        )
 
     def pre_validate(self, form: BaseForm) -> None:
+        # load the submitted models, which flags unknown primary keys
+        self._get_data()
+
         if self._invalid_formdata:
             raise ValidationError(self.gettext("Not a valid choice"))
+
+
+def _get_models_by_pk(
+    loader: T_AJAX_MODEL_LOADER, pks: t.Iterable[str]
+) -> dict[str, t.Any]:
+    """
+    Load the models of `pks` with `get_many`, indexed by primary key.
+    """
+    models = {}
+
+    for model in loader.get_many(pks):
+        value = loader.format(model)
+
+        if value is not None:
+            models[as_unicode(value[0])] = model
+
+    return models
+
+
+def _iter_ajax_fields(fields: t.Iterable[Field]) -> t.Iterator[AjaxSelectField]:
+    for field in fields:
+        if isinstance(field, AjaxSelectField):
+            yield field
+        elif isinstance(field, FormField):
+            yield from _iter_ajax_fields(field.form)
+        elif isinstance(field, FieldList):
+            yield from _iter_ajax_fields(field.entries)
+
+
+def load_ajax_data(fields: t.Iterable[Field]) -> None:
+    """
+    Load the models selected in the ajax fields found in `fields`, including
+    the fields of nested forms, with one `get_many` call per loader instead
+    of one query per field.
+
+    Fields with primary keys that are not found are left as they are and
+    load their data on their own.
+
+    :param fields:
+        Fields to search for ajax fields
+    """
+    pending: dict[int, list[AjaxSelectField]] = {}
+
+    for field in _iter_ajax_fields(fields):
+        if field._formdata:
+            pending.setdefault(id(field.loader), []).append(field)
+
+    for group in pending.values():
+        loader = group[0].loader
+        pks: set[str] = set()
+
+        for field in group:
+            if isinstance(field, AjaxSelectMultipleField):
+                pks.update(item for item in field._formdata if item)  # type: ignore[union-attr]
+            else:
+                pks.add(field._formdata)  # type: ignore[arg-type]
+
+        models = _get_models_by_pk(loader, pks)
+
+        for field in group:
+            formdata = field._formdata
+
+            if isinstance(formdata, list):
+                if all(item in models for item in formdata):
+                    field._set_data([models[item] for item in formdata])
+            elif formdata in models:
+                field._set_data(models[formdata])
@@ -3,6 +3,7 @@ import time
 import typing as t
 import uuid
 
+from flask_admin._compat import text_type
 from flask_admin._types import T_MODEL_VIEW
 from flask_admin._types import T_OPTION_LIST
 from flask_admin._types import T_OPTIONS
@@ -16,6 +17,17 @@ class BaseFilter:
     Base filter class.
     """
 
+    options_cache_timeout: float | None = 300
+    """
+        Number of seconds the options returned by `get_options` are cached.
+
+        Options are loaded the first time they are needed, not when the
+        view is created, and reloaded once the timeout expires. Set to `0`
+        to load them every time, or to `None` to never refresh them.
+    """
+
+    _cached_options: tuple[float | None, T_OPTION_LIST | None] | None = None
+
     def __init__(
         self,
         name: str,
@@ -59,6 +71,70 @@ class BaseFilter:
 
         return None
 
+    def get_cached_options(self, view: T_MODEL_VIEW) -> T_OPTION_LIST | None:
+        """
+        Return the options of `get_options`, cached for
+        `options_cache_timeout` seconds.
+
+        :param view:
+            Associated administrative view class.
+        """
+        now = time.monotonic()
+        cached = self._cached_options
+
+        if cached is not None and (cached[0] is None or cached[0] > now):
+            return cached[1]
+
+        options = self.get_options(view)
+
+        if options is not None:
+            options = list(options)
+
+        timeout = self.options_cache_timeout
+
+        if timeout is None:
+            self._cached_options = (None, options)
+        elif timeout > 0:
+            self._cached_options = (now + timeout, options)
+
+        return options
+
+    def search_options(
+        self, view: T_MODEL_VIEW, query: str, offset: int, limit: int
+    ) -> T_OPTION_LIST | None:
+        """
+        Return the options whose label contains `query`, paged with `offset`
+        and `limit`, or `None` if the filter has no options.
+
+        Used by the ``/ajax/filter/`` endpoint. The default implementation
+        searches the cached options; override it to search and page the
+        options in the database instead of loading all of them.
+
+        :param view:
+            Associated administrative view class.
+        :param query:
+            Search string
+        :param offset:
+            Offset
+        :param limit:
+            Limit
+        """
+        options = self.get_cached_options(view)
+
+        if not options:
+            return None
+
+        query = query.lower()
+        matches = []
+
+        for value, label in options:
+            label = text_type(label)
+
+            if not query or query in label.lower():
+                matches.append((value, label))
+
+        return matches[offset : offset + limit]
+
     def validate(self, value: t.Any) -> bool:
         """
         Validate value.
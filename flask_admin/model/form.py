@@ -2,6 +2,7 @@ import inspect
 import typing as t
 import warnings
 from collections.abc import Callable
+from collections.abc import Mapping
 
 import wtforms
 from wtforms.fields import HiddenField
@@ -68,6 +69,118 @@ def create_editable_list_form(
     return ListForm
 
 
+def trim_list_form(
+    form_class: type[wtforms.Form], columns: t.Collection[str]
+) -> type[wtforms.Form]:
+    """
+    Remove the fields that are not in `columns` from a list view form class.
+
+    Returns `form_class` itself when it has no other fields, so forms
+    scaffolded from `column_editable_list` are left untouched.
+
+    :param form_class:
+        List view form class
+    :param columns:
+        Names of the editable columns
+    """
+    extra = [
+        name
+        for name in dir(form_class)
+        if isinstance(getattr(form_class, name, None), UnboundField)
+        and name not in columns
+        and name != "list_form_pk"
+    ]
+
+    if not extra:
+        return form_class
+
+    return type(form_class.__name__, (form_class,), dict.fromkeys(extra))
+
+
+class ListFormRow:
+    """
+    Editable cells of a list view row.
+
+    Every row of the page shares one form instance: looking up a field
+    loads the value of this row into it before it is rendered.
+    """
+
+    def __init__(self, form: wtforms.Form, obj: t.Any) -> None:
+        self.form = form
+        self.obj = obj
+
+    def __getitem__(self, name: str) -> wtforms.Field:
+        field = self.form[name]
+
+        if hasattr(self.obj, name):
+            field.process(None, getattr(self.obj, name))
+        else:
+            field.process(None)
+
+        return field
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.form
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self.form, name)
+
+
+class ListForms(Mapping[t.Any, t.Any]):
+    """
+    Lazy mapping of primary keys to the editable cells of list view rows.
+
+    The form is created on first access and shared by all the rows, so
+    field choices are only loaded once per page. With `per_row`, a form is
+    created for every row with the row model as `obj` instead.
+    """
+
+    def __init__(
+        self,
+        rows: t.Iterable[tuple[t.Any, t.Any]],
+        form_factory: t.Callable[..., t.Any],
+        per_row: bool = False,
+    ) -> None:
+        """
+        Constructor
+
+        :param rows:
+            (primary key, model) pairs of the page
+        :param form_factory:
+            Callable returning the list view form, called with the row
+            model if `per_row` is set
+        :param per_row:
+            Create a form for every row
+        """
+        self._rows = dict(rows)
+        self._form_factory = form_factory
+        self._per_row = per_row
+        self._form: wtforms.Form | None = None
+        self._row_forms: dict[t.Any, wtforms.Form] = {}
+
+    @property
+    def form(self) -> wtforms.Form:
+        if self._form is None:
+            self._form = self._form_factory()
+
+        return self._form
+
+    def __getitem__(self, pk: t.Any) -> ListFormRow | wtforms.Form:
+        if not self._per_row:
+            return ListFormRow(self.form, self._rows[pk])
+
+        if pk not in self._row_forms:
+            self._row_forms[pk] = self._form_factory(self._rows[pk])
+
+        return self._row_forms[pk]
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
 class InlineBaseFormAdmin:
     """
     Settings for inline form administration.
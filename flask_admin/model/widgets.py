@@ -72,8 +72,9 @@ class AjaxSelect2Widget:
         )
         kwargs.setdefault("data-placeholder", placeholder)
 
-        minimum_input_length = int(field.loader.options.get("minimum_input_length", 1))
-        kwargs.setdefault("data-minimum-input-length", minimum_input_length)
+        kwargs.setdefault(
+            "data-minimum-input-length", field.loader.minimum_input_length
+        )
 
         kwargs.setdefault("data-separator", ",")
 
@@ -1,7 +1,19 @@
-var AdminFilters = function(element, filtersElement, filterGroups, activeFilters) {
+var AdminFilters = function(element, filtersElement, filterGroups, activeFilters, facetsUrl) {
     var $root = $(element);
     var $container = $('.filters', $root);
     var lastCount = 0;
+    var facetCounts = {};
+
+    // option label followed by the number of matching rows, if known
+    function optionText(filter, value, label) {
+        var counts = facetCounts[filter.arg];
+
+        if (counts && counts[value] !== undefined) {
+            return label + ' (' + counts[value] + ')';
+        }
+
+        return label;
+    }
 
     function getCount(name) {
         var idx = name.indexOf('_');
@@ -45,23 +57,33 @@ var AdminFilters = function(element, filtersElement, filterGroups, activeFilters
     }
 
     // generate HTML for filter input - allows changing filter input type to one with options or tags
-    function createFilterInput(inputContainer, filterValue, filter) {
+    function createFilterInput(inputContainer, filterValue, filter, filterLabel) {
         if (filter.type == "select2-tags") {
             var $field = $('<input type="hidden" class="filter-val form-control" />').attr('name', makeName(filter.arg));
             $field.val(filterValue);
+        } else if (filter.options_url) {
+            // options are loaded from the server as the user types
+            var $field = $('<input type="hidden" class="filter-val form-control" />').attr('name', makeName(filter.arg));
+            $field.attr('data-url', filter.options_url);
+            $field.attr('data-json', JSON.stringify(
+                filterValue ? [filterValue, filterLabel || filterValue] : null));
+            $field.val(filterValue);
         } else if (filter.options) {
             var $field = $('<select class="filter-val" />').attr('name', makeName(filter.arg));
 
             $(filter.options).each(function() {
+                var $option = $('<option/>')
+                    .val(this[0]).text(optionText(filter, this[0], this[1]))
+                    .attr('data-label', this[1]);
+
                 // for active filter inputs with options, add "selected" if there is a matching active filter
                 if (filterValue && (filterValue == this[0])) {
-                    $field.append($('<option/>')
-                        .val(this[0]).text(this[1]).attr('selected', true));
-                } else {
-                    $field.append($('<option/>')
-                        .val(this[0]).text(this[1]));
+                    $option.attr('selected', true);
                 }
+
+                $field.append($option);
             });
+            $field.data('filter', filter);
         } else {
             var $field = $('<input type="text" class="filter-val form-control" />').attr('name', makeName(filter.arg));
             $field.val(filterValue);
@@ -96,6 +118,8 @@ var AdminFilters = function(element, filtersElement, filterGroups, activeFilters
                 }
             }
             faForm.applyStyle(field, filter.type);
+        } else if (filter.options_url) {
+            faForm.applyStyle(field, 'select2-ajax');
         } else if (filter.options) {
             filter.type = "select2";
             faForm.applyStyle(field, filter.type);
@@ -104,7 +128,7 @@ var AdminFilters = function(element, filtersElement, filterGroups, activeFilters
         return field;
     }
 
-    function addFilter(name, subfilters, selectedIndex, filterValue) {
+    function addFilter(name, subfilters, selectedIndex, filterValue, filterLabel) {
         var $el = $('<tr class="form-horizontal" />').appendTo($container);
 
         // Filter list
@@ -145,7 +169,7 @@ var AdminFilters = function(element, filtersElement, filterGroups, activeFilters
         var filter = subfilters[filterSelection];
         var $inputContainer = $('<td/>').appendTo($el);
 
-        var $newFilterField = createFilterInput($inputContainer, filterValue, filter).focus();
+        var $newFilterField = createFilterInput($inputContainer, filterValue, filter, filterLabel).focus();
         var $styledFilterField = styleFilterInput(filter, $newFilterField);
 
         return $styledFilterField;
@@ -164,8 +188,9 @@ var AdminFilters = function(element, filtersElement, filterGroups, activeFilters
     $.each(activeFilters, function( activeIndex, activeFilter ) {
         var idx = activeFilter[0],
             name = activeFilter[1],
-            filterValue = activeFilter[2];
-        var $activeField = addFilter(name, filterGroups[name], idx, filterValue);
+            filterValue = activeFilter[2],
+            filterLabel = activeFilter[3];
+        var $activeField = addFilter(name, filterGroups[name], idx, filterValue, filterLabel);
     });
 
     // show "Apply Filter" button when filter input is changed
@@ -182,6 +207,31 @@ var AdminFilters = function(element, filtersElement, filterGroups, activeFilters
     });
 
     lastCount += 1;
+
+    // load the facet counts and add them to the options already displayed
+    if (facetsUrl) {
+        $.getJSON(facetsUrl).done(function(data) {
+            $.each(data.facets, function(i, facet) {
+                facetCounts[facet.arg] = facet.counts;
+            });
+
+            $('select.filter-val', $root).each(function() {
+                var $field = $(this);
+                var filter = $field.data('filter');
+
+                if (!filter || !facetCounts[filter.arg]) {
+                    return;
+                }
+
+                $field.find('option').each(function() {
+                    var $option = $(this);
+                    $option.text(optionText(filter, $option.val(), $option.attr('data-label')));
+                });
+
+                $field.select2('val', $field.val());
+            });
+        });
+    }
 };
 
 (function($) {
@@ -194,7 +244,8 @@ var AdminFilters = function(element, filtersElement, filterGroups, activeFilters
             var filter = new AdminFilters(
                 '#filter_form', '.field-filters',
                 JSON.parse($('#filter-groups-data').text()),
-                JSON.parse($('#active-filters-data').text())
+                JSON.parse($('#active-filters-data').text()),
+                $('#filter-groups-data').data('facets-url')
             );
         }
     });
@@ -0,0 +1,78 @@
+// Infinite scrolling for the list view: when the end of the table is
+// scrolled into view, the next page is loaded from the JSON list API
+// and its rows are appended to the table.
+$(function() {
+    var $table = $('table.model-list[data-scroll-url]');
+    var $sentinel = $('.list-scroll-sentinel');
+
+    if (!$table.length || !$sentinel.length || !window.IntersectionObserver) {
+        return;
+    }
+
+    var url = $table.data('scroll-url');
+    var hasActions = !!$table.data('scroll-actions');
+    var loading = false;
+
+    function createRow(columns, row) {
+        var $tr = $('<tr>');
+
+        if (hasActions) {
+            $('<input type="checkbox" name="rowid" class="action-checkbox">')
+                .val(row.pk)
+                .appendTo($('<td>').appendTo($tr));
+        }
+
+        if (row.actions !== undefined) {
+            $('<td class="list-buttons-column">').html(row.actions).appendTo($tr);
+        }
+
+        $.each(columns, function(i, column) {
+            $('<td>')
+                .addClass('col-' + column.name)
+                .html(row.values[column.name])
+                .appendTo($tr);
+        });
+
+        return $tr;
+    }
+
+    function isVisible() {
+        return $sentinel[0].getBoundingClientRect().top <= window.innerHeight;
+    }
+
+    function loadNextPage() {
+        if (loading || !url) {
+            return;
+        }
+
+        loading = true;
+
+        $.getJSON(url).done(function(data) {
+            var $body = $table.children('tbody').last();
+
+            $.each(data.rows, function(i, row) {
+                $body.append(createRow(data.columns, row));
+            });
+
+            url = data.next_url;
+            loading = false;
+
+            if (!url) {
+                observer.disconnect();
+                $sentinel.remove();
+            } else if (isVisible()) {
+                loadNextPage();
+            }
+        }).fail(function() {
+            loading = false;
+        });
+    }
+
+    var observer = new IntersectionObserver(function(entries) {
+        if (entries[0].isIntersecting) {
+            loadNextPage();
+        }
+    });
+
+    observer.observe($sentinel[0]);
+});
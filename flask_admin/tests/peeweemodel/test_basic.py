@@ -287,6 +287,39 @@ def test_column_editable_list(
     assert "test1_val_3" in data
 
 
+def test_column_editable_list_batch(
+    app: Flask, db: peewee.SqliteDatabase, admin: Admin
+) -> None:
+    Model1, Model2 = create_models(db)
+
+    form_args = {"test1": {"validators": [validators.Length(max=20)]}}
+    view = CustomModelView(Model1, column_editable_list=["test1"], form_args=form_args)
+    admin.add_view(view)
+
+    fill_db(Model1, Model2)
+
+    client = app.test_client()
+
+    rv = client.post(
+        "/admin/model1/ajax/update/batch/",
+        json={
+            "edits": [
+                {"pk": "1", "column": "test1", "value": "batch-1"},
+                {"pk": "2", "column": "test1", "value": "x" * 21},
+                {"pk": "1000", "column": "test1", "value": "missing"},
+            ]
+        },
+    )
+    data = rv.json
+    assert data is not None
+    assert [r["success"] for r in data["results"]] == [True, False, False]
+
+    rv = client.get("/admin/model1/")
+    data = rv.data.decode("utf-8")
+    assert "batch-1" in data
+    assert "x" * 21 not in data
+
+
 def test_details_view(app: Flask, db: peewee.SqliteDatabase, admin: Admin) -> None:
     Model1, Model2 = create_models(db)
 
@@ -1059,6 +1092,9 @@ def test_ajax_fk(app: Flask, db: peewee.SqliteDatabase, admin: Admin) -> None:
     mdl = loader.get_one(model.id)  # type: ignore[attr-defined]
     assert mdl.test1 == model.test1
 
+    models = loader.get_many([model.id, model2.id, 1000])  # type: ignore[attr-defined]
+    assert sorted(m.test1 for m in models) == ["first", "foo"]
+
     items = loader.get_list("fir")
     assert len(items) == 1
     assert items[0].id == model.id  # type: ignore[attr-defined, union-attr]
@@ -1185,6 +1221,35 @@ def test_customising_page_size(
         assert "instance-016" not in rv.text
 
 
+def test_keyset_pagination_fallback(
+    app: Flask, db: peewee.SqliteDatabase, admin: Admin
+) -> None:
+    with app.app_context():
+        M1, _ = create_models(db)
+
+        for x in range(12):
+            M1(f"instance-{x + 1:03d}").save()
+
+        view = CustomModelView(M1, keyset_pagination=True, page_size=5)
+        admin.add_view(view)
+
+        client = app.test_client()
+
+        # peewee does not support keyset pagination, so pages use offsets
+        rv = client.get("/admin/model1/")
+        assert rv.status_code == 200
+        assert "instance-005" in rv.text
+        assert "instance-006" not in rv.text
+        assert "cursor=" not in rv.text
+        assert "/admin/model1/?page=2" in rv.text
+
+        rv = client.get("/admin/model1/?page=1")
+        assert rv.status_code == 200
+        assert "instance-005" not in rv.text
+        assert "instance-006" in rv.text
+        assert "instance-010" in rv.text
+
+
 def test_export_csv(app: Flask, db: peewee.SqliteDatabase, admin: Admin) -> None:
     Model1, Model2 = create_models(db)
 
@@ -1,4 +1,5 @@
 import enum
+import io
 import os
 import re
 import typing as t
@@ -17,16 +18,20 @@ from sqlalchemy import Column
 from sqlalchemy import Date
 from sqlalchemy import DateTime
 from sqlalchemy import Enum
+from sqlalchemy import event
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
+from sqlalchemy import Numeric
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import Text
 from sqlalchemy import Time
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import backref
 from sqlalchemy.orm import relationship
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy_utils import ArrowType
 from sqlalchemy_utils import ChoiceType
 from sqlalchemy_utils import ColorType
@@ -35,6 +40,7 @@ from sqlalchemy_utils import EmailType
 from sqlalchemy_utils import IPAddressType
 from sqlalchemy_utils import URLType
 from sqlalchemy_utils import UUIDType
+from werkzeug.datastructures import MultiDict
 from wtforms import fields
 from wtforms import PasswordField
 from wtforms import validators
@@ -48,8 +54,15 @@ from flask_admin.contrib.fileadmin import FileAdmin
 from flask_admin.contrib.sqla import filters
 from flask_admin.contrib.sqla import ModelView
 from flask_admin.contrib.sqla import tools
+from flask_admin.contrib.sqla.ajax import QueryAjaxModelLoader
+from flask_admin.contrib.sqla.fields import QuerySelectField
+from flask_admin.contrib.sqla.fields import QuerySelectMultipleField
+from flask_admin.contrib.sqla.search import PostgresFullTextSearch
+from flask_admin.contrib.sqla.search import SQLiteFullTextSearch
 from flask_admin.form.fields import DateTimeField
 from flask_admin.form.fields import Select2Field
+from flask_admin.model.cache import MemoryCache
+from flask_admin.model.form import create_editable_list_form
 from flask_admin.tests import flask_babel_test_decorator
 from flask_admin.tests.conftest import skip_or_return_session_or_db
 from flask_admin.tests.conftest import T_ANY_SQLA_PROVIDER
@@ -799,6 +812,185 @@ def test_column_editable_list(
         assert "test1_val_3" in data
 
 
+def test_column_editable_list_batch(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model1, param, column_editable_list=["test1", "enum_field"]
+        )
+        admin.add_view(view)
+        admin.add_view(CustomModelView(Model2, param))
+
+        class ShortValueView(CustomModelView):
+            def list_form(self, obj: t.Any | None = None) -> Form:
+                form = super().list_form(obj)
+                form.test1.validators = [validators.Length(max=5)]  # type: ignore[attr-defined]
+                return form
+
+        admin.add_view(
+            ShortValueView(
+                Model1, param, column_editable_list=["test1"], endpoint="short"
+            )
+        )
+
+        fill_db(sqla_db_ext, Model1, Model2)
+
+        client = app.test_client()
+
+        statements = []
+
+        def count_statement(*args: t.Any) -> None:
+            statements.append(args[2])
+
+        engine = sqla_db_ext.db.engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            rv = client.post(
+                "/admin/model1/ajax/update/batch/",
+                json={
+                    "edits": [
+                        {"pk": "1", "column": "test1", "value": "batch-1"},
+                        {"pk": "2", "column": "test1", "value": "batch-2"},
+                        {"pk": "2", "column": "enum_field", "value": "bad-input"},
+                        {"pk": "3", "column": "test2", "value": "not-editable"},
+                        {"pk": "1000", "column": "test1", "value": "missing"},
+                    ]
+                },
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert rv.status_code == 200
+        data = rv.json
+        assert data is not None
+        results = data["results"]
+        assert [(r["pk"], r["column"], r["success"]) for r in results] == [
+            ("1", "test1", True),
+            ("2", "test1", True),
+            ("2", "enum_field", False),
+            ("3", "test2", False),
+            ("1000", "test1", False),
+        ]
+        assert results[0]["message"] == "Record was successfully saved."
+        assert results[4]["message"] == "Record does not exist."
+
+        # all records are loaded with a single query
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 1
+
+        rv = client.get("/admin/model1/")
+        data = rv.data.decode("utf-8")
+        assert "batch-1" in data
+        assert "batch-2" in data
+        assert "not-editable" not in data
+
+        # the form is created by list_form
+        rv = client.post(
+            "/admin/short/ajax/update/batch/",
+            json={
+                "edits": [
+                    {"pk": "1", "column": "test1", "value": "short"},
+                    {"pk": "2", "column": "test1", "value": "too long"},
+                ]
+            },
+        )
+        data = rv.json
+        assert data is not None
+        assert [r["success"] for r in data["results"]] == [True, False]
+
+        # single cell updates validate with the same form
+        rv = client.post(
+            "/admin/short/ajax/update/",
+            data={"list_form_pk": "3", "test1": "too long"},
+        )
+        assert rv.status_code == 500
+
+        # malformed payload
+        rv = client.post("/admin/model1/ajax/update/batch/", json={"edits": "x"})
+        assert rv.status_code == 400
+
+        # disabled without column_editable_list
+        rv = client.post("/admin/model2/ajax/update/batch/", json={"edits": []})
+        assert rv.status_code == 404
+
+
+def test_column_editable_list_shared_form(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+
+        class ListFormView(CustomModelView):
+            def get_list_form(self) -> t.Any:
+                # a full form, trimmed to the editable columns by the view
+                return create_editable_list_form(
+                    self.form_base_class, self.scaffold_form()
+                )
+
+        view = ListFormView(Model2, param, column_editable_list=["model1"])
+        admin.add_view(view)
+
+        rows = []
+
+        class PerRowView(CustomModelView):
+            def list_form(self, obj: t.Any | None = None) -> Form:
+                form = super().list_form(obj)
+                rows.append(obj)
+                form.bool_field.data = obj.test1 != "test1_val_1"  # type: ignore[attr-defined, union-attr]
+                return form
+
+        admin.add_view(PerRowView(Model1, param, column_editable_list=["bool_field"]))
+
+        assert [f.name for f in view.list_form()] == ["list_form_pk", "model1"]
+
+        fill_db(sqla_db_ext, Model1, Model2)
+
+        client = app.test_client()
+
+        statements = []
+
+        def count_statement(*args: t.Any) -> None:
+            statements.append(args[2])
+
+        engine = sqla_db_ext.db.engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            rv = client.get("/admin/model2/")
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert rv.status_code == 200
+        data = rv.data.decode("utf-8")
+        assert data.count('data-role="x-editable"') == 5
+        assert 'data-value="1"' in data
+        assert 'data-value="2"' in data
+
+        # the choices are loaded once for the page, not once per row
+        choices = [s for s in statements if s.lstrip().startswith("SELECT model1.")]
+        assert len(choices) == 1
+
+        # overrides of list_form are called for every row
+        rv = client.get("/admin/model1/")
+        assert rv.status_code == 200
+        assert len(rows) == sqla_db_ext.db.session.query(Model1).count()
+        assert all(row is not None for row in rows)
+        assert rv.text.count('data-value="1"') == len(rows) - 1
+
+
 def test_details_view(
     app: Flask,
     sqla_db_ext: T_ANY_SQLA_PROVIDER,
@@ -1878,7 +2070,7 @@ def test_column_filters_sqla_obj(
         assert len(view._filters) == 7
 
 
-def test_column_filters_dotted_path(
+def test_column_filters_lazy_options(
     app: Flask,
     sqla_db_ext: T_ANY_SQLA_PROVIDER,
     admin: Admin,
@@ -1886,155 +2078,643 @@ def test_column_filters_dotted_path(
 ) -> None:
     with app.app_context():
         Model1, Model2 = create_models(sqla_db_ext)
-        fill_db(sqla_db_ext, Model1, Model2)
+
+        calls = []
+
+        def get_options() -> list[tuple[str, str]]:
+            calls.append(1)
+            return [("test1_val_1", "First"), ("test1_val_2", "Second")]
+
+        cached = filters.FilterEqual(Model1.test1, "Cached", options=get_options)  # type: ignore[attr-defined]
+        uncached = filters.FilterEqual(Model1.test2, "Uncached", options=get_options)  # type: ignore[attr-defined]
+        uncached.options_cache_timeout = 0
 
         param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(Model1, param, column_filters=[cached, uncached])
+        admin.add_view(view)
+        ajax_view = CustomModelView(
+            Model1,
+            param,
+            column_filters=[
+                filters.FilterEqual(Model1.test1, "Ajax", options=get_options)  # type: ignore[attr-defined]
+            ],
+            filter_options_ajax_threshold=1,
+            endpoint="ajax_filters",
+        )
+        admin.add_view(ajax_view)
 
-        # FilterInList with a dotted path traverses Model2 -> model1 -> test1.
-        flt = filters.FilterInList(column="model1.test1", name="Model1 Test1")
-        view = CustomModelView(
-            Model2, param, column_filters=[flt], endpoint="_dotted_path"
+        class SearchedFilter(filters.FilterEqual):
+            def search_options(
+                self, view: t.Any, query: str, offset: int, limit: int
+            ) -> list[tuple[str, str]]:
+                return [(query, query.upper())][offset : offset + limit]
+
+        searched = SearchedFilter(Model1.test1, "Searched", options=get_options)  # type: ignore[attr-defined]
+        searched.options_cache_timeout = 0
+        admin.add_view(
+            CustomModelView(
+                Model1, param, column_filters=[searched], endpoint="searched"
+            )
         )
-        admin.add_view(view)
 
-        # Binding resolves the string into the real attribute and records joins.
-        assert flt._bound is True
-        assert flt.column is Model1.test1  # type: ignore[attr-defined]
-        assert flt._joins  # at least one relationship to traverse
-        assert flt.key_name == "model1.test1"
-        assert "model1.test1" in view._filter_joins
+        # options are not loaded when the view is created
+        assert calls == []
+
+        fill_db(sqla_db_ext, Model1, Model2)
 
         client = app.test_client()
-        rv = client.get("/admin/_dotted_path/?flt0_0=test1_val_1")
+
+        rv = client.get("/admin/model1/")
         assert rv.status_code == 200
+        assert "Second" in rv.data.decode("utf-8")
+        assert len(calls) == 2
+
+        rv = client.get("/admin/model1/")
+        assert len(calls) == 3
+
+        # large option lists are loaded through ajax
+        rv = client.get("/admin/ajax_filters/?flt0_0=test1_val_2")
         data = rv.data.decode("utf-8")
-        assert "test2_val_1" in data  # joined row matches
-        assert "test2_val_2" not in data  # joined row excluded
+        assert "/admin/ajax_filters/ajax/filter/?name=0" in data
+        assert "First" not in data
+        assert '[0, "Ajax", "test1_val_2", "Second"]' in data
+        assert len(calls) == 4
+
+        # the filter script loaded by the page renders them with select2 ajax
+        script = re.search(r'src="([^"]*/bs4_filters\.js[^"]*)"', data)
+        assert script is not None
+        rv = client.get(script.group(1))
+        assert rv.status_code == 200
+        assert "filter.options_url" in rv.data.decode("utf-8")
+        rv.close()
 
+        rv = client.get("/admin/ajax_filters/ajax/filter/?name=0&query=sec")
+        assert rv.json == [["test1_val_2", "Second"]]
 
-def test_column_filters_dotted_path_unresolvable(
-    app: Flask,
-    sqla_db_ext: T_ANY_SQLA_PROVIDER,
-    admin: Admin,
-    session_or_db: T_LITERAL_SESSION_OR_DB,
-) -> None:
-    with app.app_context():
-        Model1, Model2 = create_models(sqla_db_ext)
-        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        rv = client.get("/admin/ajax_filters/ajax/filter/?name=0&offset=1&limit=5")
+        assert rv.json == [["test1_val_2", "Second"]]
 
-        flt = filters.FilterInList(column="does_not_exist", name="Missing")
-        # Path is unresolved until the view binds it.
-        assert flt._bound is False
-        assert flt.column == "does_not_exist"
+        rv = client.get("/admin/ajax_filters/ajax/filter/?name=missing")
+        assert rv.status_code == 404
+        assert len(calls) == 4
 
-        with pytest.raises(ValueError, match="Could not resolve filter path"):
-            CustomModelView(
-                Model2, param, column_filters=[flt], endpoint="_dotted_path_bad"
-            )
+        # options are refreshed once the default timeout expires
+        assert cached.options_cache_timeout == 300
+        cached._cached_options = (0.0, [])  # expired
+        rv = client.get("/admin/model1/")
+        assert len(calls) == 6
 
+        # filters can search their options without loading all of them
+        rv = client.get("/admin/searched/ajax/filter/?name=0&query=abc")
+        assert rv.json == [["abc", "ABC"]]
+        assert len(calls) == 6
 
-def test_column_filters_dotted_path_relationship_raises(
+
+def test_filter_facets(
     app: Flask,
     sqla_db_ext: T_ANY_SQLA_PROVIDER,
     admin: Admin,
     session_or_db: T_LITERAL_SESSION_OR_DB,
 ) -> None:
-    """A path that resolves to a relationship (not a column) is rejected."""
     with app.app_context():
         Model1, Model2 = create_models(sqla_db_ext)
+
         param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model1,
+            param,
+            column_filters=["bool_field", "enum_field", "enum_type_field", "test1"],
+            column_searchable_list=["test1"],
+            named_filter_urls=True,
+            filter_facets=True,
+            facet_cache=MemoryCache(timeout=60),
+        )
+        admin.add_view(view)
+        admin.add_view(CustomModelView(Model2, param, column_filters=["string_field"]))
 
-        # `model1` on Model2 is the relationship itself, not a column.
-        flt = filters.FilterEqual(column="model1", name="Model1")
+        session = sqla_db_ext.db.session
 
-        with pytest.raises(ValueError, match="Cannot filter on relationship"):
-            CustomModelView(
-                Model2, param, column_filters=[flt], endpoint="_dotted_path_rel"
-            )
+        def model1_options() -> list[tuple[t.Any, t.Any]]:
+            models: list[t.Any] = session.query(Model1).all()
+            return [(m.id, m.test1) for m in models]
+
+        relation_view = CustomModelView(
+            Model2,
+            param,
+            column_filters=[
+                "model1",
+                filters.FilterEqual(
+                    Model2.model1_id,  # type: ignore[attr-defined]
+                    "Model1",
+                    options=model1_options,
+                ),
+            ],
+            named_filter_urls=True,
+            filter_facets=True,
+            endpoint="relation",
+        )
+        admin.add_view(relation_view)
 
+        fill_db(sqla_db_ext, Model1, Model2)
 
-def test_column_filters_dotted_path_reuse_same_model(
+        client = app.test_client()
+
+        # relations are faceted through a filter with options on the foreign
+        # key, related columns without options are not counted
+        rv = client.get("/admin/relation/api/facets/")
+        data = rv.json
+        assert data is not None
+        facets = {f["arg"]: f["counts"] for f in data["facets"]}
+        assert "model1_bool_field_equals" in facets
+        assert "model1_test1_equals" not in facets
+        assert facets["model1_equals"]["1"] == 1
+        assert facets["model1_equals"]["3"] == 0
+
+        rv = client.get("/admin/model1/")
+        page = rv.data.decode("utf-8")
+        assert 'data-facets-url="/admin/model1/api/facets/' in page
+
+        # the filter script loaded by the page fetches and renders the counts
+        script = re.search(r'src="([^"]*/bs4_filters\.js[^"]*)"', page)
+        assert script is not None
+        rv = client.get(script.group(1))
+        assert rv.status_code == 200
+        assert "data('facets-url')" in rv.data.decode("utf-8")
+        rv.close()
+
+        rv = client.get("/admin/model1/api/facets/")
+        data = rv.json
+        assert data is not None
+        facets = {f["arg"]: f["counts"] for f in data["facets"]}
+        assert facets == {
+            "bool_field_equals": {"1": 1, "0": 14},
+            "enum_field_equals": {"model1_v1": 1, "model1_v2": 1},
+            "enum_type_field_equals": {"first": 1, "second": 1},
+        }
+
+        # counts follow the search and the filters of the other columns
+        rv = client.get(
+            "/admin/model1/api/facets/?search=enum" "&flt0_enum_field_equals=model1_v1"
+        )
+        data = rv.json
+        assert data is not None
+        facets = {f["arg"]: f["counts"] for f in data["facets"]}
+        assert facets["bool_field_equals"] == {"1": 0, "0": 1}
+        assert facets["enum_field_equals"] == {"model1_v1": 1, "model1_v2": 1}
+        assert facets["enum_type_field_equals"] == {"first": 0, "second": 0}
+
+        # cached until a model is changed through the view
+        sqla_db_ext.db.session.add(Model1(test1="new", bool_field=True))
+        sqla_db_ext.db.session.commit()
+        rv = client.get("/admin/model1/api/facets/")
+        data = rv.json
+        assert data is not None
+        assert data["facets"][0]["counts"] == {"1": 1, "0": 14}
+
+        view.invalidate_count_cache()
+        rv = client.get("/admin/model1/api/facets/")
+        data = rv.json
+        assert data is not None
+        assert data["facets"][0]["counts"] == {"1": 2, "0": 14}
+
+        rv = client.get("/admin/model2/api/facets/")
+        assert rv.status_code == 404
+
+
+def test_collection_search_and_filters_use_exists(
     app: Flask,
     sqla_db_ext: T_ANY_SQLA_PROVIDER,
     admin: Admin,
     session_or_db: T_LITERAL_SESSION_OR_DB,
 ) -> None:
-    """A string-path filter can be reused across views over the same model."""
     with app.app_context():
         Model1, Model2 = create_models(sqla_db_ext)
-        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
-
-        flt = filters.FilterInList(column="model1.test1", name="Model1 Test1")
 
-        view1 = CustomModelView(
-            Model2, param, column_filters=[flt], endpoint="_reuse_same_1"
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model1,
+            param,
+            column_searchable_list=["model2.string_field"],
+            column_filters=["model2.string_field"],
         )
-        view2 = CustomModelView(
-            Model2, param, column_filters=[flt], endpoint="_reuse_same_2"
+        admin.add_view(view)
+        join_view = CustomModelView(
+            Model1,
+            param,
+            column_searchable_list=["model2.string_field"],
+            column_filters=["model2.string_field"],
+            collection_exists=False,
+            endpoint="join_view",
         )
+        admin.add_view(join_view)
 
-        # Both views resolved against the same model; rebind is a no-op.
-        assert flt._bound_model is Model2
-        assert "model1.test1" in view1._filter_joins
-        assert "model1.test1" in view2._filter_joins
+        parent = Model1(test1="parent")
+        sqla_db_ext.db.session.add(parent)
+        sqla_db_ext.db.session.add(Model1(test1="childless"))
+        for i in range(3):
+            sqla_db_ext.db.session.add(Model2(string_field=f"child_{i}", model1=parent))
+        sqla_db_ext.db.session.commit()
 
+        def get_filter(view: t.Any, operation: str) -> tuple[int, str]:
+            for idx, flt in enumerate(view._filters):
+                if flt.operation() == operation:
+                    return idx, flt.name
+            raise AssertionError(operation)
 
-def test_column_filters_dotted_path_rebind_different_model_raises(
+        statements = []
+
+        def count_statement(*args: t.Any) -> None:
+            statements.append(args[2])
+
+        engine = sqla_db_ext.db.engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            count, data = view.get_list(0, None, False, "child", None)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        # one row and a correct count instead of one row per child
+        assert count == 1
+        assert [m.test1 for m in data] == ["parent"]  # type: ignore[union-attr]
+        assert all("JOIN" not in s for s in statements)
+        assert any("EXISTS" in s for s in statements)
+
+        count, _ = join_view.get_list(0, None, False, "child", None)
+        assert count == 3
+
+        idx, name = get_filter(view, "not equal")
+        count, data = view.get_list(0, None, False, None, [(idx, name, "child_0")])
+        assert count == 1
+        assert [m.test1 for m in data] == ["parent"]  # type: ignore[union-attr]
+
+        # rows without related objects match "empty", like with a join
+        idx, name = get_filter(view, "empty")
+        count, data = view.get_list(0, None, False, None, [(idx, name, "1")])
+        assert count == 1
+        assert [m.test1 for m in data] == ["childless"]  # type: ignore[union-attr]
+
+        count, data = view.get_list(0, None, False, None, [(idx, name, "0")])
+        assert count == 1
+        assert [m.test1 for m in data] == ["parent"]  # type: ignore[union-attr]
+
+
+def test_column_search_modes(
     app: Flask,
     sqla_db_ext: T_ANY_SQLA_PROVIDER,
     admin: Admin,
     session_or_db: T_LITERAL_SESSION_OR_DB,
 ) -> None:
-    """A string-path filter cannot be reused across views with different models."""
     with app.app_context():
         Model1, Model2 = create_models(sqla_db_ext)
+
         param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model2,
+            param,
+            column_searchable_list=["string_field", "int_field", "float_field"],
+            column_search_modes={"string_field": "prefix"},
+        )
+        admin.add_view(view)
+        iprefix_view = CustomModelView(
+            Model2,
+            param,
+            column_searchable_list=["string_field"],
+            column_search_modes={"string_field": "iprefix"},
+            endpoint="iprefix_view",
+        )
+        admin.add_view(iprefix_view)
+        exact_view = CustomModelView(
+            Model2,
+            param,
+            column_searchable_list=["string_field"],
+            column_search_modes={"string_field": "exact"},
+            endpoint="exact_view",
+        )
+        admin.add_view(exact_view)
 
-        flt = filters.FilterInList(column="model1.test1", name="Model1 Test1")
-        # First view binds the filter to Model2.
-        CustomModelView(Model2, param, column_filters=[flt], endpoint="_rebind_first")
-        assert flt._bound_model is Model2
+        sqla_db_ext.db.session.add(Model2(string_field="Apple", int_field=5000))
+        sqla_db_ext.db.session.add(Model2(string_field="pineapple", int_field=9000))
+        sqla_db_ext.db.session.add(Model2(string_field="a_b", float_field=1.5))
+        sqla_db_ext.db.session.add(Model2(string_field="axb", int_field=1))
+        sqla_db_ext.db.session.commit()
 
-        # Re-using the same filter against a different model raises loudly.
-        with pytest.raises(RuntimeError, match="cannot rebind to"):
+        statements = []
+
+        def count_statement(*args: t.Any) -> None:
+            statements.append(args[2])
+
+        engine = sqla_db_ext.db.engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            count, data = view.get_list(0, None, False, "Apple", None)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert count == 1
+        assert [m.string_field for m in data] == ["Apple"]  # type: ignore[union-attr]
+        # the string column is not cast and the numeric columns are skipped
+        assert all("CAST" not in s for s in statements)
+
+        # wildcards in the term are matched literally
+        count, data = view.get_list(0, None, False, "a_", None)
+        assert [m.string_field for m in data] == ["a_b"]  # type: ignore[union-attr]
+
+        # numeric columns only match valid numbers, by equality
+        count, data = view.get_list(0, None, False, "9000", None)
+        assert [m.int_field for m in data] == [9000]  # type: ignore[union-attr]
+        count, _ = view.get_list(0, None, False, "900", None)
+        assert count == 0
+        count, data = view.get_list(0, None, False, "1.5", None)
+        assert [m.string_field for m in data] == ["a_b"]  # type: ignore[union-attr]
+
+        count, data = iprefix_view.get_list(0, None, False, "APP", None)
+        assert [m.string_field for m in data] == ["Apple"]  # type: ignore[union-attr]
+
+        count, _ = exact_view.get_list(0, None, False, "apple", None)
+        assert count == 0
+        count, _ = exact_view.get_list(0, None, False, "Apple", None)
+        assert count == 1
+
+        with pytest.raises(Exception, match="Unsupported search mode"):
             CustomModelView(
-                Model1,
+                Model2,
                 param,
-                column_filters=[flt],
-                endpoint="_rebind_second",
+                column_searchable_list=["string_field"],
+                column_search_modes={"string_field": "soundex"},
+                endpoint="invalid_view",
             )
 
 
-def test_enum_filter_dotted_path(
+def test_search_backend_sqlite_fts5(
     app: Flask,
     sqla_db_ext: T_ANY_SQLA_PROVIDER,
     admin: Admin,
     session_or_db: T_LITERAL_SESSION_OR_DB,
 ) -> None:
-    """Verify _on_column_resolved hook fires for Enum filters with string columns."""
     with app.app_context():
         Model1, Model2 = create_models(sqla_db_ext)
-        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
 
-        flt = filters.EnumEqualFilter(
-            column="model1.enum_type_field", name="Model1 Enum"
+        session = sqla_db_ext.db.session
+        session.add(Model2(string_field="existing row", string_field_default="red"))
+        session.commit()
+
+        backend = SQLiteFullTextSearch(
+            Model2, columns=["string_field", "string_field_default"]
         )
-        # Before binding, enum_class is unset because column was a string.
-        assert flt.enum_class is None
+        backend.create_index(sqla_db_ext.db.engine)
 
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
         view = CustomModelView(
-            Model2, param, column_filters=[flt], endpoint="_dotted_enum"
+            Model2,
+            param,
+            search_backend=backend,
+            column_default_sort="id",
         )
         admin.add_view(view)
 
-        # Binding ran the hook, which populated enum_class from the resolved column.
-        assert flt._bound is True
-        assert flt.enum_class is Model1.EnumChoices  # type: ignore[attr-defined]
-        assert flt.column is Model1.enum_type_field  # type: ignore[attr-defined]
+        assert view._search_supported
 
+        fox = Model2(string_field="quick fox", string_field_default="brown")
+        foxes = Model2(string_field="fox fox", string_field_default="fox")
+        dog = Model2(string_field="lazy dog", string_field_default="brown")
+        session.add_all([fox, foxes, dog])
+        session.commit()
+
+        def search(term: str) -> list[str]:
+            count, data = view.get_list(0, None, False, term, None)
+            assert count == len(data)
+            return [m.string_field for m in data]  # type: ignore[union-attr]
+
+        assert search("existing") == ["existing row"]
+        # the most relevant rows come first
+        assert search("fox") == ["fox fox", "quick fox"]
+        assert search("brown dog") == ["lazy dog"]
+        # FTS5 query syntax is not interpreted
+        assert search('fox" OR "dog') == []
+        # a search without words does not filter the rows
+        assert search("   ") == ["existing row", "quick fox", "fox fox", "lazy dog"]
 
-def test_hybrid_property(
-    app: Flask,
+        client = app.test_client()
+        rv = client.get("/admin/model2/?search=%20%20")
+        assert rv.status_code == 200
+        assert "lazy dog" in rv.text
+
+        # an explicit sort column replaces the relevance order
+        _, data = view.get_list(0, "string_field", True, "fox", None)
+        assert [m.string_field for m in data] == [  # type: ignore[union-attr]
+            "quick fox",
+            "fox fox",
+        ]
+
+        dog.string_field = "lazy cat"
+        session.delete(fox)
+        session.commit()
+
+        assert search("dog") == []
+        assert search("cat") == ["lazy cat"]
+        assert search("fox") == ["fox fox"]
+
+
+def test_search_backend_postgres_sql(
+    app: Flask, sqla_db_ext: T_ANY_SQLA_PROVIDER
+) -> None:
+    with app.app_context():
+        _, Model2 = create_models(sqla_db_ext)
+
+        dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+        backend = PostgresFullTextSearch(
+            Model2, columns=["string_field", "string_field_default"]
+        )
+        ddl = str(CreateIndex(backend.get_index()).compile(dialect=dialect))
+        assert ddl == (
+            "CREATE INDEX ix_model2_fulltext ON model2 USING gin "
+            "(to_tsvector('english', "
+            "(coalesce(string_field, '') || ' ') || coalesce(string_field_default, '')"
+            "))"
+        )
+        # concat_ws is not IMMUTABLE and fails in an index expression
+        assert "concat_ws" not in ddl
+
+        query: t.Any = sqla_db_ext.db.session.query(Model2)
+        sql = str(
+            backend.apply(query, "fox")
+            .order_by(backend.get_order_by("fox"))
+            .statement.compile(dialect=dialect)
+        )
+        vector = (
+            "to_tsvector('english', (coalesce(model2.string_field, '') || ' ') "
+            "|| coalesce(model2.string_field_default, ''))"
+        )
+        assert f"WHERE {vector} @@ websearch_to_tsquery('english', " in sql
+        assert f"ORDER BY ts_rank({vector}, " in sql
+
+        backend = PostgresFullTextSearch(Model2, vector="string_field")
+        ddl = str(CreateIndex(backend.get_index()).compile(dialect=dialect))
+        assert ddl == (
+            "CREATE INDEX ix_model2_fulltext ON model2 USING gin (string_field)"
+        )
+
+
+def test_column_filters_dotted_path(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+        fill_db(sqla_db_ext, Model1, Model2)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+
+        # FilterInList with a dotted path traverses Model2 -> model1 -> test1.
+        flt = filters.FilterInList(column="model1.test1", name="Model1 Test1")
+        view = CustomModelView(
+            Model2, param, column_filters=[flt], endpoint="_dotted_path"
+        )
+        admin.add_view(view)
+
+        # Binding resolves the string into the real attribute and records joins.
+        assert flt._bound is True
+        assert flt.column is Model1.test1  # type: ignore[attr-defined]
+        assert flt._joins  # at least one relationship to traverse
+        assert flt.key_name == "model1.test1"
+        assert "model1.test1" in view._filter_joins
+
+        client = app.test_client()
+        rv = client.get("/admin/_dotted_path/?flt0_0=test1_val_1")
+        assert rv.status_code == 200
+        data = rv.data.decode("utf-8")
+        assert "test2_val_1" in data  # joined row matches
+        assert "test2_val_2" not in data  # joined row excluded
+
+
+def test_column_filters_dotted_path_unresolvable(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+
+        flt = filters.FilterInList(column="does_not_exist", name="Missing")
+        # Path is unresolved until the view binds it.
+        assert flt._bound is False
+        assert flt.column == "does_not_exist"
+
+        with pytest.raises(ValueError, match="Could not resolve filter path"):
+            CustomModelView(
+                Model2, param, column_filters=[flt], endpoint="_dotted_path_bad"
+            )
+
+
+def test_column_filters_dotted_path_relationship_raises(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    """A path that resolves to a relationship (not a column) is rejected."""
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+
+        # `model1` on Model2 is the relationship itself, not a column.
+        flt = filters.FilterEqual(column="model1", name="Model1")
+
+        with pytest.raises(ValueError, match="Cannot filter on relationship"):
+            CustomModelView(
+                Model2, param, column_filters=[flt], endpoint="_dotted_path_rel"
+            )
+
+
+def test_column_filters_dotted_path_reuse_same_model(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    """A string-path filter can be reused across views over the same model."""
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+
+        flt = filters.FilterInList(column="model1.test1", name="Model1 Test1")
+
+        view1 = CustomModelView(
+            Model2, param, column_filters=[flt], endpoint="_reuse_same_1"
+        )
+        view2 = CustomModelView(
+            Model2, param, column_filters=[flt], endpoint="_reuse_same_2"
+        )
+
+        # Both views resolved against the same model; rebind is a no-op.
+        assert flt._bound_model is Model2
+        assert "model1.test1" in view1._filter_joins
+        assert "model1.test1" in view2._filter_joins
+
+
+def test_column_filters_dotted_path_rebind_different_model_raises(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    """A string-path filter cannot be reused across views with different models."""
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+
+        flt = filters.FilterInList(column="model1.test1", name="Model1 Test1")
+        # First view binds the filter to Model2.
+        CustomModelView(Model2, param, column_filters=[flt], endpoint="_rebind_first")
+        assert flt._bound_model is Model2
+
+        # Re-using the same filter against a different model raises loudly.
+        with pytest.raises(RuntimeError, match="cannot rebind to"):
+            CustomModelView(
+                Model1,
+                param,
+                column_filters=[flt],
+                endpoint="_rebind_second",
+            )
+
+
+def test_enum_filter_dotted_path(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    """Verify _on_column_resolved hook fires for Enum filters with string columns."""
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+
+        flt = filters.EnumEqualFilter(
+            column="model1.enum_type_field", name="Model1 Enum"
+        )
+        # Before binding, enum_class is unset because column was a string.
+        assert flt.enum_class is None
+
+        view = CustomModelView(
+            Model2, param, column_filters=[flt], endpoint="_dotted_enum"
+        )
+        admin.add_view(view)
+
+        # Binding ran the hook, which populated enum_class from the resolved column.
+        assert flt._bound is True
+        assert flt.enum_class is Model1.EnumChoices  # type: ignore[attr-defined]
+        assert flt.column is Model1.enum_type_field  # type: ignore[attr-defined]
+
+
+def test_hybrid_property(
+    app: Flask,
     sqla_db_ext: T_ANY_SQLA_PROVIDER,
     admin: Admin,
     session_or_db: T_LITERAL_SESSION_OR_DB,
@@ -3102,95 +3782,445 @@ def test_ajax_fk_multi(
         assert mdl.model1 is not None
         assert len(mdl.model1) == 1
 
+        # Check the selected models are loaded with one query
+        models = [Model1(name=f"bulk{i}") for i in range(5)]
+        sqla_db_ext.db.session.add_all(models)
+        sqla_db_ext.db.session.commit()
 
-def test_safe_redirect(
-    app: Flask,
-    sqla_db_ext: T_ANY_SQLA_PROVIDER,
-    admin: Admin,
-    session_or_db: T_LITERAL_SESSION_OR_DB,
-) -> None:
-    with app.app_context():
-        Model1, _ = create_models(sqla_db_ext)
+        loader = view._form_ajax_refs["model1"]
+        assert loader.get_many([]) == []
+        assert {m.name for m in loader.get_many([models[0].id, 1000])} == {"bulk0"}
 
-        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
-        view = CustomModelView(Model1, param)
-        admin.add_view(view)
+        ids = ",".join(str(m.id) for m in models)
 
-        client = app.test_client()
+        statements = []
 
-        rv = client.post(
-            "/admin/model1/new/?url=http://localhost/admin/model2view/",
-            data=dict(
-                test1="test1large",
-                test2="test2",
-                _continue_editing="Save and Continue Editing",
-            ),
-        )
+        def count_statement(*args: t.Any) -> None:
+            statements.append(args[2])
 
-        assert rv.status_code == 302
+        engine = sqla_db_ext.db.engine
+        event.listen(engine, "before_cursor_execute", count_statement)
 
-        # werkzeug 2.1.0+ now returns *relative* redirect/location by default.
-        expected = "/admin/model1/edit/"
+        try:
+            rv = client.post("/admin/view/new/", data={"name": "bulk", "model1": ids})
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
 
-        # handle old werkzeug (or if relative location is disabled via
-        # `autocorrect_location_header=True`)
-        if (
-            not hasattr(rv, "autocorrect_location_header")
-            or rv.autocorrect_location_header
-        ):
-            expected = "http://localhost" + expected
+        assert rv.status_code == 302
+        assert len([s for s in statements if "FROM model1" in s]) == 1
 
-        assert rv.location.startswith(expected)
-        assert "url=http://localhost/admin/model2view/" in rv.location
-        assert "id=1" in rv.location
+        mdl = sqla_db_ext.db.session.query(Model2).filter_by(name="bulk").one()
+        assert len(mdl.model1) == 5
 
-        rv = client.post(
-            "/admin/model1/new/?url=http://google.com/evil/",
-            data=dict(
-                test1="test1large",
-                test2="test2",
-                _continue_editing="Save and Continue Editing",
-            ),
+        # the submitted order is kept and duplicates are valid
+        form = view.create_form()
+        form.model1.process_formdata(  # type: ignore[attr-defined]
+            [f"{models[3].id},{models[1].id},{models[3].id}"]
         )
+        form.model1.pre_validate(form)  # type: ignore[attr-defined]
+        assert [m.name for m in form.model1.data] == ["bulk3", "bulk1"]  # type: ignore[attr-defined]
 
-        assert rv.status_code == 302
-        assert rv.location.startswith(expected)
-        assert "url=/admin/model1/" in rv.location
-        assert "id=2" in rv.location
+        # unknown ids are rejected
+        rv = client.post("/admin/view/new/", data={"name": "bad", "model1": "1,1000"})
+        assert rv.status_code == 200
+        assert sqla_db_ext.db.session.query(Model2).filter_by(name="bad").count() == 0
 
 
-def test_relative_redirect_on_save_and_add_another(
+def test_ajax_lookup_search_mode_and_cache(
     app: Flask,
     sqla_db_ext: T_ANY_SQLA_PROVIDER,
     admin: Admin,
     session_or_db: T_LITERAL_SESSION_OR_DB,
 ) -> None:
-    """
-    Test that redirect URL after "Save and Add Another" is relative
-    """
     with app.app_context():
-        Model1, _ = create_models(sqla_db_ext)
+        Model1, Model2 = create_models(sqla_db_ext)
 
         param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
-        view = CustomModelView(Model1, param)
+        view = CustomModelView(
+            Model2,
+            param,
+            url="view",
+            form_ajax_refs={
+                "model1": {
+                    "fields": ("test1", "id"),
+                    "search_mode": "prefix",
+                    "minimum_input_length": 2,
+                    "cache_timeout": 60,
+                }
+            },
+        )
         admin.add_view(view)
 
-        client = app.test_client()
+        first = Model1(test1="first")
+        sqla_db_ext.db.session.add_all([first, Model1(test1="in_first")])
+        sqla_db_ext.db.session.commit()
 
-        rv = client.post(
-            "/admin/model1/new/?url=http://localhost/admin/model2view/",
-            data=dict(
-                test1="test",
-                _add_another="Save and Add Another",
-            ),
-        )
+        loader = view._form_ajax_refs["model1"]
+        assert [m.test1 for m in loader.get_list("fir")] == ["first"]  # type: ignore[union-attr]
+        assert [m.test1 for m in loader.get_list(str(first.id))] == ["first"]  # type: ignore[union-attr]
+        assert loader.get_list("x") == []
 
-        assert rv.status_code == 302
+        with pytest.raises(ValueError, match="Unsupported search mode"):
+            QueryAjaxModelLoader(
+                "model1", param, Model1, fields=["test1"], search_mode="soundex"
+            )
 
-        # werkzeug 2.1.0+ now returns *relative* redirect/location by default.
-        expected = "/admin/model1/new/"
+        client = app.test_client()
+        url = "/admin/view/ajax/lookup/?name=model1&query=fi"
 
-        # handle old werkzeug (or if relative location is disabled via
+        # terms shorter than minimum_input_length are not looked up
+        rv = client.get("/admin/view/ajax/lookup/?name=model1&query=f")
+        assert rv.json == []
+
+        rv = client.get(url)
+        assert rv.json == [[first.id, "first"]]
+        assert rv.cache_control.max_age == 60
+        assert rv.cache_control.private
+        etag = rv.headers["ETag"]
+
+        # results are served from the cache
+        sqla_db_ext.db.session.add(Model1(test1="fifth"))
+        sqla_db_ext.db.session.commit()
+
+        rv = client.get(url, headers={"If-None-Match": etag})
+        assert rv.status_code == 304
+
+        loader.cache.clear()  # type: ignore[union-attr]
+        rv = client.get(url, headers={"If-None-Match": etag})
+        assert rv.status_code == 200
+        data = rv.json
+        assert data is not None
+        assert sorted(label for _, label in data) == ["fifth", "first"]
+
+        # loaders sharing a cache do not return each other's results
+        cache = MemoryCache(timeout=60)
+        model1_loader = QueryAjaxModelLoader(
+            "related", param, Model1, fields=["test1"], cache=cache
+        )
+        model2_loader = QueryAjaxModelLoader(
+            "related", param, Model2, fields=["string_field"], cache=cache
+        )
+        model2 = Model2(string_field="fifth model2")
+        sqla_db_ext.db.session.add(model2)
+        sqla_db_ext.db.session.commit()
+
+        assert [label for _, label in model1_loader.get_lookup("fifth")] == ["fifth"]  # type: ignore[misc]
+        assert [pk for pk, _ in model2_loader.get_lookup("fifth")] == [model2.id]  # type: ignore[misc]
+
+
+def test_query_select_field_loads_submitted_pks(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+        fill_db(sqla_db_ext, Model1, Model2)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(Model2, param, form_columns=["string_field", "model1"])
+        admin.add_view(view)
+
+        session = sqla_db_ext.db.session
+        model1: t.Any = session.query(Model1).filter_by(test1="test1_val_2").one()
+
+        statements = []
+
+        def count_statement(*args: t.Any) -> None:
+            statements.append(args[2])
+
+        engine = sqla_db_ext.db.engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            client = app.test_client()
+            rv = client.post(
+                "/admin/model2/new/",
+                data={"string_field": "targeted", "model1": str(model1.id)},
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert rv.status_code == 302
+
+        # only the submitted primary key is queried
+        selects = [s for s in statements if "FROM model1" in s]
+        assert len(selects) == 1
+        assert " IN " in selects[0]
+
+        mdl: t.Any = session.query(Model2).filter_by(string_field="targeted").one()
+        assert mdl.model1.test1 == "test1_val_2"
+
+        # multiple selections keep the submitted order
+        calls = []
+
+        def query_factory() -> t.Any:
+            calls.append(1)
+            return session.query(Model1)
+
+        class MultiForm(Form):
+            models = QuerySelectMultipleField(query_factory=query_factory)
+
+        selected: list[t.Any] = session.query(Model1).limit(3).all()
+        ids = [m.id for m in reversed(selected)]
+        form = MultiForm(
+            MultiDict([("models", str(pk)) for pk in (ids[0], ids[2], ids[0])])
+        )
+        assert form.validate()
+        assert [m.id for m in form.models.data] == [ids[0], ids[2]]
+        assert len(calls) == 1
+
+
+def test_query_select_field_uuid_pk(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    Uuid = pytest.importorskip("sqlalchemy").__dict__.get("Uuid")
+    if Uuid is None:
+        pytest.skip("sqlalchemy.Uuid requires SQLAlchemy 2")
+
+    with app.app_context():
+
+        class Tag(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "tag"
+            id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+            name = Column(String(20))
+
+            def __str__(self) -> str:
+                return str(self.name)
+
+        class Post(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "post"
+            id = Column(Integer, primary_key=True)
+            title = Column(String(20))
+            tag_id = Column(Uuid, ForeignKey(Tag.id), nullable=False)
+            tag = relationship(Tag)
+
+        sqla_db_ext.create_all()
+
+        session = sqla_db_ext.db.session
+        tag = Tag(name="tag_1")
+        session.add_all([tag, Tag(name="tag_2")])
+        session.commit()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(Post, param, form_columns=["title", "tag"])
+        admin.add_view(view)
+
+        client = app.test_client()
+
+        rv = client.post("/admin/post/new/", data={"title": "p1", "tag": str(tag.id)})
+        assert rv.status_code == 302
+
+        post: t.Any = session.query(Post).filter_by(title="p1").one()
+        assert post.tag.name == "tag_1"
+
+        # values which are not a UUID are invalid choices
+        rv = client.post("/admin/post/new/", data={"title": "p2", "tag": "nope"})
+        assert rv.status_code == 200
+        assert "Not a valid choice" in rv.text
+
+
+def test_form_ajax_threshold(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+        fill_db(sqla_db_ext, Model1, Model2)
+
+    param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+
+    # views can be created outside of an application context
+    view = CustomModelView(Model2, param, form_ajax_threshold=10)
+    admin.add_view(view)
+    small_view = CustomModelView(
+        Model2, param, form_ajax_threshold=20, endpoint="small_view"
+    )
+    admin.add_view(small_view)
+
+    # threshold loaders are kept apart from form_ajax_refs
+    assert "model1" not in view._form_ajax_refs
+    assert "model1" in view._form_threshold_ajax_refs
+    assert "model1" in small_view._form_threshold_ajax_refs
+
+    with app.app_context():
+        form = view.create_form()
+        assert form.model1.__class__.__name__ == "AjaxSelectField"  # type: ignore[attr-defined]
+        form = view.edit_form()
+        assert form.model1.__class__.__name__ == "AjaxSelectField"  # type: ignore[attr-defined]
+
+        form = small_view.create_form()
+        assert form.model1.__class__.__name__ == "QuerySelectField"  # type: ignore[attr-defined]
+        form = small_view.edit_form()
+        assert form.model1.__class__.__name__ == "QuerySelectField"  # type: ignore[attr-defined]
+
+        client = app.test_client()
+        rv = client.get("/admin/model2/ajax/lookup/?name=model1&query=test1_val_2")
+        data = rv.json
+        assert data is not None
+        assert [label for _, label in data] == ["test1_val_2"]
+
+        # the rows are counted again when the form is created
+        session = sqla_db_ext.db.session
+        session.add_all([Model1(test1=f"extra_{i}") for i in range(10)])
+        session.commit()
+
+        form = small_view.create_form()
+        assert form.model1.__class__.__name__ == "AjaxSelectField"  # type: ignore[attr-defined]
+
+        rv = client.get("/admin/small_view/new/")
+        assert rv.status_code == 200
+        assert 'data-role="select2-ajax"' in rv.text
+
+
+def test_shared_choice_cache(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        session = sqla_db_ext.db.session
+        session.add_all([Model1(test1=f"user_{i}") for i in range(3)])
+        session.commit()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model2,
+            param,
+            form_columns=["string_field", "model1", "reviewer"],
+            form_extra_fields={
+                "reviewer": QuerySelectField(
+                    query_factory=lambda: session.query(Model1), allow_blank=True
+                )
+            },
+        )
+        admin.add_view(view)
+
+        statements = []
+
+        def count_statement(*args: t.Any) -> None:
+            statements.append(args[2])
+
+        engine = sqla_db_ext.db.engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            client = app.test_client()
+            rv = client.get("/admin/model2/new/")
+            assert rv.status_code == 200
+            first = [s for s in statements if "FROM model1" in s]
+
+            rv = client.get("/admin/model2/new/")
+            assert rv.status_code == 200
+            selects = [s for s in statements if "FROM model1" in s]
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        # both fields render the options of a single query
+        assert len(first) == 1
+        assert rv.data.decode("utf-8").count("user_2") == 2
+
+        # the cache is cleared when the request ends
+        assert len(selects) == 2
+
+
+def test_safe_redirect(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        Model1, _ = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(Model1, param)
+        admin.add_view(view)
+
+        client = app.test_client()
+
+        rv = client.post(
+            "/admin/model1/new/?url=http://localhost/admin/model2view/",
+            data=dict(
+                test1="test1large",
+                test2="test2",
+                _continue_editing="Save and Continue Editing",
+            ),
+        )
+
+        assert rv.status_code == 302
+
+        # werkzeug 2.1.0+ now returns *relative* redirect/location by default.
+        expected = "/admin/model1/edit/"
+
+        # handle old werkzeug (or if relative location is disabled via
+        # `autocorrect_location_header=True`)
+        if (
+            not hasattr(rv, "autocorrect_location_header")
+            or rv.autocorrect_location_header
+        ):
+            expected = "http://localhost" + expected
+
+        assert rv.location.startswith(expected)
+        assert "url=http://localhost/admin/model2view/" in rv.location
+        assert "id=1" in rv.location
+
+        rv = client.post(
+            "/admin/model1/new/?url=http://google.com/evil/",
+            data=dict(
+                test1="test1large",
+                test2="test2",
+                _continue_editing="Save and Continue Editing",
+            ),
+        )
+
+        assert rv.status_code == 302
+        assert rv.location.startswith(expected)
+        assert "url=/admin/model1/" in rv.location
+        assert "id=2" in rv.location
+
+
+def test_relative_redirect_on_save_and_add_another(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    """
+    Test that redirect URL after "Save and Add Another" is relative
+    """
+    with app.app_context():
+        Model1, _ = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(Model1, param)
+        admin.add_view(view)
+
+        client = app.test_client()
+
+        rv = client.post(
+            "/admin/model1/new/?url=http://localhost/admin/model2view/",
+            data=dict(
+                test1="test",
+                _add_another="Save and Add Another",
+            ),
+        )
+
+        assert rv.status_code == 302
+
+        # werkzeug 2.1.0+ now returns *relative* redirect/location by default.
+        expected = "/admin/model1/new/"
+
+        # handle old werkzeug (or if relative location is disabled via
         # `autocorrect_location_header=True`)
         if (
             not hasattr(rv, "autocorrect_location_header")
@@ -3244,126 +4274,691 @@ def test_customising_page_size(
         )
         admin.add_view(view1)
 
-        view2 = CustomModelView(
-            M1, param, endpoint="view2", page_size=5, can_set_page_size=False
-        )
-        admin.add_view(view2)
+        view2 = CustomModelView(
+            M1, param, endpoint="view2", page_size=5, can_set_page_size=False
+        )
+        admin.add_view(view2)
+
+        view3 = CustomModelView(
+            M1, param, endpoint="view3", page_size=20, can_set_page_size=True
+        )
+        admin.add_view(view3)
+
+        view4 = CustomModelView(
+            M1,
+            param,
+            endpoint="view4",
+            page_size=5,
+            page_size_options=(5, 10, 15),
+            can_set_page_size=True,
+        )
+        admin.add_view(view4)
+
+        client = app.test_client()
+
+        rv = client.get("/admin/view1/")
+        assert "instance-020" in rv.text
+        assert "instance-021" not in rv.text
+
+        # `can_set_page_size=False`, so only the default of 20 is available.
+        rv = client.get("/admin/view1/?page_size=50")
+        assert "instance-020" in rv.text
+        assert "instance-021" not in rv.text
+
+        # Check view2, which has `page_size=5` to change the default page size
+        rv = client.get("/admin/view2/")
+        assert "instance-005" in rv.text
+        assert "instance-006" not in rv.text
+
+        # Check view3, which has `can_set_page_size=True`
+        rv = client.get("/admin/view3/")
+        assert "instance-020" in rv.text
+        assert "instance-021" not in rv.text
+
+        rv = client.get("/admin/view3/?page_size=50")
+        assert "instance-050" in rv.text
+        assert "instance-051" not in rv.text
+
+        rv = client.get("/admin/view3/?page_size=100")
+        assert "instance-100" in rv.text
+        assert "instance-101" not in rv.text
+
+        # Invalid page sizes are reset to the default
+        rv = client.get("/admin/view3/?page_size=1")
+        assert "instance-020" in rv.text
+        assert "instance-021" not in rv.text
+
+        # Check view4, which has custom `page_size_options`
+        rv = client.get("/admin/view4/")
+        assert "instance-005" in rv.text
+        assert "instance-006" not in rv.text
+
+        # Invalid page sizes are reset to the default
+        rv = client.get("/admin/view4/?page_size=1")
+        assert "instance-005" in rv.text
+        assert "instance-006" not in rv.text
+
+        rv = client.get("/admin/view4/?page_size=10")
+        assert "instance-010" in rv.text
+        assert "instance-011" not in rv.text
+
+        rv = client.get("/admin/view4/?page_size=15")
+        assert "instance-015" in rv.text
+        assert "instance-016" not in rv.text
+
+
+def test_unlimited_page_size(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        M1, _ = create_models(sqla_db_ext)
+
+        sqla_db_ext.db.session.add_all(
+            [
+                M1(test1="1"),
+                M1(test1="2"),
+                M1(test1="3"),
+                M1(test1="4"),
+                M1(test1="5"),
+                M1(test1="6"),
+                M1(test1="7"),
+                M1(test1="8"),
+                M1(test1="9"),
+                M1(test1="10"),
+                M1(test1="11"),
+                M1(test1="12"),
+                M1(test1="13"),
+                M1(test1="14"),
+                M1(test1="15"),
+                M1(test1="16"),
+                M1(test1="17"),
+                M1(test1="18"),
+                M1(test1="19"),
+                M1(test1="20"),
+                M1(test1="21"),
+            ]
+        )
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(M1, param)
+
+        # test 0 as page_size
+        _, data = view.get_list(0, None, False, None, None, execute=True, page_size=0)
+        assert len(data) == 21
+
+        # test False as page_size
+        _, data = view.get_list(
+            0, None, False, None, None, execute=True, page_size=False
+        )
+        assert len(data) == 21
+
+
+def test_keyset_pagination(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        M1, _ = create_models(sqla_db_ext)
+
+        sqla_db_ext.db.session.add_all(
+            [M1(test1=f"instance-{x + 1:03d}") for x in range(12)]
+        )
+        sqla_db_ext.db.session.commit()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            M1,
+            param,
+            keyset_pagination=True,
+            page_size=5,
+            column_list=("test1",),
+        )
+        admin.add_view(view)
+
+        # the page is found by seeking from the cursor instead of an offset
+        _, data = view.get_list(0, None, False, None, None, page_size=5)
+        cursor = view.get_list_cursor(data[-1], None, False)
+        assert cursor is not None
+        _, query = view.get_list(
+            1, None, False, None, None, execute=False, page_size=5, cursor=cursor
+        )
+        assert "WHERE model1.id > " in str(query)
+        assert query.statement._offset_clause is None  # type: ignore[attr-defined]
+
+        _, data = view.get_list(1, None, False, None, None, page_size=5, cursor=cursor)
+        values = [m.test1 for m in data]  # type: ignore[union-attr]
+        assert values == [f"instance-{x:03d}" for x in range(6, 11)]
+
+        # previous page keeps the ascending order
+        cursor = view.get_list_cursor(data[0], None, False, backwards=True)
+        _, data = view.get_list(0, None, False, None, None, page_size=5, cursor=cursor)
+        values = [m.test1 for m in data]  # type: ignore[union-attr]
+        assert values == [f"instance-{x:03d}" for x in range(1, 6)]
+
+        # invalid cursor falls back to the page offset
+        _, data = view.get_list(2, None, False, None, None, page_size=5, cursor="!")
+        values = [m.test1 for m in data]  # type: ignore[union-attr]
+        assert values == ["instance-011", "instance-012"]
+
+        # nullable sort columns fall back to offset pagination
+        assert view.get_list_cursor(data[0], "test1", False) is None
+        _, data = view.get_list(1, "test1", True, None, None, page_size=5)
+        assert data[0].test1 == "instance-007"  # type: ignore[union-attr]
+
+        client = app.test_client()
+
+        rv = client.get("/admin/model1/")
+        assert rv.status_code == 200
+        assert "instance-005" in rv.text
+        assert "instance-006" not in rv.text
+
+        next_url = re.findall(r'href="([^"]*cursor=[^"]*)"', rv.text)
+        assert len(next_url) == 1
+
+        rv = client.get(next_url[0].replace("&amp;", "&"))
+        assert rv.status_code == 200
+        assert "instance-005" not in rv.text
+        assert "instance-006" in rv.text
+        assert "instance-010" in rv.text
+        assert "instance-011" not in rv.text
+
+
+def test_count_mode(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        M1, _ = create_models(sqla_db_ext)
+
+        sqla_db_ext.db.session.add_all(
+            [M1(test1=f"instance-{x + 1:03d}") for x in range(12)]
+        )
+        sqla_db_ext.db.session.commit()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        capped_view = CustomModelView(
+            M1,
+            param,
+            endpoint="capped",
+            column_searchable_list=["test1"],
+            count_mode="capped",
+            count_cap=5,
+        )
+        admin.add_view(capped_view)
+
+        estimated_view = CustomModelView(
+            M1, param, endpoint="estimated", count_mode="estimated"
+        )
+        admin.add_view(estimated_view)
+
+        count, _ = capped_view.get_list(0, None, False, None, None)
+        assert count == 6
+        assert capped_view.is_count_approximate(count)
+        assert capped_view.get_count_label(count) == "5+"
+
+        count, _ = capped_view.get_list(0, None, False, "instance-01", None)
+        assert count == 3
+        assert not capped_view.is_count_approximate(count)
+
+        # SQLite has no row estimate, rows are counted
+        count, _ = estimated_view.get_list(0, None, False, None, None)
+        assert count == 12
+        assert not estimated_view.is_count_approximate(count)
+
+        # the EXPLAIN parameters follow the paramstyle of the driver
+        count_query = estimated_view.get_count_query().filter(
+            M1.test1.in_(["a", "b"]),  # type: ignore[attr-defined]
+            M1.id > 3,  # type: ignore[attr-defined]
+        )
+        sql, params = estimated_view._get_explain_statement(
+            count_query,
+            postgresql.pg8000.dialect(),  # type: ignore[no-untyped-call]
+        )
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT 1")
+        assert sql.count("%s") == 3
+        assert params == ("a", "b", 3)
+
+        sql, params = estimated_view._get_explain_statement(
+            count_query,
+            postgresql.psycopg2.dialect(),  # type: ignore[no-untyped-call]
+        )
+        assert "IN (%(test1_1_1)s, %(test1_1_2)s)" in sql
+        assert params == {"test1_1_1": "a", "test1_1_2": "b", "id_1": 3}
+
+        client = app.test_client()
+
+        rv = client.get("/admin/capped/?page_size=2")
+        assert rv.status_code == 200
+        assert "List (5+)" in rv.text
+
+        rv = client.get("/admin/estimated/")
+        assert rv.status_code == 200
+        assert "List (12)" in rv.text
+
+
+def test_count_cache(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        M1, _ = create_models(sqla_db_ext)
+
+        sqla_db_ext.db.session.add_all(
+            [M1(test1=f"instance-{x + 1:03d}") for x in range(12)]
+        )
+        sqla_db_ext.db.session.commit()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            M1,
+            param,
+            column_searchable_list=["test1"],
+            count_cache=MemoryCache(timeout=60),
+        )
+        admin.add_view(view)
+
+        count, _ = view.get_list(0, None, False, None, None)
+        assert count == 12
+        count, _ = view.get_list(0, None, False, "instance-01", None)
+        assert count == 3
+
+        # Changes made outside of the view are not seen until invalidated
+        sqla_db_ext.db.session.add(M1(test1="instance-013"))
+        sqla_db_ext.db.session.commit()
+
+        count, _ = view.get_list(1, None, False, None, None)
+        assert count == 12
+        count, _ = view.get_list(0, None, False, "instance-01", None)
+        assert count == 3
+
+        client = app.test_client()
+
+        rv = client.post("/admin/model1/new/", data=dict(test1="instance-014"))
+        assert rv.status_code == 302
+
+        count, _ = view.get_list(0, None, False, None, None)
+        assert count == 14
+        count, _ = view.get_list(0, None, False, "instance-01", None)
+        assert count == 5
+
+        rv = client.post(
+            "/admin/model1/action/",
+            data=dict(action="delete", rowid=["1", "2"]),
+        )
+        assert rv.status_code == 302
+
+        count, _ = view.get_list(0, None, False, None, None)
+        assert count == 12
+
+
+def test_window_count(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        M1, M2 = create_models(sqla_db_ext)
+
+        m1 = M1(test1="parent")
+        sqla_db_ext.db.session.add(m1)
+        sqla_db_ext.db.session.add_all(
+            [
+                M2(string_field=f"instance-{x + 1:03d}", int_field=x, model1=m1)
+                for x in range(12)
+            ]
+        )
+        sqla_db_ext.db.session.commit()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            M2,
+            param,
+            column_list=["string_field", "int_field", "model1"],
+            column_searchable_list=["string_field", "model1.test1"],
+            column_filters=["int_field"],
+            window_count=True,
+        )
+        admin.add_view(view)
+
+        statements: list[str] = []
+
+        def before_cursor_execute(*args: t.Any) -> None:
+            if args[2].startswith("SELECT"):
+                statements.append(args[2])
+
+        event.listen(
+            sqla_db_ext.db.engine, "before_cursor_execute", before_cursor_execute
+        )
+
+        count, data = view.get_list(0, None, False, None, None, page_size=5)
+        assert count == 12
+        assert len(data) == 5
+        assert len(statements) == 1
+        assert "OVER ()" in statements[0]
+
+        statements.clear()
+        count, data = view.get_list(
+            1, None, False, "instance-00", [(0, "equals", "7")], page_size=5
+        )
+        assert count == 1
+        assert len(data) == 0
+        assert len(statements) == 2
+
+        statements.clear()
+        count, data = view.get_list(0, "int_field", True, "parent", None, page_size=5)
+        assert count == 12
+        assert [m.int_field for m in data] == [11, 10, 9, 8, 7]  # type: ignore[union-attr]
+        assert len(statements) == 1
+
+        # Capped counts need the separate count query
+        view.count_mode = "capped"
+        statements.clear()
+        count, data = view.get_list(0, None, False, None, None, page_size=5)
+        assert count == 12
+        assert len(statements) == 2
+
+        event.remove(
+            sqla_db_ext.db.engine, "before_cursor_execute", before_cursor_execute
+        )
+
+        client = app.test_client()
+        rv = client.get("/admin/model2/?search=instance")
+        assert rv.status_code == 200
+        assert "List (12)" in rv.text
+
+
+def test_column_load_only(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        M1, M2 = create_models(sqla_db_ext)
+        fill_db(sqla_db_ext, M1, M2)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view1 = CustomModelView(
+            M1,
+            param,
+            column_list=["test1"],
+            column_export_list=["test1", "test2"],
+            column_searchable_list=["test1"],
+            column_load_extra_list=["bool_field"],
+            column_load_only=True,
+        )
+        admin.add_view(view1)
+
+        view2 = CustomModelView(
+            M2,
+            param,
+            column_list=["string_field", "model1"],
+            column_select_related_list=[M2.model1],  # type: ignore[attr-defined]
+            column_load_only=True,
+        )
+        admin.add_view(view2)
+
+        assert [c.key for c in view1._load_only_columns] == [  # type: ignore[union-attr]
+            "id",
+            "test1",
+            "test2",
+            "bool_field",
+        ]
+        assert [c.key for c in view2._load_only_columns] == [  # type: ignore[union-attr]
+            "id",
+            "string_field",
+            "model1_id",
+        ]
+
+        _, query = view1.get_list(0, None, False, None, None, execute=False)
+        statement = str(query)
+        assert "model1.test2" in statement
+        assert "model1.test3" not in statement
+
+        _, data = view1.get_list(0, None, False, "test1_val_1", None)
+        assert [m.test1 for m in data] == ["test1_val_1"]  # type: ignore[union-attr]
+        # Deferred columns are loaded on access
+        assert data[0].test3 is None  # type: ignore[union-attr]
+
+        client = app.test_client()
+
+        rv = client.get("/admin/model1/")
+        assert rv.status_code == 200
+        assert "test1_val_1" in rv.text
+
+        rv = client.get("/admin/model2/")
+        assert rv.status_code == 200
+        assert "test2_val_1" in rv.text
+
+
+def test_eager_load_plan(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+
+        class Company(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "company"
+            id = Column(Integer, primary_key=True)
+            name = Column(String(20))
+
+            def __str__(self) -> str:
+                return str(self.name)
+
+        class Author(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "author"
+            id = Column(Integer, primary_key=True)
+            name = Column(String(20))
+
+            company_id = Column(Integer, ForeignKey(Company.id))
+            company = relationship(Company)
+
+            def __str__(self) -> str:
+                return str(self.name)
+
+        class Post(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "post"
+            id = Column(Integer, primary_key=True)
+            title = Column(String(20))
+
+            author_id = Column(Integer, ForeignKey(Author.id))
+            author = relationship(Author, backref="posts")
+
+            def __str__(self) -> str:
+                return str(self.title)
+
+        sqla_db_ext.create_all()
 
-        view3 = CustomModelView(
-            M1, param, endpoint="view3", page_size=20, can_set_page_size=True
-        )
-        admin.add_view(view3)
+        for x in range(10):
+            company = Company(name=f"company-{x}")
+            author = Author(name=f"author-{x}", company=company)
+            sqla_db_ext.db.session.add_all(
+                [Post(title=f"post-{x}-{y}", author=author) for y in range(3)]
+            )
+        sqla_db_ext.db.session.commit()
 
-        view4 = CustomModelView(
-            M1,
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        post_view = CustomModelView(
+            Post,
             param,
-            endpoint="view4",
-            page_size=5,
-            page_size_options=(5, 10, 15),
-            can_set_page_size=True,
+            column_list=["title", "author", "author.company.name"],
         )
-        admin.add_view(view4)
-
-        client = app.test_client()
-
-        rv = client.get("/admin/view1/")
-        assert "instance-020" in rv.text
-        assert "instance-021" not in rv.text
+        admin.add_view(post_view)
 
-        # `can_set_page_size=False`, so only the default of 20 is available.
-        rv = client.get("/admin/view1/?page_size=50")
-        assert "instance-020" in rv.text
-        assert "instance-021" not in rv.text
+        author_view = CustomModelView(
+            Author,
+            param,
+            column_list=["name", "company", "posts"],
+            column_details_list=["name", "posts", "company.name"],
+            can_view_details=True,
+        )
+        admin.add_view(author_view)
 
-        # Check view2, which has `page_size=5` to change the default page size
-        rv = client.get("/admin/view2/")
-        assert "instance-005" in rv.text
-        assert "instance-006" not in rv.text
+        assert post_view.get_eager_load_plan(c for c, _ in post_view._list_columns) == {
+            "author": "joinedload",
+            "author.company": "joinedload",
+        }
+        assert author_view.get_eager_load_plan(
+            c for c, _ in author_view._list_columns
+        ) == {
+            "company": "joinedload",
+            "posts": "selectinload",
+        }
 
-        # Check view3, which has `can_set_page_size=True`
-        rv = client.get("/admin/view3/")
-        assert "instance-020" in rv.text
-        assert "instance-021" not in rv.text
+        statements: list[str] = []
 
-        rv = client.get("/admin/view3/?page_size=50")
-        assert "instance-050" in rv.text
-        assert "instance-051" not in rv.text
+        def before_cursor_execute(*args: t.Any) -> None:
+            if args[2].startswith("SELECT"):
+                statements.append(args[2])
 
-        rv = client.get("/admin/view3/?page_size=100")
-        assert "instance-100" in rv.text
-        assert "instance-101" not in rv.text
+        event.listen(
+            sqla_db_ext.db.engine, "before_cursor_execute", before_cursor_execute
+        )
 
-        # Invalid page sizes are reset to the default
-        rv = client.get("/admin/view3/?page_size=1")
-        assert "instance-020" in rv.text
-        assert "instance-021" not in rv.text
+        client = app.test_client()
 
-        # Check view4, which has custom `page_size_options`
-        rv = client.get("/admin/view4/")
-        assert "instance-005" in rv.text
-        assert "instance-006" not in rv.text
+        rv = client.get("/admin/post/")
+        assert rv.status_code == 200
+        assert "company-6" in rv.text
+        # Count and rows with joined author and company
+        assert len(statements) == 2
 
-        # Invalid page sizes are reset to the default
-        rv = client.get("/admin/view4/?page_size=1")
-        assert "instance-005" in rv.text
-        assert "instance-006" not in rv.text
+        statements.clear()
+        rv = client.get("/admin/author/")
+        assert rv.status_code == 200
+        assert "post-9-2" in rv.text
+        # Count, rows with joined company and posts
+        assert len(statements) == 3
 
-        rv = client.get("/admin/view4/?page_size=10")
-        assert "instance-010" in rv.text
-        assert "instance-011" not in rv.text
+        sqla_db_ext.db.session.expunge_all()
+        statements.clear()
+        rv = client.get("/admin/author/details/?id=1")
+        assert rv.status_code == 200
+        assert "post-0-2" in rv.text
+        assert "company-0" in rv.text
+        assert len(statements) == 2
 
-        rv = client.get("/admin/view4/?page_size=15")
-        assert "instance-015" in rv.text
-        assert "instance-016" not in rv.text
+        event.remove(
+            sqla_db_ext.db.engine, "before_cursor_execute", before_cursor_execute
+        )
 
 
-def test_unlimited_page_size(
+def test_collection_summaries(
     app: Flask,
     sqla_db_ext: T_ANY_SQLA_PROVIDER,
     admin: Admin,
     session_or_db: T_LITERAL_SESSION_OR_DB,
 ) -> None:
     with app.app_context():
-        M1, _ = create_models(sqla_db_ext)
-
-        sqla_db_ext.db.session.add_all(
-            [
-                M1(test1="1"),
-                M1(test1="2"),
-                M1(test1="3"),
-                M1(test1="4"),
-                M1(test1="5"),
-                M1(test1="6"),
-                M1(test1="7"),
-                M1(test1="8"),
-                M1(test1="9"),
-                M1(test1="10"),
-                M1(test1="11"),
-                M1(test1="12"),
-                M1(test1="13"),
-                M1(test1="14"),
-                M1(test1="15"),
-                M1(test1="16"),
-                M1(test1="17"),
-                M1(test1="18"),
-                M1(test1="19"),
-                M1(test1="20"),
-                M1(test1="21"),
-            ]
+        customer_tags = Table(
+            "customer_tags",
+            sqla_db_ext.Base.metadata,
+            Column("customer_id", Integer, ForeignKey("customer.id")),
+            Column("tag_id", Integer, ForeignKey("tag.id")),
         )
 
-        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
-        view = CustomModelView(M1, param)
+        class Tag(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "tag"
+            id = Column(Integer, primary_key=True)
+            name = Column(String(20))
 
-        # test 0 as page_size
-        _, data = view.get_list(0, None, False, None, None, execute=True, page_size=0)
-        assert len(data) == 21
+            def __str__(self) -> str:
+                return str(self.name)
 
-        # test False as page_size
-        _, data = view.get_list(
-            0, None, False, None, None, execute=True, page_size=False
+        class Customer(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "customer"
+            id = Column(Integer, primary_key=True)
+            name = Column(String(20))
+
+            tags = relationship(Tag, secondary=customer_tags)
+
+        class Order(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "order"
+            id = Column(Integer, primary_key=True)
+            code = Column(String(20))
+
+            customer_id = Column(Integer, ForeignKey(Customer.id))
+            customer = relationship(Customer, backref="orders")
+
+            def __str__(self) -> str:
+                return str(self.code)
+
+        sqla_db_ext.create_all()
+
+        tags = [Tag(name=f"tag-{x}") for x in range(3)]
+        for x in range(5):
+            customer = Customer(name=f"customer-{x}", tags=tags[:x])
+            sqla_db_ext.db.session.add(customer)
+            sqla_db_ext.db.session.add_all(
+                [Order(code=f"order-{x}-{y}", customer=customer) for y in range(x)]
+            )
+        sqla_db_ext.db.session.commit()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Customer,
+            param,
+            column_list=["name", "orders", "tags"],
+            column_collection_summaries={"orders": 2, "tags": 0},
         )
-        assert len(data) == 21
+        admin.add_view(view)
+
+        assert "orders" in view._sortable_columns
+        assert "orders" not in [str(j) for j in view._auto_joins]
+
+        _, data = view.get_list(0, "orders", True, None, None)
+        assert [m.name for m in data] == [  # type: ignore[union-attr]
+            "customer-4",
+            "customer-3",
+            "customer-2",
+            "customer-1",
+            "customer-0",
+        ]
+        values = [str(view._get_field_value(m, "orders")) for m in data]
+        assert values == [
+            "4: order-4-0, order-4-1, …",
+            "3: order-3-0, order-3-1, …",
+            "2: order-2-0, order-2-1",
+            "1: order-1-0",
+            "0",
+        ]
+        assert [str(view._get_field_value(m, "tags")) for m in data] == [
+            "3",
+            "3",
+            "2",
+            "1",
+            "0",
+        ]
+        # Collections were not loaded
+        assert "orders" not in data[0].__dict__
+
+        summaries = view.get_collection_summaries("orders", data, 1)
+        view._supports_window_functions = lambda: False  # type: ignore[method-assign]
+        assert {
+            k: (v.count, v.items)
+            for k, v in view.get_collection_summaries("orders", data, 1).items()
+        } == {k: (v.count, v.items) for k, v in summaries.items()}
+
+        client = app.test_client()
+
+        rv = client.get("/admin/customer/")
+        assert rv.status_code == 200
+        assert "4: order-4-0, order-4-1, …" in rv.text
+
+        with pytest.raises(Exception, match="is not a collection relation"):
+            CustomModelView(Order, param, column_collection_summaries={"customer": 2})
 
 
 def test_advanced_joins(
@@ -3593,6 +5188,257 @@ def test_export_csv(
         assert len(data.splitlines()) > 21
 
 
+def test_export_csv_streaming(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        sqla_db_ext.db.session.add_all(
+            [Model1(test1=f"test1_val_{x:02d}") for x in range(25)]
+        )
+        sqla_db_ext.db.session.commit()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model1,
+            param,
+            can_export=True,
+            column_list=["test1"],
+            column_default_sort="test1",
+            column_searchable_list=["test1"],
+            export_batch_size=10,
+        )
+        admin.add_view(view)
+
+        statements = []
+
+        def count_statement(*args: t.Any) -> None:
+            statements.append(args[2])
+
+        engine = sqla_db_ext.db.engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            models = list(
+                view.get_list_iter("test1", True, "val_1", None, batch_size=10)
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        # the rows are not counted
+        assert not [s for s in statements if "count(" in s.lower()]
+        assert [m.test1 for m in models] == [  # type: ignore[union-attr]
+            f"test1_val_{x:02d}" for x in range(19, 9, -1)
+        ]
+        assert not any(m in sqla_db_ext.db.session for m in models)
+
+        models = list(view.get_list_iter(None, False, None, None, page_size=3))
+        assert len(models) == 3
+
+        # joined eager loading of a collection can't use yield_per
+        view._auto_joins = [Model1.model2]  # type: ignore[attr-defined]
+        models = list(
+            view.get_list_iter(None, False, None, None, page_size=0, batch_size=10)
+        )
+        assert len(models) == 25
+
+        client = app.test_client()
+
+        rv = client.get("/admin/model1/export/csv/")
+        assert rv.status_code == 200
+        assert rv.data.decode("utf-8").splitlines() == ["Test1"] + [
+            f"test1_val_{x:02d}" for x in range(25)
+        ]
+
+
+def test_export_arrow_types(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    pyarrow = pytest.importorskip("pyarrow")
+
+    with app.app_context():
+
+        class Amount(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "amount"
+            id = Column(Integer, primary_key=True)
+            name = Column(String(20))
+            active = Column(Boolean)
+            ratio = Column(Float)
+            price = Column(Numeric(10, 2))
+            balance = Column(Numeric)
+            created = Column(Date)
+            status = Column(Integer)
+
+        sqla_db_ext.create_all()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Amount,
+            param,
+            column_formatters_export={"name": lambda v, c, m, p: len(m.name)},
+            column_choices={"status": [(1, "Active"), (2, "Closed")]},
+            column_type_formatters_export={
+                float: lambda view, value, name: f"{value:.1f}"
+            },
+            can_export=True,
+            column_export_list=["id", "status"],
+            export_types=["arrow"],
+        )
+        admin.add_view(view)
+
+        assert view.get_export_arrow_type("id") == pyarrow.int64()
+        assert view.get_export_arrow_type("active") == pyarrow.bool_()
+        assert view.get_export_arrow_type("price") == pyarrow.decimal128(38, 2)
+
+        # decimals of any scale are kept as text
+        assert view.get_export_arrow_type("balance") == pyarrow.string()
+
+        # inferred from the values
+        assert view.get_export_arrow_type("name") is None
+        assert view.get_export_arrow_type("created") is None
+
+        # exported with the labels of the choices or by a type formatter
+        assert view.get_export_arrow_type("status") is None
+        assert view.get_export_arrow_type("ratio") is None
+
+        sqla_db_ext.db.session.add_all([Amount(id=1, status=1), Amount(id=2, status=2)])
+        sqla_db_ext.db.session.commit()
+
+        client = app.test_client()
+        rv = client.get("/admin/amount/export/arrow/")
+        assert rv.status_code == 200
+        table = pyarrow.ipc.open_file(io.BytesIO(rv.data)).read_all()
+        rv.close()
+
+        assert table.to_pydict() == {"Id": [1, 2], "Status": ["Active", "Closed"]}
+
+
+def test_api_list_view(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        sqla_db_ext.db.session.add_all(
+            [
+                Model1(
+                    test1=f"<b>{x}</b>",
+                    bool_field=x % 2 == 0,
+                    date_field=date(2024, 1, x + 1),
+                )
+                for x in range(5)
+            ]
+        )
+        sqla_db_ext.db.session.commit()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model1,
+            param,
+            column_list=["test1", "bool_field", "date_field"],
+            column_default_sort="id",
+            column_searchable_list=["test1"],
+            page_size=2,
+        )
+        admin.add_view(view)
+
+        keyset_view = CustomModelView(
+            Model1,
+            param,
+            endpoint="keyset",
+            column_list=["test1"],
+            column_default_sort="id",
+            page_size=2,
+            keyset_pagination=True,
+            list_infinite_scroll=True,
+        )
+        admin.add_view(keyset_view)
+
+        client = app.test_client()
+
+        rv = client.get("/admin/model1/api/list/?page_size=2")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/json"
+        data = rv.json
+        assert data is not None
+        assert data["columns"] == [
+            {"name": "test1", "label": "Test1"},
+            {"name": "bool_field", "label": "Bool Field"},
+            {"name": "date_field", "label": "Date Field"},
+        ]
+        assert [row["pk"] for row in data["rows"]] == ["1", "2"]
+        assert data["rows"][0]["values"]["test1"] == "&lt;b&gt;0&lt;/b&gt;"
+        assert "fa-check-circle" in data["rows"][0]["values"]["bool_field"]
+        assert "actions" not in data["rows"][0]
+        assert data["count"] == 5
+        assert data["count_label"] == "5"
+        assert data["page"] == 0
+        assert data["cursor"] is None
+        assert data["next_url"] == "/admin/model1/api/list/?page=1&page_size=2"
+
+        rv = client.get("/admin/model1/api/list/?page=2&page_size=2&values=raw")
+        data = rv.json
+        assert data is not None
+        assert data["rows"] == [
+            {
+                "pk": "5",
+                "values": {
+                    "test1": "<b>4</b>",
+                    "bool_field": True,
+                    "date_field": "2024-01-05",
+                },
+            }
+        ]
+        assert data["next_url"] is None
+
+        rv = client.get("/admin/model1/api/list/?search=nothing&page_size=2&values=raw")
+        data = rv.json
+        assert data is not None
+        assert data["rows"] == []
+        assert data["next_url"] is None
+
+        # Infinite scroll starts from the list view
+        rv = client.get("/admin/keyset/?page_size=2")
+        assert rv.status_code == 200
+        assert "list-scroll-sentinel" in rv.text
+        assert "bs4_list_scroll.js" in rv.text
+        scroll_url = rv.text.split('data-scroll-url="')[1].split('"')[0]
+        scroll_url = scroll_url.replace("&amp;", "&")
+        assert "row_actions=1" in scroll_url
+        assert "cursor=" in scroll_url
+
+        rv = client.get(scroll_url)
+        data = rv.json
+        assert data is not None
+        assert [row["values"]["test1"] for row in data["rows"]] == [
+            "&lt;b&gt;2&lt;/b&gt;",
+            "&lt;b&gt;3&lt;/b&gt;",
+        ]
+        assert "/admin/keyset/edit/?id=3" in data["rows"][0]["actions"]
+        assert "/admin/keyset/api/list/" not in data["rows"][0]["actions"]
+        assert data["cursor"]
+        assert "row_actions=1" in data["next_url"]
+
+        rv = client.get(data["next_url"])
+        data = rv.json
+        assert data is not None
+        assert [row["pk"] for row in data["rows"]] == ["5"]
+        assert data["next_url"] is None
+
+        rv = client.get("/admin/model1/?page_size=2")
+        assert "list-scroll-sentinel" not in rv.text
+
+
 STRING_CONSTANT = "Anyway, here's Wonderwall"
 
 
@@ -4,6 +4,7 @@ from typing import Optional
 from flask import Flask
 from sqlalchemy import Column
 from sqlalchemy import DateTime
+from sqlalchemy import event
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import Integer
@@ -18,6 +19,7 @@ from flask_admin import form
 from flask_admin.contrib.sqla import ModelView
 from flask_admin.contrib.sqla.fields import InlineModelFormList
 from flask_admin.contrib.sqla.validators import ItemsRequired
+from flask_admin.model.form import InlineFormAdmin
 from flask_admin.tests.conftest import skip_or_return_session_or_db
 from flask_admin.tests.conftest import T_ANY_SQLA_PROVIDER
 from flask_admin.tests.conftest import T_LITERAL_SESSION_OR_DB
@@ -265,6 +267,41 @@ def test_inline_form_ajax_fk(
 
         assert "userinfo-tag" in view._form_ajax_refs
 
+        tags = [Tag(name=f"tag{i}") for i in range(3)]
+        sqla_db_ext.db.session.add_all(tags)
+        sqla_db_ext.db.session.commit()
+
+        data = {"name": "user"}
+        for i, tag in enumerate(tags):
+            data[f"info-{i}-key"] = f"key{i}"
+            data[f"info-{i}-tag"] = str(tag.id)
+
+        statements = []
+
+        def count_statement(*args: t.Any) -> None:
+            statements.append(args[2])
+
+        engine = sqla_db_ext.db.engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            client = app.test_client()
+            rv = client.post("/admin/user/new/", data=data)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert rv.status_code == 302
+
+        # the tags of all inline rows are loaded with one query
+        assert len([s for s in statements if "FROM tags" in s]) == 1
+
+        user = sqla_db_ext.db.session.query(User).filter_by(name="user").one()
+        assert sorted(info.tag.name for info in user.info) == [
+            "tag0",
+            "tag1",
+            "tag2",
+        ]
+
 
 def test_inline_form_self(
     app: Flask,
@@ -358,3 +395,138 @@ def test_inline_form_base_class(
         assert rv.status_code == 200
         assert sqla_db_ext.db.session.query(func.count(User.id)).scalar() == 0
         assert b"success!" in rv.data, rv.data
+
+
+def test_inline_form_bulk_populate(
+    app: Flask,
+    sqla_db_ext: T_ANY_SQLA_PROVIDER,
+    admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+        # Set up models and database
+        class User(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "users"
+            id = Column(Integer, primary_key=True)
+            name: str | None = Column(String, unique=True)  # type: ignore[assignment]
+
+            def __init__(self, name: Optional[str] = None) -> None:
+                self.name = name
+
+        class Tag(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "tags"
+
+            id = Column(Integer, primary_key=True)
+            name = Column(String, unique=True)
+
+            def __str__(self) -> str:
+                return str(self.name)
+
+        class UserInfo(sqla_db_ext.Base):  # type: ignore[misc, name-defined]
+            __tablename__ = "user_info"
+            id = Column(Integer, primary_key=True)
+            key = Column(String, nullable=False)
+            val = Column(String)
+
+            user_id = Column(Integer, ForeignKey(User.id))
+            user = relationship(
+                User,
+                backref=backref(
+                    "info", cascade="all, delete-orphan", single_parent=True
+                ),
+            )
+
+            tag_id = Column(Integer, ForeignKey(Tag.id))
+            tag = relationship(Tag, backref="user_info")
+
+        sqla_db_ext.create_all()
+
+        changes = []
+
+        class UserInfoInline(InlineFormAdmin):
+            form_columns = ("id", "key", "val", "tag")
+
+            def on_model_change(
+                self, form: t.Any, model: t.Any, is_created: bool
+            ) -> None:
+                changes.append((model.key, is_created))
+
+        # Set up Admin
+        class UserModelView(ModelView):
+            inline_models = (UserInfoInline(UserInfo),)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = UserModelView(User, param)
+        admin.add_view(view)
+
+        session = sqla_db_ext.db.session
+        user: t.Any = User("user")
+        tags = [Tag(name=f"tag{i}") for i in range(5)]
+        user.info = [
+            UserInfo(key=f"key{i}", val=f"val{i}", tag=tag)
+            for i, tag in enumerate(tags)
+        ]
+        session.add(user)
+        session.commit()
+
+        data = {"name": "user"}
+        for i, info in enumerate(user.info):
+            data[f"info-{i}-id"] = str(info.id)
+            data[f"info-{i}-key"] = info.key
+            data[f"info-{i}-val"] = info.val
+            data[f"info-{i}-tag"] = str(info.tag_id)
+
+        data["info-1-val"] = "changed"
+        data["del-info-2"] = "on"
+        data["info-5-key"] = "key5"
+        data["info-5-tag"] = str(tags[0].id)
+
+        user_id = user.id
+        session.expunge_all()
+
+        statements = []
+
+        def count_statement(*args: t.Any) -> None:
+            statements.append(args[2])
+
+        engine = sqla_db_ext.db.engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+
+        try:
+            client = app.test_client()
+            rv = client.post(f"/admin/user/edit/?id={user_id}", data=data)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert rv.status_code == 302
+
+        # the tags of the inline rows are not lazy loaded one by one
+        assert len([s for s in statements if "FROM tags" in s]) == 2
+
+        # only the changed rows are written
+        writes = [
+            s.split()[0]
+            for s in statements
+            if s.startswith(
+                ("INSERT INTO user_info", "UPDATE user_info", "DELETE FROM user_info")
+            )
+        ]
+        assert sorted(writes) == ["DELETE", "INSERT", "UPDATE"]
+
+        # every row that is kept goes through on_model_change
+        assert changes == [
+            ("key0", False),
+            ("key1", False),
+            ("key3", False),
+            ("key4", False),
+            ("key5", True),
+        ]
+
+        user = session.get(User, user_id)
+        assert sorted((info.key, info.val) for info in user.info) == [
+            ("key0", "val0"),
+            ("key1", "changed"),
+            ("key3", "val3"),
+            ("key4", "val4"),
+            ("key5", None),
+        ]
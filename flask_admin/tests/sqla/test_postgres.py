@@ -232,3 +232,74 @@ def test_boolean_filters(
         assert "true_val_1" in data
         assert "false_val_1" not in data
         assert "false_val_2" not in data
+
+
+def test_estimated_count(
+    app: Flask,
+    sqla_postgres_db_ext: T_ANY_SQLA_PROVIDER,
+    postgres_admin: Admin,
+    session_or_db: T_LITERAL_SESSION_OR_DB,
+) -> None:
+    with app.app_context():
+
+        class EstimatedModel(sqla_postgres_db_ext.Base):  # type: ignore[name-defined, misc]
+            __tablename__ = "estimated_model"
+            id = Column(Integer, primary_key=True, autoincrement=True)
+            name = Column(String)
+
+        sqla_postgres_db_ext.create_all()
+
+        sqla_postgres_db_ext.db.session.execute(text("DELETE FROM estimated_model"))
+        sqla_postgres_db_ext.db.session.add_all(
+            [EstimatedModel(name=f"name-{x}") for x in range(100)]
+        )
+        sqla_postgres_db_ext.db.session.commit()
+        sqla_postgres_db_ext.db.session.execute(text("ANALYZE estimated_model"))
+        sqla_postgres_db_ext.db.session.commit()
+
+        param = skip_or_return_session_or_db(sqla_postgres_db_ext, session_or_db)
+        view = CustomModelView(
+            EstimatedModel, param, count_mode="estimated", column_filters=["name"]
+        )
+        postgres_admin.add_view(view)
+
+        count, data = view.get_list(0, None, False, None, None)
+        assert count == 100
+        assert view.is_count_approximate(count)
+        assert view.get_count_label(count) == "~100"
+        assert len(data) == 20
+
+        # filters with IN clauses
+        in_list = [
+            (idx, flt.name)
+            for idx, flt in enumerate(view._filters)  # type: ignore[arg-type]
+            if flt.operation() == "in list"
+        ]
+        assert in_list
+        idx, name = in_list[0]
+        count, data = view.get_list(
+            0, None, False, None, [(idx, name, "name-1,name-2,name-3")]
+        )
+        assert count is not None
+        assert view.is_count_approximate(count)
+        assert 1 <= count <= 100
+        assert len(data) == 3
+
+        # filters binding a single value
+        equals = [
+            (idx, flt.name)
+            for idx, flt in enumerate(view._filters)  # type: ignore[arg-type]
+            if flt.operation() == "equals"
+        ]
+        idx, name = equals[0]
+        count, data = view.get_list(0, None, False, None, [(idx, name, "name-1")])
+        assert count is not None
+        assert view.is_count_approximate(count)
+        assert 1 <= count <= 100
+        assert len(data) == 1
+
+        client = app.test_client()
+
+        rv = client.get("/admin/estimatedmodel/")
+        assert rv.status_code == 200
+        assert "List (~100)" in rv.text
@@ -1,4 +1,7 @@
+import gzip
+import io
 import typing as t
+from decimal import Decimal
 
 import pytest
 import wtforms
@@ -15,6 +18,7 @@ from flask_admin._types import T_COLUMN
 from flask_admin._types import T_FILTER
 from flask_admin._types import T_MODEL_VIEW
 from flask_admin.model import base
+from flask_admin.model import cache
 from flask_admin.model import filters
 from flask_admin.model.filters import BaseFilter
 from flask_admin.model.template import macro
@@ -766,6 +770,44 @@ def test_export_csv(app: Flask, admin: Admin) -> None:
     assert rv.status_code == 500
 
 
+def test_export_csv_chunks(app: Flask, admin: Admin) -> None:
+    view_data = {i: Model(i, f"col1_{i}", f"col2_{i}") for i in range(1, 6)}
+    expected = "Col1,Col2\r\n" + "".join(f"col1_{i},col2_{i}\r\n" for i in range(1, 6))
+
+    view = MockModelView(
+        Model,
+        view_data,
+        can_export=True,
+        column_list=["col1", "col2"],
+        export_csv_chunk_size=2,
+        export_gzip=True,
+    )
+    admin.add_view(view)
+
+    client = app.test_client()
+
+    with app.test_request_context("/admin/model/export/csv/"):
+        rv = view.export("csv")
+        assert list(rv.response) == [
+            "Col1,Col2\r\ncol1_1,col2_1\r\ncol1_2,col2_2\r\n",
+            "col1_3,col2_3\r\ncol1_4,col2_4\r\n",
+            "col1_5,col2_5\r\n",
+        ]
+
+    rv = client.get("/admin/model/export/csv/")
+    assert rv.status_code == 200
+    assert "Content-Encoding" not in rv.headers
+    assert rv.headers["Vary"] == "Accept-Encoding"
+    assert rv.data.decode("utf-8") == expected
+
+    rv = client.get(
+        "/admin/model/export/csv/", headers={"Accept-Encoding": "gzip, deflate"}
+    )
+    assert rv.status_code == 200
+    assert rv.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(rv.data).decode("utf-8") == expected
+
+
 def test_export_tablib(app: Flask, admin: Admin) -> None:
     client = app.test_client()
 
@@ -798,6 +840,192 @@ def test_export_tablib(app: Flask, admin: Admin) -> None:
     )
 
 
+def test_export_xlsx(app: Flask, admin: Admin) -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+
+    client = app.test_client()
+
+    view_data = {
+        1: Model(1, "col1_1", 1),
+        2: Model(2, "col1_2", 2),
+        3: Model(3, None, 3),
+    }
+
+    view = MockModelView(
+        Model,
+        view_data,
+        can_export=True,
+        column_list=["col1", "col2"],
+        column_formatters_export=dict(col2=lambda v, c, m, p: m.col2 * 3),
+        export_types=["xlsx"],
+    )
+    admin.add_view(view)
+
+    rv = client.get("/admin/model/export/xlsx/")
+    assert rv.status_code == 200
+    assert rv.mimetype == (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    )
+    assert rv.headers["Content-Disposition"].endswith(".xlsx")
+
+    data = rv.data
+    rv.close()
+
+    wb = openpyxl.load_workbook(io.BytesIO(data), read_only=True)
+    assert [list(row) for row in wb.active.values] == [
+        ["Col1", "Col2"],
+        ["col1_1", "3"],
+        ["col1_2", "6"],
+        [None, "9"],
+    ]
+
+
+@pytest.mark.parametrize("export_type", ["parquet", "arrow"])
+def test_export_arrow(
+    app: Flask, admin: Admin, export_type: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pyarrow = pytest.importorskip("pyarrow")
+    pytest.importorskip("pyarrow.parquet")
+
+    client = app.test_client()
+
+    view_data = {
+        1: Model(1, "col1_1", 1, Decimal("1.5")),  # type: ignore[arg-type]
+        2: Model(2, None, 2, Decimal("2.25")),  # type: ignore[arg-type]
+        3: Model(3, "col1_3", 2**60, Decimal("3.75")),  # type: ignore[arg-type]
+    }
+    for model in view_data.values():
+        model.age = [model.id]  # type: ignore[assignment]
+
+    def export(endpoint: str) -> t.Any:
+        rv = client.get(f"/admin/{endpoint}/export/{export_type}/")
+        assert rv.status_code == 200
+        assert rv.headers["Content-Disposition"].endswith(f".{export_type}")
+        data = rv.data
+        rv.close()
+
+        if export_type == "parquet":
+            assert rv.mimetype == "application/vnd.apache.parquet"
+            return pyarrow.parquet.read_table(io.BytesIO(data))
+
+        assert rv.mimetype == "application/vnd.apache.arrow.file"
+        return pyarrow.ipc.open_file(io.BytesIO(data)).read_all()
+
+    view = MockModelView(
+        Model,
+        view_data,
+        can_export=True,
+        column_list=["col1", "col2", "col3", "age"],
+        export_types=[export_type],
+        export_batch_size=2,
+    )
+    admin.add_view(view)
+
+    def mixed_formatter(v: t.Any, c: t.Any, m: t.Any, p: t.Any) -> t.Any:
+        return m.col2 if m.id == 2 else m.col2 * 1.5
+
+    mixed_view = MockModelView(
+        Model,
+        view_data,
+        can_export=True,
+        column_list=["col2"],
+        column_formatters_export=dict(col2=mixed_formatter),
+        export_types=[export_type],
+        export_batch_size=2,
+        endpoint="mixed",
+    )
+    admin.add_view(mixed_view)
+
+    def later_formatter(v: t.Any, c: t.Any, m: t.Any, p: t.Any) -> t.Any:
+        return m.col2 if m.id < 3 else 0.5
+
+    later_view = MockModelView(
+        Model,
+        view_data,
+        can_export=True,
+        column_list=["col2"],
+        column_formatters_export=dict(col2=later_formatter),
+        export_types=[export_type],
+        export_batch_size=2,
+        endpoint="later",
+    )
+    admin.add_view(later_view)
+
+    class TypedModelView(MockModelView):
+        def get_export_arrow_type(self, name: t.Any) -> t.Any:
+            return pyarrow.decimal128(38, 1) if name == "col3" else None
+
+    typed_view = TypedModelView(
+        Model,
+        view_data,
+        can_export=True,
+        column_list=["col3"],
+        export_types=[export_type],
+        endpoint="typed",
+    )
+    admin.add_view(typed_view)
+
+    # inferred types keep the native types of the values
+    table = export("model")
+    assert table.column_names == ["Col1", "Col2", "Col3", "Age"]
+    assert table.schema.field("Col2").type == pyarrow.int64()
+    assert table.schema.field("Col3").type == pyarrow.decimal128(38, 2)
+    assert table.to_pydict() == {
+        "Col1": ["col1_1", None, "col1_3"],
+        "Col2": [1, 2, 2**60],
+        "Col3": [Decimal("1.5"), Decimal("2.25"), Decimal("3.75")],
+        "Age": ["1", "2", "3"],
+    }
+
+    # columns with values of mixed types are widened
+    table = export("mixed")
+    assert table.schema.field("Col2").type == pyarrow.float64()
+    assert table.to_pydict() == {"Col2": [1.5, 2.0, 1.5 * 2**60]}
+
+    # values that do not fit the type of the column are never truncated
+    rv = client.get(f"/admin/later/export/{export_type}/", follow_redirects=True)
+    assert rv.status_code == 200
+    assert "Could not export column Col2 as int64" in rv.text
+
+    rv = client.get(f"/admin/typed/export/{export_type}/", follow_redirects=True)
+    assert rv.status_code == 200
+    assert "Could not export column Col3 as decimal128(38, 1)" in rv.text
+
+    monkeypatch.setattr("flask_admin.model.base.pyarrow", None)
+    rv = client.get(f"/admin/model/export/{export_type}/", follow_redirects=True)
+    assert rv.status_code == 200
+    assert "Could not import pyarrow" in rv.text
+
+
+def test_type_formatters_dispatch(app: Flask, admin: Admin) -> None:
+    class MyInt(int):
+        pass
+
+    view = MockModelView(
+        Model,
+        column_type_formatters={
+            bool: lambda view, value, name: "bool",
+            int: lambda view, value, name: "int",
+        },
+    )
+    admin.add_view(view)
+
+    model = Model(1, True, 2, MyInt(3))
+    formatters = view.column_type_formatters
+
+    with app.test_request_context():
+        values = [
+            view._get_list_value(None, model, c, {}, formatters)  # type: ignore[arg-type]
+            for c in ["col1", "col2", "col3", "age"]
+        ]
+        assert values == ["bool", "int", "int", "int"]
+        assert view._get_type_formatter(formatters, str) is None  # type: ignore[arg-type]
+
+        # A new formatters dict is not served from the cache
+        formatters = {int: lambda view, value, name: "new"}
+        assert view._get_list_value(None, model, "col2", {}, formatters) == "new"
+
+
 def test_list_row_actions(app: Flask, admin: Admin) -> None:
     client = app.test_client()
 
@@ -937,3 +1165,26 @@ def test_base_time_between_filter_validate() -> None:
 
     # Empty string must return False, not raise ValueError
     assert flt.validate("") is False
+
+
+def test_memory_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+
+    c = cache.MemoryCache(timeout=10, max_size=2)
+    c.set(("view1", "a"), 1)
+    c.set(("view1", "b"), 2)
+    assert c.get(("view1", "a")) == 1
+
+    # "b" is the least recently used key
+    c.set(("view2", "a"), 3)
+    assert c.get(("view1", "b")) is None
+    assert c.get(("view1", "a")) == 1
+    assert c.get(("view2", "a")) == 3
+
+    c.delete_prefix(("view1",))
+    assert c.get(("view1", "a")) is None
+    assert c.get(("view2", "a")) == 3
+
+    now += 11
+    assert c.get(("view2", "a")) is None
@@ -21,3 +21,16 @@ def test_encode_decode() -> None:
     # Malformed inputs should not crash
     assert tools.iterdecode(".")
     assert tools.iterdecode(",") == ("", "")
+
+
+def test_make_rec_getattr() -> None:
+    class Obj:
+        pass
+
+    obj = Obj()
+    obj.a = Obj()  # type: ignore[attr-defined]
+    obj.a.b = 1  # type: ignore[attr-defined]
+
+    assert tools.make_rec_getattr("a.b")(obj) == tools.rec_getattr(obj, "a.b") == 1
+    assert tools.make_rec_getattr("a.c")(obj) is None
+    assert tools.make_rec_getattr("c.b", default=2)(obj) == 2
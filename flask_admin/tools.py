@@ -2,6 +2,7 @@ import sys
 import traceback
 import typing as t
 from functools import reduce
+from operator import attrgetter
 from types import ModuleType
 
 # Python 3 compatibility
@@ -86,6 +87,33 @@ def rec_getattr(obj: t.Any, attr: str, default: t.Any = None) -> t.Any:
         return default
 
 
+def make_rec_getattr(attr: str, default: t.Any = None) -> t.Callable[[t.Any], t.Any]:
+    """
+    Compile a recursive getattr for an attribute name.
+
+    Same as `rec_getattr`, without splitting the name on every call.
+
+    :param attr:
+        Dot delimited attribute name
+    :param default:
+        Default value
+
+    Example::
+
+        get_c = make_rec_getattr('a.b.c')
+        get_c(obj)
+    """
+    getter = attrgetter(attr)
+
+    def get(obj: t.Any) -> t.Any:
+        try:
+            return getter(obj)
+        except AttributeError:
+            return default
+
+    return get
+
+
 def get_dict_attr(obj: t.Any, attr: str, default: t.Any = None) -> t.Any | None:
     """
     Get attribute of the object without triggering its __getattr__.